@@ -0,0 +1,91 @@
+# answer_features.py
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, FrozenSet, Tuple
+
+from keyword_matcher import AhoCorasick
+
+# Indicator groups scanned for in every answer (lowercase, substring match)
+INDICATOR_GROUPS: Dict[str, Tuple[str, ...]] = {
+    # analyze_response_quality
+    "technical_terms": ("api", "database", "system", "design", "algorithm", "architecture"),
+    "examples": ("for example", "for instance", "such as", "like"),
+    "explanation": ("because", "therefore", "thus", "so", "since"),
+    # analyze_technical_content
+    "architecture_terms": ("microservices", "monolithic", "scalable", "distributed", "load balancing"),
+    "coding_terms": ("algorithm", "data structure", "time complexity", "space complexity", "optimization"),
+    "system_design": ("database", "cache", "api", "endpoint", "protocol", "authentication"),
+    "problem_solving": ("approach", "solution", "alternative", "trade-off", "consideration"),
+    # generate_strengths_analysis
+    "real_world_examples": ("for example", "for instance", "in my project", "i implemented"),
+    # _fallback_evaluation question-specific checks
+    "debug_terms": ("log", "monitor", "analyze", "profile"),
+    "design_terms": ("scalable", "architecture", "components", "trade-off"),
+    "comparison_terms": ("vs", "versus", "while", "whereas", "on the other hand"),
+    # check_for_termination
+    "skip": ("skip",),
+}
+
+TECHNICAL_CONTENT_GROUPS = ("architecture_terms", "coding_terms", "system_design", "problem_solving")
+
+
+def _compile():
+    automaton = AhoCorasick((term for terms in INDICATOR_GROUPS.values() for term in terms), word_boundary=False)
+    term_groups: Dict[int, Tuple[str, ...]] = {}
+    for group, terms in INDICATOR_GROUPS.items():
+        for term in terms:
+            pattern_id = automaton.pattern_index[term]
+            term_groups[pattern_id] = term_groups.get(pattern_id, ()) + (group,)
+    return automaton, term_groups
+
+
+_AUTOMATON, _TERM_GROUPS = _compile()
+
+
+@dataclass(frozen=True)
+class AnswerFeatures:
+    """Everything the heuristic scorers need from an answer, computed once"""
+    word_count: int
+    sentence_count: int
+    hits: Dict[str, FrozenSet[str]]
+
+    @property
+    def avg_sentence_length(self) -> float:
+        return self.word_count / max(1, self.sentence_count)
+
+    def has(self, group: str) -> bool:
+        return bool(self.hits.get(group))
+
+    def terms(self, group: str) -> Tuple[str, ...]:
+        """Matched terms of a group in the group's declared order"""
+        found = self.hits.get(group, frozenset())
+        return tuple(term for term in INDICATOR_GROUPS[group] if term in found)
+
+    def quality_metrics(self) -> Dict:
+        """The metrics dict returned by utils.analyze_response_quality"""
+        return {
+            "word_count": self.word_count,
+            "has_technical_terms": self.has("technical_terms"),
+            "has_examples": self.has("examples"),
+            "has_explanation": self.has("explanation"),
+            "sentence_count": self.sentence_count,
+            "avg_sentence_length": self.avg_sentence_length
+        }
+
+
+@lru_cache(maxsize=1024)
+def extract_answer_features(text: str) -> AnswerFeatures:
+    """Tokenize and scan an answer once (memoized per answer text)"""
+    text = text or ""
+
+    hits: Dict[str, set] = {}
+    for _, pattern_id in _AUTOMATON.iter_matches(text):
+        term = _AUTOMATON.patterns[pattern_id]
+        for group in _TERM_GROUPS[pattern_id]:
+            hits.setdefault(group, set()).add(term)
+
+    return AnswerFeatures(
+        word_count=len(text.split()),
+        sentence_count=sum(1 for s in text.split('.') if s.strip()),
+        hits={group: frozenset(terms) for group, terms in hits.items()}
+    )
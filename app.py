@@ -1,22 +1,29 @@
 import streamlit as st
 import time
 import os
-from config import MODEL_NAME
-from skill_mapper import map_skills_to_category
+from config import MODEL_NAME, EVALUATION_DEADLINE, REPORT_ACK_TIMEOUT
+from concurrent.futures import wait
 from datetime import datetime
 import base64
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 from response_analyzer import ResponseAnalyzer
-from report_manager import ReportManager
+from report_manager import ReportManager, ReportSaveError
 from question_generator import QuestionGenerator
-from resume_parser import parse_resume
+from resume_cache import parse_resume_cached
+from resume_parser import UploadTooLarge
+from profile_pipeline import build_interview_plan
+from llm_client import get_executor
 import json
 from auth import login_user, create_user
 from models import init_db, SessionLocal
 
-# Initialize report manager
-report_manager = ReportManager()
+# Initialize report manager (once per process; reports are written by a shared background writer)
+@st.cache_resource(show_spinner=False)
+def get_report_manager() -> ReportManager:
+    return ReportManager()
+
+report_manager = get_report_manager()
 
 # Initialize the analyzer
 analyzer = ResponseAnalyzer()
@@ -358,6 +365,9 @@ def init_session_state():
         'messages': [],
         'candidate_profile': {},
         'question_evaluations': [],
+        'pending_evaluations': [],  # answers still being scored in the background
+        'score_total': 0.0,
+        'score_count': 0,
         'overall_score': 0,
         'final_score': 0,
         'introduction_analyzed': False,
@@ -438,6 +448,77 @@ def get_next_question():
     return None
 
 
+def prepare_interview(candidate_text, resume_hash=None):
+    """Build the candidate profile and question list from an introduction or resume"""
+    profile, questions = build_interview_plan(
+        candidate_text,
+        analyzer,
+        question_generator,
+        st.session_state.total_questions_to_ask,
+        generate_questions=not st.session_state.get("questions_generated", False),
+        resume_hash=resume_hash
+    )
+
+    st.session_state.candidate_profile = profile
+
+    # 🔐 GENERATE QUESTIONS ONCE (TECHNICAL FIRST, BEHAVIORAL LAST)
+    if not st.session_state.get("questions_generated", False):
+        st.session_state.questions = questions
+        st.session_state.questions_generated = True
+
+    st.session_state.introduction_analyzed = True
+    st.session_state.current_question_index = 1
+    return profile
+
+def record_evaluation(item, evaluation):
+    """Store a finished evaluation and update the running score"""
+    st.session_state.question_evaluations.append({
+        "question_number": item["question_number"],
+        "question": item["question"],
+        "answer": item["answer"],
+        "evaluation": evaluation,
+        "pre_score": item["pre_evaluation"].get("overall", 0),
+        "timestamp": item["timestamp"]
+    })
+    st.session_state.question_evaluations.sort(key=lambda e: e.get("question_number", 0))
+
+    st.session_state.score_total += evaluation.get("overall", 0)
+    st.session_state.score_count += 1
+    st.session_state.overall_score = st.session_state.score_total / st.session_state.score_count
+
+def collect_evaluations(deadline=None):
+    """
+    Move finished background evaluations into question_evaluations.
+    With a deadline, wait up to that many seconds and score anything still
+    outstanding with the heuristic evaluator.
+    """
+    pending = st.session_state.get("pending_evaluations", [])
+    if not pending:
+        return
+
+    if deadline is not None:
+        wait([item["future"] for item in pending], timeout=deadline)
+
+    still_pending = []
+    for item in pending:
+        future = item["future"]
+        if future.done():
+            try:
+                evaluation = future.result()
+            except Exception as e:
+                print(f"AI evaluation error: {e}")
+                evaluation = item["pre_evaluation"]
+        elif deadline is not None:
+            future.cancel()
+            print(f"⚠️ Evaluation for question {item['question_number']} missed the deadline, using heuristic score")
+            evaluation = item["pre_evaluation"]
+        else:
+            still_pending.append(item)
+            continue
+        record_evaluation(item, evaluation)
+
+    st.session_state.pending_evaluations = still_pending
+
 def process_response(response_text):
     """Process the candidate's response and update interview state"""
 
@@ -501,70 +582,7 @@ def process_response(response_text):
     # --------------------------------------------------
     if st.session_state.current_question_index == 0:
         with st.spinner("Analyzing your introduction..."):
-            analysis = analyzer.analyze_introduction(response_text)
-
-        detected_skills = analysis.get("skills", [])
-
-        # 🔒 LOCK SKILL USING CONFIG
-        locked_skill = map_skills_to_category(detected_skills)
-
-        st.session_state.candidate_profile = {
-            "skills": detected_skills,
-            "experience_level": analysis.get("experience", "mid"),
-            "primary_skill": locked_skill,
-            "confidence": analysis.get("confidence", "medium"),
-            "communication": analysis.get("communication", "adequate"),
-            "intro_score": analysis.get("intro_score", 5),
-        }
-
-        # --------------------------------------------------
-        # 🔐 GENERATE QUESTIONS ONCE (TECHNICAL FIRST)
-        # --------------------------------------------------
-        if not st.session_state.get("questions_generated", False):
-
-            technical_questions = question_generator.generate_initial_skill_questions(
-                skill_category=locked_skill,
-                candidate_level=st.session_state.candidate_profile["experience_level"]
-            )
-
-            # Safety fallback
-            # Ensure we have enough technical questions
-            num_technical_needed = st.session_state.total_questions_to_ask - 1
-            
-            if not technical_questions or len(technical_questions) < num_technical_needed:
-                print(f"⚠️ Generated {len(technical_questions) if technical_questions else 0} questions, need {num_technical_needed}. Adding fallbacks.")
-                fallbacks = [
-                    f"Explain a core concept in {locked_skill}.",
-                    f"Describe a real-world problem you solved using {locked_skill}.",
-                    f"What challenges do you face when working in {locked_skill}?",
-                    f"How do you handle performance optimization in {locked_skill}?",
-                    f"Describe a time you had to debug a complex {locked_skill} issue.",
-                    f"What are the key differences between versions of {locked_skill}?"
-                ]
-                
-                if not technical_questions:
-                    technical_questions = []
-                    
-                for q in fallbacks:
-                    if q not in technical_questions:
-                        technical_questions.append(q)
-                    if len(technical_questions) >= num_technical_needed:
-                        break
-
-            # Behavioral LAST
-            behavioral_question = question_generator.generate_behavioral_question_ai(
-                candidate_background=st.session_state.candidate_profile
-            )
-
-            st.session_state.questions = (
-                technical_questions[: st.session_state.total_questions_to_ask - 1]
-                + [behavioral_question]
-            )
-
-            st.session_state.questions_generated = True
-
-        st.session_state.introduction_analyzed = True
-        st.session_state.current_question_index = 1
+            prepare_interview(response_text)
 
         st.session_state.current_response = ""
         st.rerun()
@@ -584,18 +602,17 @@ def process_response(response_text):
         st.rerun()
         return
 
-    evaluation = analyzer.evaluate_answer(current_question, response_text)
-
-    st.session_state.question_evaluations.append({
+    # Score in the background so the next question renders immediately
+    st.session_state.pending_evaluations.append({
+        "question_number": current_idx + 1,
         "question": current_question,
         "answer": response_text,
-        "evaluation": evaluation,
-        "timestamp": datetime.now().strftime("%H:%M:%S")
+        "timestamp": datetime.now().strftime("%H:%M:%S"),
+        # Cheap heuristic pre-score, used if the AI evaluation fails or misses the deadline
+        "pre_evaluation": analyzer.heuristic_evaluation(current_question, response_text),
+        "future": get_executor().submit(analyzer.evaluate_answer, current_question, response_text)
     })
-
-    # Update score
-    scores = [e["evaluation"]["overall"] for e in st.session_state.question_evaluations]
-    st.session_state.overall_score = sum(scores) / len(scores)
+    collect_evaluations()
 
     # Move forward or finish
     if st.session_state.current_question_index < st.session_state.total_questions_to_ask:
@@ -617,6 +634,8 @@ def process_response(response_text):
 def show_interview_in_progress():
     """Display interview interface when interview is active"""
     
+    collect_evaluations()
+    
     st.markdown("""
     <div class='main-header' style='
         background: rgba(255, 255, 255, 0.6);
@@ -640,76 +659,22 @@ def show_interview_in_progress():
         if uploaded_file is not None:
             if st.button("Submit Application & Start Interview"):
                 with st.spinner("Processing application..."):
-                    # Parse resume
-                    resume_text = parse_resume(uploaded_file)
+                    # Parse resume (cached by file hash across reruns and re-applications)
+                    try:
+                        resume_hash, resume_text = parse_resume_cached(uploaded_file)
+                    except UploadTooLarge as e:
+                        st.error(f"Resume is too large to process. {e}. Please upload a smaller file.")
+                        return
                     
                     if not resume_text.strip():
                         st.error("Could not extract text from resume. Please try a different file.")
                         return
 
                     # Analyze resume as introduction
-                    analysis = analyzer.analyze_introduction(resume_text)
-
-                detected_skills = analysis.get("skills", [])
-
-                # 🔒 LOCK SKILL USING CONFIG
-                locked_skill = map_skills_to_category(detected_skills)
-
-                st.session_state.candidate_profile = {
-                    "skills": detected_skills,
-                    "experience_level": analysis.get("experience", "mid"),
-                    "primary_skill": locked_skill,
-                    "confidence": analysis.get("confidence", "medium"),
-                    "communication": analysis.get("communication", "adequate"),
-                    "intro_score": analysis.get("intro_score", 5),
-                }
-
-                # --------------------------------------------------
-                # 🔐 GENERATE QUESTIONS ONCE (TECHNICAL FIRST)
-                # --------------------------------------------------
-                if not st.session_state.get("questions_generated", False):
-                    technical_questions = question_generator.generate_initial_skill_questions(
-                        skill_category=locked_skill,
-                        candidate_level=st.session_state.candidate_profile["experience_level"]
-                    )
-
-                    # Safety fallback
-                    # Ensure we have enough technical questions
-                    num_technical_needed = st.session_state.total_questions_to_ask - 1
-
-                    if not technical_questions or len(technical_questions) < num_technical_needed:
-                        fallbacks = [
-                            f"Explain a core concept in {locked_skill}.",
-                            f"Describe a real-world problem you solved using {locked_skill}.",
-                            f"What challenges do you face when working in {locked_skill}?",
-                            f"How do you handle performance optimization in {locked_skill}?",
-                            f"Describe a time you had to debug a complex {locked_skill} issue.",
-                            f"What are the key differences between versions of {locked_skill}?"
-                        ]
-                        
-                        if not technical_questions:
-                            technical_questions = []
-                            
-                        for q in fallbacks:
-                            if q not in technical_questions:
-                                technical_questions.append(q)
-                            if len(technical_questions) >= num_technical_needed:
-                                break
-
-                    # Behavioral LAST
-                    behavioral_question = question_generator.generate_behavioral_question_ai(
-                        candidate_background=st.session_state.candidate_profile
-                    )
-
-                    st.session_state.questions = (
-                        technical_questions[: st.session_state.total_questions_to_ask - 1]
-                        + [behavioral_question]
-                    )
-
-                    st.session_state.questions_generated = True
-
-                st.session_state.introduction_analyzed = True
-                st.session_state.current_question_index = 1
+                    profile = prepare_interview(resume_text, resume_hash)
+
+                detected_skills = profile["skills"]
+                locked_skill = profile["primary_skill"]
                 
                 # Log system message
                 st.session_state.messages.append({
@@ -985,8 +950,9 @@ def show_termination_screen():
     st.markdown("---")
 
 def save_interview_report():
-    """Save the interview report using ReportManager"""
+    """Queue the interview report with ReportManager (written in the background)"""
     try:
+        collect_evaluations(deadline=EVALUATION_DEADLINE)
         report_path = report_manager.save_interview_report(st.session_state)
         st.session_state.report_path = report_path
     except Exception as e:
@@ -1014,8 +980,18 @@ def show_report():
 
     st.info("ℹ️ A detailed report has been generated and sent to the hiring team. You may close this window.")
     
-    if st.session_state.get('report_path'):
-        st.caption(f"Report ID: {os.path.basename(st.session_state.report_path).replace('.json', '')}")
+    report_path = st.session_state.get('report_path')
+    if report_path:
+        st.caption(f"Report ID: {os.path.basename(report_path).replace('.json', '')}")
+        # The page above is already on screen; only the save confirmation waits for the writer
+        if not st.session_state.get('report_confirmed'):
+            try:
+                if report_manager.wait_until_saved(report_path, timeout=REPORT_ACK_TIMEOUT):
+                    st.session_state.report_confirmed = True
+                else:
+                    st.warning("⚠️ Your report is still being saved. Please keep this window open for a moment.")
+            except ReportSaveError as e:
+                st.error(f"❌ Your report could not be saved ({e}). Please contact the hiring team.")
 
 
 def check_and_process_termination():
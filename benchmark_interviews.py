@@ -0,0 +1,119 @@
+# benchmark_interviews.py
+# End-to-end interview throughput / tail-latency benchmark.
+#
+#   python benchmark_interviews.py --mock --latency-ms 600 --candidates 40 --concurrency 8
+#   python benchmark_interviews.py            # against LLM_BASE_URL / the configured endpoint
+#
+# Each simulated candidate goes through the same steps as the app: profile +
+# question plan from an introduction, then one evaluation per answer.
+import argparse
+import os
+import random
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List
+
+INTROS = [
+    "I'm a backend developer with {years} years of Python and Django experience. I built REST APIs "
+    "and microservices on AWS, and I enjoy designing databases and improving performance.",
+    "I work as a frontend engineer using React and TypeScript. Over {years} years I shipped "
+    "design systems and improved page load times for a large e-commerce site.",
+    "I'm a DevOps engineer. For {years} years I've run Kubernetes clusters, written Terraform, "
+    "and maintained CI/CD pipelines with Docker on AWS and Azure.",
+    "I'm a data engineer with {years} years in SQL, Python and machine learning pipelines. "
+    "I built data analysis dashboards and trained models with PyTorch.",
+]
+
+ANSWER = ("In my last project I approached this by first measuring the problem, because guessing wastes "
+          "time. For example, we added logging and monitoring, found the slow database queries, and "
+          "introduced a cache layer. The trade-off was extra complexity, so we documented it. Ref {token}.")
+
+
+def percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(pct / 100.0 * (len(ordered) - 1)))))
+    return ordered[index]
+
+
+def summarize(name: str, values: List[float]) -> str:
+    return (f"{name:<12} n={len(values):<4} p50={percentile(values, 50) * 1000:8.1f}ms "
+            f"p95={percentile(values, 95) * 1000:8.1f}ms p99={percentile(values, 99) * 1000:8.1f}ms "
+            f"max={max(values or [0]) * 1000:8.1f}ms")
+
+
+def run_candidate(index: int, questions_per_interview: int, analyzer, question_generator) -> Dict:
+    from profile_pipeline import build_interview_plan
+
+    rng = random.Random(index)
+    intro = rng.choice(INTROS).format(years=rng.randint(1, 12))
+    timings = {"plan": 0.0, "evaluations": [], "interview": 0.0}
+
+    start = time.perf_counter()
+    _, questions = build_interview_plan(intro, analyzer, question_generator, questions_per_interview)
+    timings["plan"] = time.perf_counter() - start
+
+    for question in questions:
+        # Unique answers so the evaluation cache does not short-circuit the run
+        answer = ANSWER.format(token=uuid.uuid4().hex[:8])
+        eval_start = time.perf_counter()
+        analyzer.evaluate_answer(question, answer)
+        timings["evaluations"].append(time.perf_counter() - eval_start)
+
+    timings["interview"] = time.perf_counter() - start
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark interview throughput and tail latency")
+    parser.add_argument("--candidates", type=int, default=20)
+    parser.add_argument("--concurrency", type=int, default=5, help="interviews running at once")
+    parser.add_argument("--questions", type=int, default=5, help="questions per interview")
+    parser.add_argument("--mock", action="store_true", help="start mock_llm_server in-process")
+    parser.add_argument("--latency-ms", type=float, default=500.0, help="mock median latency")
+    parser.add_argument("--latency-sigma", type=float, default=0.5)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--throttle-rate", type=float, default=0.0)
+    parser.add_argument("--max-concurrency", type=int, default=0, help="mock server capacity (429 above it)")
+    args = parser.parse_args()
+
+    mock_settings = None
+    if args.mock:
+        from mock_llm_server import MockSettings, start_mock_server
+        mock_settings = MockSettings(args.latency_ms, args.latency_sigma, args.error_rate,
+                                     args.throttle_rate, args.max_concurrency, seed=0)
+        _, base_url = start_mock_server(settings=mock_settings)
+        # config reads LLM_BASE_URL at import time, so set it before importing the app modules
+        os.environ["LLM_BASE_URL"] = base_url
+        print(f"Mock LLM server at {base_url}")
+
+    from llm_client import llm_metrics
+    from question_generator import QuestionGenerator
+    from response_analyzer import ResponseAnalyzer
+
+    analyzer = ResponseAnalyzer()
+    question_generator = QuestionGenerator()
+
+    print(f"Running {args.candidates} interviews, {args.concurrency} at a time...")
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+        results = list(pool.map(
+            lambda i: run_candidate(i, args.questions, analyzer, question_generator),
+            range(args.candidates)
+        ))
+    elapsed = time.perf_counter() - start
+
+    print(f"\nCompleted {len(results)} interviews in {elapsed:.1f}s "
+          f"({len(results) / elapsed * 60:.1f} interviews/min)")
+    print(summarize("plan", [r["plan"] for r in results]))
+    print(summarize("evaluation", [t for r in results for t in r["evaluations"]]))
+    print(summarize("interview", [r["interview"] for r in results]))
+    print(f"\nLLM client: {llm_metrics()}")
+    if mock_settings:
+        print(f"Mock server: {mock_settings.stats}")
+
+
+if __name__ == "__main__":
+    main()
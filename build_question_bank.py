@@ -0,0 +1,39 @@
+# build_question_bank.py
+# Offline builder: pre-generates technical questions for every skill category,
+# candidate level and focus area so interviews can start without an LLM call.
+import argparse
+
+from config import SKILL_CATEGORIES, QUESTION_BANK_LEVELS, QUESTION_BANK_FOCUS_AREAS, QUESTION_BANK_TARGET
+from question_generator import QuestionGenerator
+
+
+def build_bank(categories, levels, target: int):
+    """Fill every (category, level, focus area) bucket up to `target` questions"""
+    generator = QuestionGenerator()
+    bank = generator.question_bank
+
+    total_added = 0
+    for category in categories:
+        for level in levels:
+            for focus in QUESTION_BANK_FOCUS_AREAS:
+                added = bank.fill_bucket(category, level, focus, target=target)
+                total_added += added
+                print(f"{category:>14} | {level:<6} | {focus:<32} +{added:<3} = {bank.size(category, level, focus)}")
+
+    print(f"\nQuestion bank build complete. Added {total_added} questions.")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Pre-generate the interview question bank")
+    parser.add_argument("--target", type=int, default=QUESTION_BANK_TARGET,
+                        help="questions per (category, level, focus area) bucket")
+    parser.add_argument("--categories", nargs="*", default=list(SKILL_CATEGORIES),
+                        help="skill categories to build (default: all in config)")
+    parser.add_argument("--levels", nargs="*", default=QUESTION_BANK_LEVELS)
+    args = parser.parse_args()
+
+    unknown = [c for c in args.categories if c not in SKILL_CATEGORIES]
+    if unknown:
+        parser.error(f"Unknown skill categories: {', '.join(unknown)}")
+
+    build_bank(args.categories, args.levels, args.target)
@@ -0,0 +1,172 @@
+# bulk_ingest.py
+# Bulk resume ingestion: parse a directory of PDF/DOCX/TXT resumes across CPU
+# cores, detect skills locally, profile each candidate with the LLM and store
+# the results in the ingested_resumes table.
+#
+#   python bulk_ingest.py resumes/backend-2024-06 --batch backend-2024-06 --concurrency 4
+#   python bulk_ingest.py resumes/ --no-llm          # local skill detection only
+import argparse
+import json
+import multiprocessing
+import os
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List, Optional
+
+from config import PDF_DEADLINE
+from models import Base, SessionLocal, IngestedResume, engine
+from resume_cache import get_resume_cache, PARSE_ERROR_PREFIX
+from resume_parser import parse_resume_path, UploadTooLarge
+
+RESUME_EXTENSIONS = (".pdf", ".docx", ".doc", ".txt")
+
+
+def find_resumes(directory: str, recursive: bool = False) -> List[str]:
+    """Resume files under `directory`, sorted by path"""
+    paths = []
+    for root, _, files in os.walk(directory):
+        paths.extend(os.path.join(root, f) for f in files if f.lower().endswith(RESUME_EXTENSIONS))
+        if not recursive:
+            break
+    return sorted(paths)
+
+
+def _parse_file(path: str) -> str:
+    """Worker process entry point"""
+    try:
+        return parse_resume_path(path)
+    except UploadTooLarge as e:
+        return f"{PARSE_ERROR_PREFIX} file: {e}"
+
+
+def _local_profile(text: str) -> Dict:
+    from skill_mapper import map_skills_to_category
+    from utils import extract_skills
+
+    skills = extract_skills(text)
+    return {"skills": skills, "primary_skill": map_skills_to_category(skills)}
+
+
+def _save(file_hash: str, path: str, batch: Optional[str], local: Dict,
+          profile: Optional[Dict], error: Optional[str]):
+    db = SessionLocal()
+    try:
+        source = profile or local
+        db.merge(IngestedResume(
+            file_hash=file_hash,
+            file_name=os.path.basename(path),
+            batch=batch,
+            skills=json.dumps(source.get("skills", [])),
+            primary_skill=source.get("primary_skill"),
+            experience_level=profile.get("experience_level") if profile else None,
+            intro_score=profile.get("intro_score") if profile else None,
+            profile=json.dumps(profile) if profile else None,
+            error=error
+        ))
+        db.commit()
+    finally:
+        db.close()
+
+
+def ingest(paths: List[str], batch: Optional[str], workers: int, concurrency: int, use_llm: bool) -> Counter:
+    """Parse, profile and store every resume; returns counts per primary skill"""
+    Base.metadata.create_all(bind=engine, tables=[IngestedResume.__table__])
+    cache = get_resume_cache()
+    categories = Counter()
+
+    analyzer = None
+    if use_llm:
+        from profile_pipeline import analyze_candidate, profile_version
+        from response_analyzer import ResponseAnalyzer
+        analyzer = ResponseAnalyzer()
+        version = profile_version(analyzer)
+
+    def profile_candidate(file_hash: str, text: str) -> Dict:
+        cached = cache.get_profile(file_hash, version)
+        if cached is not None:
+            return cached
+        profile, from_fallback = analyze_candidate(text, analyzer)
+        if not from_fallback:
+            cache.put_profile(file_hash, version, profile)
+        return profile
+
+    # Hash first so files parsed before (by this CLI or the app) skip parsing
+    hashes, texts = {}, {}
+    for path in paths:
+        with open(path, "rb") as f:
+            hashes[path] = cache.hash_file(f)
+        texts[path] = cache.get_text(hashes[path])
+
+    context = multiprocessing.get_context("spawn")
+    with context.Pool(processes=workers) as pool, ThreadPoolExecutor(max_workers=concurrency) as llm_pool:
+        parses = {
+            path: pool.apply_async(_parse_file, (path,))
+            for path in paths if texts[path] is None
+        }
+        profiles = {}
+        for index, path in enumerate(paths, 1):
+            file_hash = hashes[path]
+            text, error = texts[path], None
+            if text is None:
+                try:
+                    text = parses[path].get(timeout=PDF_DEADLINE)
+                except multiprocessing.TimeoutError:
+                    text = f"{PARSE_ERROR_PREFIX}: timed out after {PDF_DEADLINE}s"
+                if text.strip() and not text.startswith(PARSE_ERROR_PREFIX):
+                    cache.put_text(file_hash, text)
+                else:
+                    error = text.strip() or "no text extracted"
+
+            if error:
+                print(f"[{index}/{len(paths)}] ❌ {os.path.basename(path)}: {error}")
+                _save(file_hash, path, batch, {}, None, error)
+                continue
+
+            local = _local_profile(text)
+            if analyzer is None:
+                print(f"[{index}/{len(paths)}] ✅ {os.path.basename(path)}: {local['primary_skill']}")
+                _save(file_hash, path, batch, local, None, None)
+                categories[local["primary_skill"]] += 1
+            else:
+                profiles[llm_pool.submit(profile_candidate, file_hash, text)] = (path, file_hash, local)
+
+        for done, future in enumerate(as_completed(profiles), 1):
+            path, file_hash, local = profiles[future]
+            try:
+                profile, error = future.result(), None
+            except Exception as e:
+                profile, error = None, f"LLM analysis failed: {e}"
+            source = profile or local
+            print(f"[{done}/{len(profiles)}] {'✅' if profile else '⚠️'} {os.path.basename(path)}: "
+                  f"{source['primary_skill']} {profile['experience_level'] if profile else ''}")
+            _save(file_hash, path, batch, local, profile, error)
+            categories[source["primary_skill"]] += 1
+
+    return categories
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Parse and profile a directory of resumes")
+    parser.add_argument("directory")
+    parser.add_argument("--batch", default=None, help="label stored with every row (e.g. the job posting)")
+    parser.add_argument("--recursive", action="store_true")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 2, help="parser processes")
+    parser.add_argument("--concurrency", type=int, default=4, help="LLM analyses in flight")
+    parser.add_argument("--no-llm", action="store_true", help="only detect skills locally")
+    args = parser.parse_args()
+
+    if not os.path.isdir(args.directory):
+        parser.error(f"Not a directory: {args.directory}")
+    resume_paths = find_resumes(args.directory, args.recursive)
+    if not resume_paths:
+        parser.error(f"No {'/'.join(RESUME_EXTENSIONS)} files in {args.directory}")
+
+    print(f"Ingesting {len(resume_paths)} resumes with {args.workers} parser processes...")
+    start = time.perf_counter()
+    counts = ingest(resume_paths, args.batch, max(1, args.workers), max(1, args.concurrency), not args.no_llm)
+    elapsed = time.perf_counter() - start
+
+    print(f"\nIngested {sum(counts.values())}/{len(resume_paths)} resumes in {elapsed:.1f}s")
+    for category, count in counts.most_common():
+        print(f"  {category:<14} {count}")
@@ -0,0 +1,83 @@
+# cassette.py
+import hashlib
+import json
+import os
+import threading
+from typing import Dict, List, Optional
+
+OFF = "off"
+RECORD = "record"
+REPLAY = "replay"
+
+
+class CassetteMiss(Exception):
+    """Raised in replay mode when a prompt was never recorded"""
+
+
+class Cassette:
+    """Record/replay store for LLM traffic, one JSON line per response.
+
+    Entries are keyed by a hash of the request (model, messages, temperature,
+    max_tokens). A prompt sent several times (e.g. question generation at
+    temperature 0.9) records one entry per call, and replay serves them back
+    in the same order, repeating the last one if the run asks for more.
+    """
+
+    def __init__(self, path: str, mode: str = REPLAY):
+        if mode not in (RECORD, REPLAY):
+            raise ValueError(f"Unknown cassette mode: {mode}")
+        self.path = path
+        self.mode = mode
+        self._entries: Dict[str, List[str]] = {}
+        self._served: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        if mode == REPLAY:
+            self._load()
+
+    @staticmethod
+    def make_key(payload: Dict) -> str:
+        request = {k: payload.get(k) for k in ("model", "messages", "temperature", "max_tokens")}
+        raw = json.dumps(request, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:32]
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            print(f"⚠️ Cassette {self.path} not found, every LLM call will miss")
+            return
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                entry = json.loads(line)
+                self._entries.setdefault(entry["k"], []).append(entry["r"])
+
+    def replay(self, payload: Dict) -> str:
+        """Return the next recorded response for this request"""
+        key = self.make_key(payload)
+        with self._lock:
+            responses = self._entries.get(key)
+            if not responses:
+                self.misses += 1
+                raise CassetteMiss(f"No recorded response for prompt {key}")
+            index = self._served.get(key, 0)
+            self._served[key] = index + 1
+            self.hits += 1
+            return responses[min(index, len(responses) - 1)]
+
+    def record(self, payload: Dict, response: str):
+        """Append a response to the cassette file"""
+        line = json.dumps({"k": self.make_key(payload), "r": response}, ensure_ascii=False)
+        with self._lock:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+
+
+def open_cassette(mode: str, path: str) -> Optional[Cassette]:
+    """Cassette for the configured mode, or None when recording/replay is off"""
+    mode = (mode or OFF).lower()
+    if mode == OFF:
+        return None
+    return Cassette(path, mode)
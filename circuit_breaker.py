@@ -0,0 +1,201 @@
+# circuit_breaker.py
+import threading
+import time
+from datetime import datetime
+from typing import Dict
+
+from config import BREAKER_FAILURE_THRESHOLD, BREAKER_RECOVERY_TIMEOUT, BREAKER_HALF_OPEN_CALLS
+from models import Base, SessionLocal, CircuitBreakerState, engine
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of making a call while the breaker is open"""
+
+
+class CircuitBreaker:
+    """Closed/open/half-open breaker.
+
+    After `failure_threshold` consecutive failures the breaker opens and every
+    call fails immediately, so callers reach their heuristic fallback without
+    waiting for a network timeout. After `recovery_timeout` seconds it lets
+    `half_open_calls` trial calls through: a success closes it again, a
+    failure re-opens it. State changes are written to SQLite so the HR
+    dashboard (a separate process) can show them; a new breaker resumes from
+    that row instead of resetting it, so any process (app, bulk ingestion,
+    benchmarks) can construct one without clobbering the shared state.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = BREAKER_FAILURE_THRESHOLD,
+        recovery_timeout: float = BREAKER_RECOVERY_TIMEOUT,
+        half_open_calls: int = BREAKER_HALF_OPEN_CALLS,
+        persist: bool = True
+    ):
+        self.name = name
+        self.failure_threshold = max(1, failure_threshold)
+        self.recovery_timeout = recovery_timeout
+        self.half_open_calls = max(1, half_open_calls)
+        self.persist = persist
+        self.state = CLOSED
+        self.consecutive_failures = 0
+        self.total_trips = 0
+        self.last_error = None
+        self._opened_at = 0.0
+        self._opened_at_wall = None
+        self._trials = 0
+        self._half_open_at = 0.0
+        self._lock = threading.Lock()
+        if persist:
+            try:
+                Base.metadata.create_all(bind=engine, tables=[CircuitBreakerState.__table__])
+            except Exception as e:
+                print(f"⚠️ Circuit breaker table unavailable: {e}")
+                self.persist = False
+        self._load()
+
+    def _load(self):
+        """Resume from the persisted row; only a breaker with no row yet writes one"""
+        if not self.persist:
+            return
+        try:
+            db = SessionLocal()
+            try:
+                row = db.get(CircuitBreakerState, self.name)
+            finally:
+                db.close()
+        except Exception as e:
+            print(f"⚠️ Could not load circuit breaker state: {e}")
+            return
+        if row is None:
+            self._save()
+            return
+
+        self.consecutive_failures = row.consecutive_failures or 0
+        self.total_trips = row.total_trips or 0
+        self.last_error = row.last_error
+        if row.state in (OPEN, HALF_OPEN) and row.opened_at is not None:
+            # Carry on the open period; the first call after it is a trial that records the outcome
+            open_for = max(0.0, (datetime.utcnow() - row.opened_at).total_seconds())
+            self.state = OPEN
+            self._opened_at = time.monotonic() - open_for
+            self._opened_at_wall = row.opened_at
+
+    def before_call(self):
+        """Raise CircuitOpenError if the call must not be attempted"""
+        with self._lock:
+            if self.state == CLOSED:
+                return
+            if self.state == OPEN:
+                if time.monotonic() - self._opened_at < self.recovery_timeout:
+                    raise CircuitOpenError(f"Circuit '{self.name}' is open: {self.last_error}")
+                self.state = HALF_OPEN
+                self._trials = 0
+                self._half_open_at = time.monotonic()
+                changed = True
+            else:
+                changed = False
+                # A trial that never reported back (e.g. cancelled) must not wedge the breaker
+                if time.monotonic() - self._half_open_at >= self.recovery_timeout:
+                    self._trials = 0
+                    self._half_open_at = time.monotonic()
+            if self._trials >= self.half_open_calls:
+                raise CircuitOpenError(f"Circuit '{self.name}' is half-open, trial call in progress")
+            self._trials += 1
+        if changed:
+            self._save()
+
+    def record_success(self):
+        with self._lock:
+            changed = self.state != CLOSED
+            self.state = CLOSED
+            self.consecutive_failures = 0
+            self._trials = 0
+        if changed:
+            print(f"✅ Circuit '{self.name}' closed")
+            self._save()
+
+    def release_trial(self):
+        """A call that never reached the endpoint: free its half-open trial slot, change nothing else"""
+        with self._lock:
+            if self.state == HALF_OPEN and self._trials > 0:
+                self._trials -= 1
+
+    def record_failure(self, error: Exception):
+        with self._lock:
+            self.consecutive_failures += 1
+            self.last_error = str(error)[:500]
+            trip = self.state == HALF_OPEN or (
+                self.state == CLOSED and self.consecutive_failures >= self.failure_threshold
+            )
+            if trip:
+                self.state = OPEN
+                self.total_trips += 1
+                self._opened_at = time.monotonic()
+                self._opened_at_wall = datetime.utcnow()
+                self._trials = 0
+        if trip:
+            print(f"⚠️ Circuit '{self.name}' opened after {self.consecutive_failures} failures: {self.last_error}")
+            self._save()
+
+    def snapshot(self) -> Dict:
+        with self._lock:
+            return {
+                "name": self.name,
+                "state": self.state,
+                "consecutive_failures": self.consecutive_failures,
+                "total_trips": self.total_trips,
+                "last_error": self.last_error,
+                "opened_at": self._opened_at_wall
+            }
+
+    def _save(self):
+        """Persist the current state (only called on transitions)"""
+        if not self.persist:
+            return
+        snap = self.snapshot()
+        try:
+            db = SessionLocal()
+            try:
+                db.merge(CircuitBreakerState(
+                    name=snap["name"],
+                    state=snap["state"],
+                    consecutive_failures=snap["consecutive_failures"],
+                    total_trips=snap["total_trips"],
+                    last_error=snap["last_error"],
+                    opened_at=snap["opened_at"],
+                    updated_at=datetime.utcnow()
+                ))
+                db.commit()
+            finally:
+                db.close()
+        except Exception as e:
+            print(f"⚠️ Could not save circuit breaker state: {e}")
+
+
+def load_breaker_states() -> Dict[str, Dict]:
+    """Persisted breaker states by name (for the HR dashboard)"""
+    try:
+        db = SessionLocal()
+        try:
+            rows = db.query(CircuitBreakerState).all()
+            return {
+                row.name: {
+                    "state": row.state,
+                    "consecutive_failures": row.consecutive_failures,
+                    "total_trips": row.total_trips,
+                    "last_error": row.last_error,
+                    "opened_at": row.opened_at,
+                    "updated_at": row.updated_at
+                }
+                for row in rows
+            }
+        finally:
+            db.close()
+    except Exception:
+        return {}
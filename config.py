@@ -4,12 +4,95 @@ from dotenv import load_dotenv
 
 load_dotenv()
 OPENROUTER_API_KEY = os.getenv("API_KEY") 
-OPENROUTER_BASE_URL = "https://api.groq.com/openai/v1"
+OPENROUTER_BASE_URL = os.getenv("LLM_BASE_URL", "https://api.groq.com/openai/v1")  # point at mock_llm_server.py for offline runs
 MODEL_NAME = "llama-3.3-70b-versatile"
 
+# LLM client settings (shared connection pool, see llm_client.py)
+LLM_TIMEOUT = float(os.getenv("LLM_TIMEOUT", "30"))  # seconds per call
+LLM_CONNECT_TIMEOUT = float(os.getenv("LLM_CONNECT_TIMEOUT", "5"))
+LLM_MAX_CONNECTIONS = int(os.getenv("LLM_MAX_CONNECTIONS", "20"))
+LLM_MAX_KEEPALIVE = int(os.getenv("LLM_MAX_KEEPALIVE", "10"))
+LLM_WORKERS = int(os.getenv("LLM_WORKERS", "16"))  # threads for background LLM work
+
+# Provider rate limits and adaptive concurrency (see rate_limiter.py)
+LLM_RPM_LIMIT = int(os.getenv("LLM_RPM_LIMIT", "30"))  # requests per minute
+LLM_TPM_LIMIT = int(os.getenv("LLM_TPM_LIMIT", "12000"))  # tokens per minute
+LLM_MIN_CONCURRENCY = int(os.getenv("LLM_MIN_CONCURRENCY", "1"))
+LLM_MAX_CONCURRENCY = int(os.getenv("LLM_MAX_CONCURRENCY", "16"))
+LLM_QUEUE_TIMEOUT = float(os.getenv("LLM_QUEUE_TIMEOUT", "120"))  # max seconds a call waits for a slot
+LLM_MAX_RETRIES = int(os.getenv("LLM_MAX_RETRIES", "3"))  # retries after 429/5xx
+
+# Record/replay of LLM traffic for repeatable runs (see cassette.py)
+LLM_CASSETTE_MODE = os.getenv("LLM_CASSETTE_MODE", "off").lower()  # off / record / replay
+LLM_CASSETTE_PATH = os.getenv("LLM_CASSETTE_PATH", "llm_cassette.jsonl")
+INTERVIEW_SEED = int(os.environ["INTERVIEW_SEED"]) if os.getenv("INTERVIEW_SEED") else None  # fixes random choices
+
+# Prompt token budgets (see token_budget.py); ~4 characters per token
+INTRO_INPUT_TOKENS = int(os.getenv("INTRO_INPUT_TOKENS", "700"))  # condensed resume / introduction
+ANSWER_INPUT_TOKENS = int(os.getenv("ANSWER_INPUT_TOKENS", "500"))  # candidate answer in evaluation prompts
+RESUME_CHUNK_TOKENS = int(os.getenv("RESUME_CHUNK_TOKENS", "600"))  # per chunk when a long resume is map-reduced
+RESUME_MAX_CHUNKS = int(os.getenv("RESUME_MAX_CHUNKS", "6"))  # chunks analyzed concurrently, by section priority
+RESUME_MAX_TOKENS = int(os.getenv("RESUME_MAX_TOKENS", "4000"))  # prompt + reply tokens spent on one long resume
+OUTPUT_TOKENS = {  # max_tokens sized to each expected reply format
+    "questions": 220,  # 5 numbered questions
+    "evaluation": 180,  # 6 score lines + strengths/weaknesses
+    "intro_analysis": 250,  # 5 short labelled lines, then the (open-ended) skills list
+    "intro_signals": 120,  # free-text recruiter notes
+    "summary": 130  # 2-3 sentences
+}
+
+# Circuit breaker around the LLM client (see circuit_breaker.py)
+BREAKER_FAILURE_THRESHOLD = int(os.getenv("BREAKER_FAILURE_THRESHOLD", "5"))  # consecutive failures to open
+BREAKER_RECOVERY_TIMEOUT = float(os.getenv("BREAKER_RECOVERY_TIMEOUT", "30"))  # seconds open before a trial call
+BREAKER_HALF_OPEN_CALLS = int(os.getenv("BREAKER_HALF_OPEN_CALLS", "1"))  # trial calls allowed while half-open
+
+# Resume uploads larger than this are rejected before parsing. Uploads through the
+# app are capped earlier by server.maxUploadSize (MB) in .streamlit/config.toml; keep both in sync
+MAX_UPLOAD_BYTES = int(os.getenv("MAX_UPLOAD_BYTES", str(10 * 1024 * 1024)))
+
+# PDF resume extraction (process pool, see resume_parser.py)
+PDF_WORKERS = int(os.getenv("PDF_WORKERS", "2"))  # worker processes
+PDF_MAX_PAGES = int(os.getenv("PDF_MAX_PAGES", "20"))  # pages read per document
+PDF_PAGE_TIMEOUT = float(os.getenv("PDF_PAGE_TIMEOUT", "10"))  # seconds a single page may take
+PDF_DEADLINE = float(os.getenv("PDF_DEADLINE", "30"))  # seconds for the whole document
+
+# Evaluation cache (in-process LRU + SQLite table), sizes in bytes
+EVAL_CACHE_MEMORY_BYTES = int(os.getenv("EVAL_CACHE_MEMORY_BYTES", str(8 * 1024 * 1024)))
+EVAL_CACHE_DB_BYTES = int(os.getenv("EVAL_CACHE_DB_BYTES", str(64 * 1024 * 1024)))
+
+# Resume cache (parsed text + candidate profile by file hash, see resume_cache.py)
+RESUME_CACHE_MEMORY_BYTES = int(os.getenv("RESUME_CACHE_MEMORY_BYTES", str(4 * 1024 * 1024)))
+RESUME_CACHE_DB_BYTES = int(os.getenv("RESUME_CACHE_DB_BYTES", str(64 * 1024 * 1024)))
+
+# Dashboard report index (watches interview_reports/, see report_index.py)
+REPORT_INDEX_DEBOUNCE = float(os.getenv("REPORT_INDEX_DEBOUNCE", "0.5"))  # seconds to batch file events
+
+# Dashboard score charts (in-process LRU keyed by report id, see report_charts.py)
+FIGURE_CACHE_BYTES = int(os.getenv("FIGURE_CACHE_BYTES", str(16 * 1024 * 1024)))
+FIGURE_PREWARM_REPORTS = int(os.getenv("FIGURE_PREWARM_REPORTS", "20"))  # newest reports drawn in the background
+
+# Report persistence (background writer, see report_manager.py)
+REPORT_ACK_TIMEOUT = float(os.getenv("REPORT_ACK_TIMEOUT", "5"))  # seconds the completion screen waits for the save
+REPORT_FLUSH_TIMEOUT = float(os.getenv("REPORT_FLUSH_TIMEOUT", "30"))  # seconds to drain queued reports at exit
+
+# Question bank (pre-generated technical questions, see question_bank.py)
+QUESTION_BANK_LEVELS = ["junior", "mid", "senior"]
+QUESTION_BANK_FOCUS_AREAS = [
+    "performance and optimization",
+    "security and best practices",
+    "architecture and design",
+    "debugging and troubleshooting",
+    "modern features and updates"
+]
+QUESTION_BANK_LOW_WATERMARK = 10  # refill a bucket in the background below this
+QUESTION_BANK_TARGET = 30  # questions per (category, level, focus area) bucket
+QUESTION_BANK_MAX_PENDING_REFILLS = 2  # background refills queued at once (each is up to 10 LLM calls)
+
 # Interview settings
 MAX_QUESTIONS = 7
 MIN_QUESTIONS = 3
+DEFERRED_EVALUATION = os.getenv("DEFERRED_EVALUATION", "true").lower() == "true"  # score answers in the background
+EVALUATION_DEADLINE = float(os.getenv("EVALUATION_DEADLINE", "20"))  # seconds to wait for pending scores at the end
 QUESTION_DIFFICULTY_LEVELS = ["basic", "intermediate", "advanced", "scenario-based"]
 
 # Skill categories
@@ -142,6 +225,9 @@ SKILL_CATEGORIES = {
 # Termination keywords
 TERMINATION_KEYWORDS = ["quit", "exit", "stop", "end", "terminate", "abort"]
 ABUSIVE_KEYWORDS = ["tab switching", "stupid", "idiot", "dumb", "worthless", "hate", "useless"]
+# Optional JSON file ({"misconduct": [...], "candidate_request": [...]}) that overrides
+# the lists above; edits are picked up on the next answer without a restart
+MODERATION_KEYWORDS_FILE = os.getenv("MODERATION_KEYWORDS_FILE", "")
 
 HR_EMAILS = [
     "hr@company.com",
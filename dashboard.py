@@ -1,16 +1,19 @@
 # dashboard.py - For HR/Reviewer to view interview reports
 import streamlit as st
-import os
 import json
 import pandas as pd
 import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 from datetime import datetime
+from functools import partial
 import numpy as np
 
 from models import SessionLocal
 from auth import login_user
 from config import HR_EMAILS
+from circuit_breaker import load_breaker_states, OPEN, HALF_OPEN
+from report_manager import ReportManager, ReportFilters, STATUS_OPTIONS
+from report_index import ReportIndex
+from report_charts import get_figure_cache
 
 st.set_page_config(
     page_title="HR Interview Dashboard",
@@ -139,165 +142,27 @@ css = """
 
 st.markdown(css, unsafe_allow_html=True)
 
-def load_reports():
-    """Load all interview reports from the reports directory"""
-    reports = []
-    report_dir = "interview_reports"
-    
-    if not os.path.exists(report_dir):
-        st.warning(f"No reports directory found: {report_dir}")
-        return reports
-    
-    for filename in os.listdir(report_dir):
-        if filename.endswith('.json'):
-            filepath = os.path.join(report_dir, filename)
-            try:
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    report_data = json.load(f)
-                    
-                    # Ensure all required fields exist with default values
-                    report_data.setdefault('total_questions_answered', 
-                                         len(report_data.get('question_evaluations', [])))
-                    report_data.setdefault('overall_score', 0)
-                    report_data.setdefault('final_score', 0)
-                    report_data.setdefault('candidate_profile', {})
-                    report_data.setdefault('question_evaluations', [])
-                    report_data.setdefault('timestamp', '')
-                    
-                    report_data['filename'] = filename
-                    report_data['filepath'] = filepath
-                    
-                    # Determine status based on score
-                    overall_score = report_data.get('overall_score', 0)
-                    if overall_score >= 7:
-                        report_data['status'] = 'Selected'
-                        report_data['status_color'] = 'success'
-                    elif overall_score >= 6:
-                        report_data['status'] = 'Conditional'
-                        report_data['status_color'] = 'warning'
-                    else:
-                        report_data['status'] = 'Rejected'
-                        report_data['status_color'] = 'error'
-                    
-                    # Parse timestamp for display
-                    timestamp_str = report_data.get('timestamp', '')
-                    if timestamp_str:
-                        try:
-                            if 'Z' in timestamp_str:
-                                dt = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
-                            else:
-                                dt = datetime.fromisoformat(timestamp_str)
-                            report_data['display_date'] = dt.strftime("%Y-%m-%d %H:%M:%S")
-                            report_data['display_date_short'] = dt.strftime("%b %d, %Y")
-                        except:
-                            report_data['display_date'] = timestamp_str
-                            report_data['display_date_short'] = timestamp_str
-                    
-                    reports.append(report_data)
-            except Exception as e:
-                st.error(f"Error loading {filename}: {e}")
-    
-    # Sort by timestamp (newest first)
-    reports.sort(key=lambda x: x.get('timestamp', ''), reverse=True)
-    return reports
-
-def create_score_chart(report_data, chart_id="default"):
-    """Create visualization charts for a report with unique ID"""
-    if not report_data.get('question_evaluations'):
-        return None
-    
-    # Extract scores
-    question_scores = [e["evaluation"]["overall"] for e in report_data['question_evaluations']]
-    intro_score = report_data['candidate_profile'].get('intro_score', 0)
-    all_scores = [intro_score] + question_scores
-    
-    # Create figure with subplots
-    fig = make_subplots(
-        rows=2, cols=2,
-        subplot_titles=('Score Distribution', 'Category Breakdown', 
-                       'Score Trend', 'Performance Summary'),
-        specs=[[{'type': 'pie'}, {'type': 'bar'}],
-               [{'type': 'scatter'}, {'type': 'box'}]]
-    )
-    
-    # 1. Pie chart for score distribution
-    labels = ['Excellent (8-10)', 'Good (6-7)', 'Average (4-5)', 'Poor (0-3)']
-    values = [0, 0, 0, 0]
-    avg_score = sum(all_scores) / len(all_scores) if all_scores else 0
-    
-    if avg_score >= 8:
-        values[0] = 1
-    elif avg_score >= 6:
-        values[1] = 1
-    elif avg_score >= 4:
-        values[2] = 1
-    else:
-        values[3] = 1
-    
-    fig.add_trace(
-        go.Pie(labels=labels, values=values, hole=0.3,
-               marker_colors=['#10b981', '#3b82f6', '#f59e0b', '#ef4444'],
-               name=f"pie_{chart_id}"),
-        row=1, col=1
-    )
-    
-    # 2. Bar chart for category scores
-    if report_data['question_evaluations']:
-        categories = ['Technical', 'Completeness', 'Clarity', 'Depth', 'Practical']
-        category_keys = ['technical_accuracy', 'completeness', 'clarity', 'depth', 'practicality']
-        
-        category_scores = []
-        for key in category_keys:
-            scores = [e["evaluation"].get(key, 0) for e in report_data['question_evaluations']]
-            avg = sum(scores) / len(scores) if scores else 0
-            category_scores.append(avg)
-        
-        fig.add_trace(
-            go.Bar(x=categories, y=category_scores, marker_color='#4f46e5',
-                   text=[f'{score:.1f}' for score in category_scores],
-                   textposition='auto',
-                   name=f"bar_{chart_id}"),
-            row=1, col=2
-        )
-    
-    # 3. Line chart for score trend
-    question_numbers = list(range(1, len(question_scores) + 1))
-    fig.add_trace(
-        go.Scatter(x=question_numbers, y=question_scores, mode='lines+markers',
-                   name=f'line_{chart_id}', line=dict(color='#f59e0b', width=3),
-                   marker=dict(size=8)),
-        row=2, col=1
-    )
-    
-    # Add average line
-    if question_scores:
-        avg_line = [sum(question_scores)/len(question_scores)] * len(question_numbers)
-        fig.add_trace(
-            go.Scatter(x=question_numbers, y=avg_line, mode='lines',
-                       name=f'avg_{chart_id}', line=dict(color='#10b981', width=2, dash='dash')),
-            row=2, col=1
-        )
-    
-    # 4. Box plot for score distribution
-    if question_scores:
-        fig.add_trace(
-            go.Box(y=question_scores, name=f'box_{chart_id}', 
-                   marker_color='#3b82f6', boxmean=True),
-            row=2, col=2
-        )
-    
-    fig.update_layout(
-        height=600,
-        showlegend=False,
-        paper_bgcolor='white',
-        plot_bgcolor='white',
-        font=dict(color='#334155')
-    )
-    
-    # Update subplot titles
-    fig.update_annotations(font_size=14, font_color='#1e293b')
-    
-    return fig
+# Reports rendered per page in the detailed view (default and choices)
+REPORTS_PER_PAGE = 20
+PAGE_SIZE_OPTIONS = [10, 20, 50, 100]
+
+# Snapshot columns shown in the summary table -> display names
+SUMMARY_COLUMNS = {
+    'display_date_short': 'Date',
+    'status': 'Status',
+    'experience_level': 'Experience',
+    'primary_skill': 'Primary Skill',
+    'overall_score': 'Overall Score',
+    'intro_score': 'Intro Score',
+    'question_count': 'Questions',
+    'confidence': 'Confidence',
+    'communication': 'Communication'
+}
+
+@st.cache_resource
+def get_report_index() -> ReportIndex:
+    """Process-wide report index shared by every HR session; follows interview_reports/ live"""
+    return ReportIndex(ReportManager())
 
 def generate_readable_report_locally(report_data: dict) -> str:
     """Generate a human-readable text report locally"""
@@ -400,6 +265,27 @@ def generate_readable_report_locally(report_data: dict) -> str:
     
     return report
 
+def show_llm_status():
+    """Sidebar panel with the AI service circuit breaker state"""
+    breaker = load_breaker_states().get("llm")
+    st.markdown("### 🤖 AI Service")
+    if not breaker:
+        st.caption("No status reported yet.")
+        return
+
+    if breaker["state"] == OPEN:
+        st.error("Unavailable — interviews are using heuristic scoring")
+    elif breaker["state"] == HALF_OPEN:
+        st.warning("Recovering — testing the AI service")
+    else:
+        st.success("Available")
+
+    st.caption(f"Trips: {breaker['total_trips']} | Consecutive failures: {breaker['consecutive_failures']}")
+    if breaker["state"] != "closed" and breaker.get("last_error"):
+        st.caption(f"Last error: {breaker['last_error'][:120]}")
+    if breaker.get("updated_at"):
+        st.caption(f"Updated: {breaker['updated_at'].strftime('%Y-%m-%d %H:%M:%S')} UTC")
+
 def login_page():
     st.markdown("""
     <div style='text-align: center; margin-bottom: 2rem;'>
@@ -433,6 +319,129 @@ def login_page():
                 else:
                     st.error("Invalid credentials")
 
+def render_report_details(report: dict, i: int):
+    """Body of an opened report card: profile, chart, question analysis and downloads"""
+    status = report.get('status', 'Unknown')
+    profile = report['candidate_profile']
+
+    # Basic info in columns with status badge
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("Experience", profile.get('experience_level', 'N/A').title())
+        st.metric("Confidence", profile.get('confidence', 'N/A').title())
+    with col2:
+        st.metric("Primary Skill", profile.get('primary_skill', 'N/A').title())
+        st.metric("Communication", profile.get('communication', 'N/A').title())
+    with col3:
+        st.metric("Intro Score", f"{profile.get('intro_score', 0)}/10")
+        st.metric("Questions", len(report['question_evaluations']))
+    with col4:
+        st.metric("Overall Score", f"{report.get('overall_score', 0):.2f}/10")
+        st.metric("Final Score", f"{report.get('final_score', 0):.2f}/10")
+
+    # Status badge
+    status_colors = {
+        'Selected': '#10b981',
+        'Conditional': '#f59e0b',
+        'Rejected': '#ef4444'
+    }
+    status_color = status_colors.get(status, '#64748b')
+    st.markdown(f"""
+    <div style='background: {status_color}15; border: 1px solid {status_color}; 
+              border-radius: 8px; padding: 0.5rem 1rem; margin: 1rem 0;'>
+        <strong style='color: {status_color};'>Status:</strong> {status}
+    </div>
+    """, unsafe_allow_html=True)
+
+    # Skills
+    skills = profile.get("skills", [])
+    if skills:
+        st.write("**Skills:**")
+        skill_chips = " ".join([f"<span style='background: #e2e8f0; padding: 4px 12px; border-radius: 16px; margin: 2px; display: inline-block;'>{skill}</span>" 
+                               for skill in skills])
+        st.markdown(skill_chips, unsafe_allow_html=True)
+
+    # Charts
+    st.markdown("---")
+    st.subheader("📈 Performance Visualization")
+    fig = get_figure_cache().get_chart(report)
+
+    if fig:
+        st.plotly_chart(fig, use_container_width=True, key=f"chart_main_{i}")
+    else:
+        st.info("No question data available for visualization.")
+
+    # Detailed question analysis
+    st.markdown("---")
+    st.subheader("📝 Question Analysis")
+    evaluations = report.get('question_evaluations', [])
+    for j, eval_data in enumerate(evaluations):
+        with st.expander(f"Question {j+1}: {eval_data['question'][:50]}...", expanded=False):
+            evaluation = eval_data['evaluation']
+
+            col_a, col_b = st.columns([2, 1])
+            with col_a:
+                st.write(f"**Question:** {eval_data['question']}")
+                st.write(f"**Answer:** {eval_data['answer']}")
+            with col_b:
+                score = evaluation.get('overall', 0)
+                st.metric("Score", f"{score}/10")
+
+            # Category scores
+            st.write("**Category Scores:**")
+            categories = [
+                ("Technical Accuracy", "technical_accuracy"),
+                ("Completeness", "completeness"),
+                ("Clarity", "clarity"),
+                ("Depth", "depth"),
+                ("Practicality", "practicality")
+            ]
+
+            cat_cols = st.columns(5)
+            for idx, (label, key) in enumerate(categories):
+                with cat_cols[idx]:
+                    cat_score = evaluation.get(key, 0)
+                    st.metric(label, f"{cat_score}/10")
+
+            # Strengths and weaknesses
+            col_x, col_y = st.columns(2)
+            with col_x:
+                if evaluation.get('strengths'):
+                    st.write("**Strengths:**")
+                    for strength in evaluation['strengths']:
+                        st.success(f"✓ {strength}")
+
+            with col_y:
+                if evaluation.get('weaknesses'):
+                    st.write("**Areas for Improvement:**")
+                    for weakness in evaluation['weaknesses']:
+                        st.error(f"✗ {weakness}")
+
+    # Download buttons
+    st.markdown("---")
+    st.write("**Download Reports:**")
+    col_d1, col_d2 = st.columns(2)
+    with col_d1:
+        # JSON download
+        st.download_button(
+            label="📥 Download JSON",
+            data=partial(json.dumps, report, indent=2, ensure_ascii=False),
+            file_name=report['filename'],
+            mime="application/json",
+            key=f"json_{i}"
+        )
+
+    with col_d2:
+        # Text report is rendered only when the button is clicked
+        txt_filename = report['filename'].replace('.json', '.txt')
+        st.download_button(
+            label="📥 Generate Text Report",
+            data=partial(generate_readable_report_locally, report),
+            file_name=txt_filename,
+            mime="text/plain",
+            key=f"text_{i}"
+        )
+
 def main():
     # Login Check
     if 'hr_user' not in st.session_state:
@@ -448,17 +457,25 @@ def main():
         if st.button("Logout"):
             st.session_state.hr_user = None
             st.rerun()
+        show_llm_status()
 
     st.title("📊 HR Interview Dashboard")
     st.markdown("Analyze candidate interview results and performance metrics")
     
-    # Load reports
-    reports = load_reports()
+    # One immutable snapshot per rerun; payloads are still loaded per page from the store
+    report_index = get_report_index()
+    report_manager = report_index.manager
+    snapshot = report_index.snapshot
+    options = snapshot.filter_options()
+    total_reports = len(snapshot.rows)
     
-    if not reports:
+    if not total_reports:
         st.info("No interview reports found. Run some interviews first.")
         return
     
+    # Draw the newest reports' charts in the background before anyone opens them
+    get_figure_cache().prewarm(report_manager, snapshot)
+    
     # Sidebar filters
     with st.sidebar:
         st.markdown("## 🔍 Filters")
@@ -466,7 +483,7 @@ def main():
         
         # Status filter (NEW FEATURE)
         st.markdown("### Status Filter")
-        status_options = ['All', 'Selected', 'Conditional', 'Rejected']
+        status_options = ['All'] + STATUS_OPTIONS
         selected_status = st.selectbox(
             "Select candidate status to view:",
             status_options,
@@ -475,9 +492,7 @@ def main():
         
         # Experience filter
         st.markdown("### Experience Level")
-        experience_levels = list(set([r['candidate_profile'].get('experience_level', 'N/A') 
-                                    for r in reports]))
-        experience_levels.sort()
+        experience_levels = options["experience_levels"]
         selected_experience = st.multiselect(
             "Filter by experience:", 
             experience_levels, 
@@ -495,9 +510,7 @@ def main():
         
         # Skill filter
         st.markdown("### Primary Skill")
-        all_skills = list(set([r['candidate_profile'].get('primary_skill', 'N/A') 
-                              for r in reports]))
-        all_skills.sort()
+        all_skills = options["primary_skills"]
         selected_skills = st.multiselect(
             "Filter by primary skill:",
             all_skills,
@@ -506,24 +519,9 @@ def main():
         
         # Date filter
         st.markdown("### Date Range")
-        valid_dates = []
-        for r in reports:
-            try:
-                ts = r.get('timestamp', '')
-                if not ts:
-                    continue
-                    
-                if 'Z' in ts:
-                    dt = datetime.fromisoformat(ts.replace('Z', '+00:00'))
-                else:
-                    dt = datetime.fromisoformat(ts)
-                valid_dates.append(dt)
-            except Exception:
-                continue
-        
-        if valid_dates:
-            min_date = min(valid_dates).date()
-            max_date = max(valid_dates).date()
+        if options["min_date"]:
+            min_date = options["min_date"]
+            max_date = options["max_date"]
             
             if min_date == max_date:
                 selected_date = st.date_input(
@@ -544,74 +542,37 @@ def main():
             date_range = None
         
         st.markdown("---")
-        st.markdown(f"**Total Reports:** {len(reports)}")
-    
-    # Filter reports based on all criteria
-    filtered_reports = []
-    for report in reports:
-        # Status filter
-        if selected_status != 'All':
-            if report.get('status', '') != selected_status:
-                continue
-        
-        # Experience filter
-        exp_level = report['candidate_profile'].get('experience_level', 'N/A')
-        if exp_level not in selected_experience:
-            continue
-        
-        # Score filter
-        overall_score = report.get('overall_score', 0)
-        if not (score_range[0] <= overall_score <= score_range[1]):
-            continue
-        
-        # Skill filter
-        skill = report['candidate_profile'].get('primary_skill', 'N/A')
-        if skill not in selected_skills:
-            continue
-        
-        # Date filter
-        date_match = True
-        if date_range and len(date_range) == 2:
-            try:
-                ts = report.get('timestamp', '')
-                if not ts:
-                    date_match = True
-                else:
-                    if 'Z' in ts:
-                        report_date = datetime.fromisoformat(ts.replace('Z', '+00:00')).date()
-                    else:
-                        report_date = datetime.fromisoformat(ts).date()
-                    
-                    date_match = date_range[0] <= report_date <= date_range[1]
-            except:
-                date_match = True
-        
-        if date_match:
-            filtered_reports.append(report)
+        st.markdown(f"**Total Reports:** {total_reports}")
+    
+    # Filters are boolean masks over the snapshot, memoized per filter combination;
+    # only the current page's payloads are loaded
+    filters = ReportFilters(
+        status=selected_status,
+        experience_levels=tuple(selected_experience),
+        primary_skills=tuple(selected_skills),
+        score_range=tuple(score_range),
+        date_range=tuple(date_range) if date_range and len(date_range) == 2 else None
+    )
+    stats = snapshot.stats(filters)
+    filtered_count = stats["count"]
     
     # Display summary metrics
     st.markdown("## 📈 Dashboard Overview")
     
     # Calculate status counts
-    status_counts = {
-        'Selected': len([r for r in filtered_reports if r.get('status') == 'Selected']),
-        'Conditional': len([r for r in filtered_reports if r.get('status') == 'Conditional']),
-        'Rejected': len([r for r in filtered_reports if r.get('status') == 'Rejected'])
-    }
+    status_counts = stats["status_counts"]
     
     col1, col2, col3, col4 = st.columns(4)
     with col1:
-        st.metric("Total Reports", len(reports))
+        st.metric("Total Reports", total_reports)
     with col2:
         st.metric("Filtered Reports", status_counts['Selected'])
     with col3:
-        if filtered_reports:
-            avg_score = sum([r.get('overall_score', 0) for r in filtered_reports]) / len(filtered_reports)
-            st.metric("Average Score", f"{avg_score:.2f}/10")
+        if filtered_count:
+            st.metric("Average Score", f"{stats['avg_score']:.2f}/10")
     with col4:
-        if filtered_reports:
-            avg_questions = sum([len(r.get('question_evaluations', [])) for r in filtered_reports]) / len(filtered_reports)
-            st.metric("Avg Questions", f"{avg_questions:.1f}")
+        if filtered_count:
+            st.metric("Avg Questions", f"{stats['avg_questions']:.1f}")
     
     # Status distribution
     st.markdown("### 📊 Status Distribution")
@@ -640,9 +601,9 @@ def main():
     
     # Display filtered reports
     st.markdown("---")
-    st.markdown(f"## 📋 Detailed Reports ({len(filtered_reports)} found)")
+    st.markdown(f"## 📋 Detailed Reports ({filtered_count} found)")
     
-    if not filtered_reports:
+    if not filtered_count:
         st.info("No reports match the selected filters.")
         return
     
@@ -650,164 +611,46 @@ def main():
     tab1, tab2 = st.tabs(["🔍 Detailed View", "📊 Summary Analytics"])
     
     with tab1:
-        # Display each report in an expander
-        for i, report in enumerate(filtered_reports):
-            status = report.get('status', 'Unknown')
-            status_color = report.get('status_color', 'default')
-            
-            with st.expander(
-                f"{report.get('display_date_short', 'N/A')} | "
-                f"Score: {report.get('overall_score', 0):.1f}/10 | "
-                f"Status: {status} | "
-                f"Exp: {report['candidate_profile'].get('experience_level', 'N/A')}",
-                expanded=False
-            ):
-                
-                # Basic info in columns with status badge
-                col1, col2, col3, col4 = st.columns(4)
-                with col1:
-                    profile = report['candidate_profile']
-                    st.metric("Experience", profile.get('experience_level', 'N/A').title())
-                    st.metric("Confidence", profile.get('confidence', 'N/A').title())
-                with col2:
-                    st.metric("Primary Skill", profile.get('primary_skill', 'N/A').title())
-                    st.metric("Communication", profile.get('communication', 'N/A').title())
-                with col3:
-                    st.metric("Intro Score", f"{profile.get('intro_score', 0)}/10")
-                    st.metric("Questions", len(report['question_evaluations']))
-                with col4:
-                    st.metric("Overall Score", f"{report.get('overall_score', 0):.2f}/10")
-                    st.metric("Final Score", f"{report.get('final_score', 0):.2f}/10")
-                
-                # Status badge
-                status_colors = {
-                    'Selected': '#10b981',
-                    'Conditional': '#f59e0b',
-                    'Rejected': '#ef4444'
-                }
-                status_color = status_colors.get(status, '#64748b')
-                st.markdown(f"""
-                <div style='background: {status_color}15; border: 1px solid {status_color}; 
-                          border-radius: 8px; padding: 0.5rem 1rem; margin: 1rem 0;'>
-                    <strong style='color: {status_color};'>Status:</strong> {status}
-                </div>
-                """, unsafe_allow_html=True)
-                
-                # Skills
-                skills = profile.get("skills", [])
-                if skills:
-                    st.write("**Skills:**")
-                    skill_chips = " ".join([f"<span style='background: #e2e8f0; padding: 4px 12px; border-radius: 16px; margin: 2px; display: inline-block;'>{skill}</span>" 
-                                           for skill in skills])
-                    st.markdown(skill_chips, unsafe_allow_html=True)
-                
-                # Charts
-                st.markdown("---")
-                st.subheader("📈 Performance Visualization")
-                fig = create_score_chart(report, chart_id=f"report_{i+1}")
-                
-                if fig:
-                    st.plotly_chart(fig, use_container_width=True, key=f"chart_main_{i}")
-                else:
-                    st.info("No question data available for visualization.")
-                
-                # Detailed question analysis
-                st.markdown("---")
-                st.subheader("📝 Question Analysis")
-                evaluations = report.get('question_evaluations', [])
-                for j, eval_data in enumerate(evaluations):
-                    with st.expander(f"Question {j+1}: {eval_data['question'][:50]}...", expanded=False):
-                        evaluation = eval_data['evaluation']
-                        
-                        col_a, col_b = st.columns([2, 1])
-                        with col_a:
-                            st.write(f"**Question:** {eval_data['question']}")
-                            st.write(f"**Answer:** {eval_data['answer']}")
-                        with col_b:
-                            score = evaluation.get('overall', 0)
-                            st.metric("Score", f"{score}/10")
-                        
-                        # Category scores
-                        st.write("**Category Scores:**")
-                        categories = [
-                            ("Technical Accuracy", "technical_accuracy"),
-                            ("Completeness", "completeness"),
-                            ("Clarity", "clarity"),
-                            ("Depth", "depth"),
-                            ("Practicality", "practicality")
-                        ]
-                        
-                        cat_cols = st.columns(5)
-                        for idx, (label, key) in enumerate(categories):
-                            with cat_cols[idx]:
-                                cat_score = evaluation.get(key, 0)
-                                st.metric(label, f"{cat_score}/10")
-                        
-                        # Strengths and weaknesses
-                        col_x, col_y = st.columns(2)
-                        with col_x:
-                            if evaluation.get('strengths'):
-                                st.write("**Strengths:**")
-                                for strength in evaluation['strengths']:
-                                    st.success(f"✓ {strength}")
-                        
-                        with col_y:
-                            if evaluation.get('weaknesses'):
-                                st.write("**Areas for Improvement:**")
-                                for weakness in evaluation['weaknesses']:
-                                    st.error(f"✗ {weakness}")
-                
-                # Download buttons
-                st.markdown("---")
-                st.write("**Download Reports:**")
-                col_d1, col_d2 = st.columns(2)
-                with col_d1:
-                    # JSON download
-                    json_str = json.dumps(report, indent=2, ensure_ascii=False)
-                    st.download_button(
-                        label="📥 Download JSON",
-                        data=json_str,
-                        file_name=report['filename'],
-                        mime="application/json",
-                        key=f"json_{i}"
-                    )
-                
-                with col_d2:
-                    # Generate text report on the fly
-                    text_report = generate_readable_report_locally(report)
-                    txt_filename = report['filename'].replace('.json', '.txt')
-                    st.download_button(
-                        label="📥 Generate Text Report",
-                        data=text_report,
-                        file_name=txt_filename,
-                        mime="text/plain",
-                        key=f"text_{i}"
-                    )
+        col_size, col_page = st.columns([1, 3])
+        with col_size:
+            page_size = st.selectbox("Reports per page", PAGE_SIZE_OPTIONS,
+                                     index=PAGE_SIZE_OPTIONS.index(REPORTS_PER_PAGE))
+        page_count = (filtered_count + page_size - 1) // page_size
+        with col_page:
+            page = st.number_input("Page", min_value=1, max_value=page_count, value=1, step=1) if page_count > 1 else 1
+        st.caption(f"Page {page} of {max(page_count, 1)}")
+        offset = (page - 1) * page_size
+        page_rows = snapshot.query(filters, offset=offset, limit=page_size)
+        
+        # Cards are headers built from the snapshot; a report's payload, chart and
+        # downloads are only produced once its card is opened
+        for i, row in enumerate(page_rows, start=offset):
+            opened = st.toggle(
+                f"{row['display_date_short']} | "
+                f"Score: {row['overall_score']:.1f}/10 | "
+                f"Status: {row['status']} | "
+                f"Exp: {row['experience_level'] or 'N/A'}",
+                key=f"open_{row['filename']}"
+            )
+            if not opened:
+                continue
+            report = report_manager.get_report(row["id"])
+            if report is None:
+                st.warning("This report is no longer available.")
+                continue
+            with st.container(border=True):
+                render_report_details(report, i)
     
     with tab2:
         # Summary statistics across all filtered reports
         st.subheader("📊 Summary Analytics")
         
-        if filtered_reports:
-            # Create summary DataFrame
-            summary_data = []
-            for report in filtered_reports:
-                profile = report['candidate_profile']
-                overall_score = report.get('overall_score', 0)
-                
-                summary_data.append({
-                    'Date': report.get('display_date_short', 'N/A'),
-                    'Status': report.get('status', 'Unknown'),
-                    'Experience': profile.get('experience_level', 'N/A'),
-                    'Primary Skill': profile.get('primary_skill', 'N/A'),
-                    'Overall Score': report.get('overall_score', 0),
-                    'Intro Score': profile.get('intro_score', 0),
-                    'Questions': len(report.get('question_evaluations', [])),
-                    'Confidence': profile.get('confidence', 'N/A'),
-                    'Communication': profile.get('communication', 'N/A')
-                })
-            
-            df = pd.DataFrame(summary_data)
+        filtered = snapshot.filtered(filters)
+        if not filtered.empty:
+            # Summary columns of the memoized filter result (no payloads)
+            df = filtered[list(SUMMARY_COLUMNS)].rename(columns=SUMMARY_COLUMNS).astype(
+                {'Status': object, 'Experience': object, 'Primary Skill': object}
+            ).reset_index(drop=True)
             
             # Display DataFrame with styling
             st.dataframe(
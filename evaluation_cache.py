@@ -0,0 +1,155 @@
+# evaluation_cache.py
+import hashlib
+import json
+import threading
+from datetime import datetime
+from typing import Dict, Optional
+
+from sqlalchemy import func
+
+from config import EVAL_CACHE_MEMORY_BYTES, EVAL_CACHE_DB_BYTES
+from models import Base, SessionLocal, EvaluationCacheEntry, engine
+from utils import ByteLRUCache, clean_text
+
+# Check the SQLite tier against its byte budget every N writes
+PRUNE_EVERY = 100
+
+
+def _normalize(text: str) -> str:
+    return clean_text(text or "").lower()
+
+
+class EvaluationCache:
+    """Two-tier cache for answer evaluations: in-process LRU backed by SQLite"""
+
+    def __init__(self, memory_bytes: int = EVAL_CACHE_MEMORY_BYTES, db_bytes: int = EVAL_CACHE_DB_BYTES):
+        self.memory = ByteLRUCache(memory_bytes)
+        self.db_bytes = db_bytes
+        self._lock = threading.Lock()
+        self._writes = 0
+        self.memory_hits = 0
+        self.db_hits = 0
+        self.misses = 0
+        try:
+            Base.metadata.create_all(bind=engine, tables=[EvaluationCacheEntry.__table__])
+        except Exception as e:
+            print(f"⚠️ Evaluation cache table unavailable: {e}")
+
+    @staticmethod
+    def make_key(question: str, answer: str, model: str, prompt_version: str) -> str:
+        """Content address for an evaluation request"""
+        raw = "\x1f".join([_normalize(question), _normalize(answer), model, prompt_version])
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict]:
+        """Return a copy of the cached evaluation or None"""
+        payload = self.memory.get(key)
+        if payload is not None:
+            with self._lock:
+                self.memory_hits += 1
+            return json.loads(payload)
+
+        try:
+            db = SessionLocal()
+            try:
+                entry = db.get(EvaluationCacheEntry, key)
+                if entry is not None:
+                    payload = entry.payload
+                    entry.last_used_at = datetime.utcnow()
+                    db.commit()
+            finally:
+                db.close()
+        except Exception as e:
+            print(f"⚠️ Evaluation cache read failed: {e}")
+            payload = None
+
+        with self._lock:
+            if payload is None:
+                self.misses += 1
+                return None
+            self.db_hits += 1
+        self.memory.put(key, payload, len(payload.encode("utf-8")))
+        return json.loads(payload)
+
+    def put(self, key: str, evaluation: Dict, model: str, prompt_version: str):
+        """Store an evaluation in both tiers"""
+        payload = json.dumps(evaluation, ensure_ascii=False)
+        size = len(payload.encode("utf-8"))
+        self.memory.put(key, payload, size)
+
+        try:
+            db = SessionLocal()
+            try:
+                db.merge(EvaluationCacheEntry(
+                    key=key,
+                    model=model,
+                    prompt_version=prompt_version,
+                    payload=payload,
+                    size_bytes=size,
+                    last_used_at=datetime.utcnow()
+                ))
+                db.commit()
+            finally:
+                db.close()
+        except Exception as e:
+            print(f"⚠️ Evaluation cache write failed: {e}")
+            return
+
+        with self._lock:
+            self._writes += 1
+            should_prune = self._writes % PRUNE_EVERY == 0
+        if should_prune:
+            self.prune()
+
+    def prune(self):
+        """Evict least recently used rows until the SQLite tier fits its byte budget"""
+        try:
+            db = SessionLocal()
+            try:
+                total = db.query(func.coalesce(func.sum(EvaluationCacheEntry.size_bytes), 0)).scalar()
+                excess = total - self.db_bytes
+                if excess <= 0:
+                    return
+                stale_keys = []
+                rows = db.query(EvaluationCacheEntry.key, EvaluationCacheEntry.size_bytes) \
+                    .order_by(EvaluationCacheEntry.last_used_at.asc())
+                for key, size in rows:
+                    if excess <= 0:
+                        break
+                    stale_keys.append(key)
+                    excess -= size
+                db.query(EvaluationCacheEntry).filter(EvaluationCacheEntry.key.in_(stale_keys)) \
+                    .delete(synchronize_session=False)
+                db.commit()
+            finally:
+                db.close()
+        except Exception as e:
+            print(f"⚠️ Evaluation cache prune failed: {e}")
+
+    def stats(self) -> Dict:
+        """Hit/miss counters and memory tier usage"""
+        with self._lock:
+            lookups = self.memory_hits + self.db_hits + self.misses
+            return {
+                "memory_hits": self.memory_hits,
+                "db_hits": self.db_hits,
+                "misses": self.misses,
+                "hit_rate": (self.memory_hits + self.db_hits) / lookups if lookups else 0.0,
+                "memory_entries": len(self.memory),
+                "memory_bytes": self.memory.size_bytes,
+                "memory_evictions": self.memory.evictions
+            }
+
+
+_cache: Optional[EvaluationCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_evaluation_cache() -> EvaluationCache:
+    """Return the process-wide evaluation cache"""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = EvaluationCache()
+    return _cache
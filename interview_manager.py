@@ -1,14 +1,17 @@
 import time
+from concurrent.futures import wait
 from typing import Dict, List
 from utils import Fore, Style, format_response, calculate_performance_score, calculate_detailed_score, get_performance_feedback
 from question_generator import QuestionGenerator
 from response_analyzer import ResponseAnalyzer
-from config import MAX_QUESTIONS, MIN_QUESTIONS
-import openai
-from config import OPENROUTER_API_KEY, OPENROUTER_BASE_URL
+from config import MAX_QUESTIONS, MIN_QUESTIONS, DEFERRED_EVALUATION, EVALUATION_DEADLINE
+from llm_client import get_llm_client, get_executor
+from token_budget import output_budget
 
 class InterviewManager: 
-    def __init__(self):
+    def __init__(self, deferred_evaluation: bool = DEFERRED_EVALUATION):
+        self.deferred_evaluation = deferred_evaluation
+        self.pending_evaluations = []  # (response_data, future) still being scored
         self.question_generator = QuestionGenerator()
         self.response_analyzer = ResponseAnalyzer()
         self.interview_data = {
@@ -143,8 +146,6 @@ class InterviewManager:
                 else:
                     last_question = self.interview_data["questions_asked"][-1]
                 
-                # Evaluate the answer
-                evaluation = self.response_analyzer.evaluate_answer(last_question, cleaned_response)
                 word_count = len(cleaned_response.split())
                 
                 # Determine question type
@@ -156,15 +157,15 @@ class InterviewManager:
                 if question_type == "technical":
                     self.technical_question_count += 1
                 
-                # Store response
+                # Store response (score is filled in once the evaluation is done)
                 response_data = {
                     "question": last_question,
                     "answer": cleaned_response,
-                    "evaluation": evaluation,
-                    "score": evaluation.get("overall", 0),
                     "word_count": word_count,
                     "question_number": len(self.interview_data["responses"]) + 1,
-                    "question_type": question_type
+                    "question_type": question_type,
+                    # Cheap heuristic pre-score, used if the AI evaluation fails or misses the deadline
+                    "pre_evaluation": self.response_analyzer.heuristic_evaluation(last_question, cleaned_response)
                 }
                 
                 self.interview_data["responses"].append(response_data)
@@ -173,13 +174,56 @@ class InterviewManager:
                 self._write_to_report("\n" + "-"*40)
                 self._write_to_report(f"Question {len(self.interview_data['responses'])}: {last_question}")
                 self._write_to_report(f"Answer (Word Count): {word_count} words")
-                self._write_to_report(f"Score: {evaluation.get('overall', 0)}/10")
+                
+                # Evaluate the answer
+                if self.deferred_evaluation:
+                    future = get_executor().submit(
+                        self.response_analyzer.evaluate_answer, last_question, cleaned_response
+                    )
+                    self.pending_evaluations.append((response_data, future))
+                    self._collect_evaluations()
+                    return {"terminate": False, "pending": True}
+                
+                evaluation = self.response_analyzer.evaluate_answer(last_question, cleaned_response)
+                self._record_evaluation(response_data, evaluation)
                 
                 return {"terminate": False, "score": evaluation.get("overall", 0)}
         
         self.needs_more_info = False
         return {"terminate": False}
     
+    def _record_evaluation(self, response_data: Dict, evaluation: Dict):
+        """Attach a finished evaluation to its response"""
+        response_data["evaluation"] = evaluation
+        response_data["score"] = evaluation.get("overall", 0)
+        self._write_to_report(f"Score (Question {response_data['question_number']}): {response_data['score']}/10")
+    
+    def _collect_evaluations(self, deadline: float = None):
+        """Record finished background evaluations; with a deadline, wait and fall back for the rest"""
+        if not self.pending_evaluations:
+            return
+        
+        if deadline is not None:
+            wait([future for _, future in self.pending_evaluations], timeout=deadline)
+        
+        still_pending = []
+        for response_data, future in self.pending_evaluations:
+            if future.done():
+                try:
+                    evaluation = future.result()
+                except Exception as e:
+                    print(f"AI evaluation error: {e}")
+                    evaluation = response_data["pre_evaluation"]
+            elif deadline is not None:
+                future.cancel()
+                evaluation = response_data["pre_evaluation"]
+            else:
+                still_pending.append((response_data, future))
+                continue
+            self._record_evaluation(response_data, evaluation)
+        
+        self.pending_evaluations = still_pending
+    
     def get_next_question(self) -> str:
         """Get the next AI-generated question based on interview progress"""
         
@@ -237,6 +281,7 @@ class InterviewManager:
     
     def should_continue(self) -> bool:
         """Determine if interview should continue"""
+        self._collect_evaluations()
         total_questions = len(self.interview_data.get("questions_asked", [])) - 1
         
         # Check if we've reached max questions
@@ -264,6 +309,7 @@ class InterviewManager:
     
     def end_interview(self, early_termination: bool = False, reason: str = ""):
         """End the interview session"""
+        self._collect_evaluations(deadline=EVALUATION_DEADLINE)
         self.interview_data["end_time"] = time.time()
         self.interview_data["status"] = "completed"
         
@@ -324,19 +370,17 @@ class InterviewManager:
             Provide a 2-3 sentence summary highlighting key strengths and areas for improvement.
             """
             
-            openai.api_key = OPENROUTER_API_KEY
-            openai.api_base = OPENROUTER_BASE_URL
-            response = openai.ChatCompletion.create(
+            summary = get_llm_client().chat(
                 model="xiaomi/mimo-v2-flash:free",
                 messages=[
                     {"role": "system", "content": "You are an HR analyst providing interview feedback."},
                     {"role": "user", "content": prompt}
                 ],
                 temperature=0.5,
-                max_tokens=150
+                max_tokens=output_budget("summary")
             )
             
-            return response.choices[0].message.content.strip()
+            return summary.strip()
             
         except Exception as e:
             return "AI analysis unavailable. See detailed scores below."
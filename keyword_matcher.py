@@ -0,0 +1,100 @@
+# keyword_matcher.py
+from collections import deque
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isalnum()
+
+
+def is_word_bounded(text: str, start: int, end: int) -> bool:
+    """True if text[start:end] is not glued to letters/digits on a side that is itself a word character"""
+    if _is_word_char(text[start]) and start > 0 and _is_word_char(text[start - 1]):
+        return False
+    if _is_word_char(text[end - 1]) and end < len(text) and _is_word_char(text[end]):
+        return False
+    return True
+
+
+class AhoCorasick:
+    """Case-insensitive multi-pattern matcher (Aho-Corasick automaton).
+
+    All patterns are found in a single left-to-right pass over the text. With
+    word_boundary=True a match only counts when it is not glued to letters or
+    digits on either side (so "Go" does not match inside "good"); the check is
+    only applied on pattern ends that are themselves word characters, which
+    keeps keywords like "C#" or "CI/CD" matching naturally.
+    """
+
+    def __init__(self, patterns: Iterable[str], word_boundary: bool = True):
+        self.word_boundary = word_boundary
+        self.patterns: List[str] = []
+        self.pattern_index: Dict[str, int] = {}  # lowercased pattern -> id
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[int]] = [[]]
+
+        for pattern in patterns:
+            key = pattern.lower()
+            if not key or key in self.pattern_index:
+                continue
+            self.pattern_index[key] = len(self.patterns)
+            self.patterns.append(key)
+            self._add(key, self.pattern_index[key])
+        self._build()
+
+    def _add(self, pattern: str, pattern_id: int):
+        state = 0
+        for ch in pattern:
+            nxt = self._goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+                self._goto[state][ch] = nxt
+            state = nxt
+        self._out[state].append(pattern_id)
+
+    def _build(self):
+        """Compute failure links breadth-first and merge output sets"""
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fail = self._fail[state]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[nxt] = self._goto[fail].get(ch, 0)
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, int]]:
+        """Yield (start, pattern_id) for every match in text (positions refer to text.lower())"""
+        text = text.lower()
+        goto, fail, out = self._goto, self._fail, self._out
+        state = 0
+        for i, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            for pattern_id in out[state]:
+                pattern = self.patterns[pattern_id]
+                start = i - len(pattern) + 1
+                if self.word_boundary and not is_word_bounded(text, start, i + 1):
+                    continue
+                yield start, pattern_id
+
+    def find(self, text: str) -> List[int]:
+        """Distinct pattern ids found in text, in order of first occurrence"""
+        found = {}
+        for _, pattern_id in self.iter_matches(text):
+            found.setdefault(pattern_id, None)
+        return list(found)
+
+    def count(self, text: str) -> Dict[int, int]:
+        """Occurrences of each matched pattern id"""
+        counts: Dict[int, int] = {}
+        for _, pattern_id in self.iter_matches(text):
+            counts[pattern_id] = counts.get(pattern_id, 0) + 1
+        return counts
@@ -0,0 +1,349 @@
+# llm_client.py
+import asyncio
+import threading
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+import httpx
+
+from config import (
+    OPENROUTER_API_KEY, OPENROUTER_BASE_URL, MODEL_NAME,
+    LLM_TIMEOUT, LLM_CONNECT_TIMEOUT, LLM_MAX_CONNECTIONS, LLM_MAX_KEEPALIVE, LLM_WORKERS,
+    LLM_MAX_RETRIES, LLM_CASSETTE_MODE, LLM_CASSETTE_PATH
+)
+from token_budget import estimate_messages_tokens
+from cassette import Cassette, CassetteMiss, open_cassette, REPLAY
+from rate_limiter import LLMThrottle, ThrottleTimeout
+from circuit_breaker import CircuitBreaker, CircuitOpenError
+
+# Statuses that mean "provider overloaded, back off and retry"
+RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+CONGESTION_STATUSES = {429, 503}
+
+
+class LLMError(Exception):
+    """Raised when a chat completion could not be obtained"""
+
+    def __init__(self, message: str, status_code: Optional[int] = None):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+class LLMTimeoutError(LLMError):
+    """Raised when a chat completion exceeds its timeout"""
+
+
+class LLMThrottleTimeoutError(LLMTimeoutError):
+    """Raised when no local request slot freed up in time; the endpoint was never called"""
+
+
+class LLMUnavailableError(LLMError):
+    """Raised without calling the endpoint while the circuit breaker is open"""
+
+
+class LLMClient:
+    """Thread-safe ChatCompletion client backed by a keep-alive connection pool.
+
+    One instance is shared by the whole process (see get_llm_client), so every
+    call reuses pooled TLS connections instead of opening a new one, and no
+    caller has to touch the process-global openai settings.
+    """
+
+    def __init__(
+        self,
+        api_key: str = OPENROUTER_API_KEY,
+        base_url: str = OPENROUTER_BASE_URL,
+        model: str = MODEL_NAME,
+        timeout: float = LLM_TIMEOUT,
+        throttle: Optional[LLMThrottle] = None,
+        max_retries: int = LLM_MAX_RETRIES,
+        breaker: Optional[CircuitBreaker] = None,
+        cassette: Optional[Cassette] = None
+    ):
+        self.api_key = api_key
+        self.base_url = base_url.rstrip("/")
+        self.model = model
+        self.timeout = timeout
+        self.throttle = throttle or LLMThrottle()
+        self.breaker = breaker or CircuitBreaker("llm")
+        self.cassette = cassette if cassette is not None else open_cassette(LLM_CASSETTE_MODE, LLM_CASSETTE_PATH)
+        self.max_retries = max_retries
+        self.retries = 0
+        self._limits = httpx.Limits(
+            max_connections=LLM_MAX_CONNECTIONS,
+            max_keepalive_connections=LLM_MAX_KEEPALIVE
+        )
+        self._client = httpx.Client(
+            base_url=self.base_url,
+            headers=self._headers(),
+            timeout=self._timeout(timeout),
+            limits=self._limits
+        )
+        # httpx.AsyncClient is bound to the event loop it was first used on
+        self._async_clients = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    def _headers(self) -> Dict[str, str]:
+        return {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        }
+
+    def _timeout(self, timeout: float) -> httpx.Timeout:
+        return httpx.Timeout(timeout, connect=min(timeout, LLM_CONNECT_TIMEOUT))
+
+    def _payload(self, messages: List[Dict], model: Optional[str],
+                 temperature: float, max_tokens: int) -> Dict:
+        return {
+            "model": model or self.model,
+            "messages": messages,
+            "temperature": temperature,
+            "max_tokens": max_tokens
+        }
+
+    @staticmethod
+    def _estimate_tokens(payload: Dict) -> int:
+        """Token cost of a call (prompt estimate + max_tokens) for the tokens/min budget"""
+        return estimate_messages_tokens(payload["messages"]) + payload["max_tokens"]
+
+    def _backoff(self, res: Optional[httpx.Response], attempt: int) -> float:
+        """Seconds to wait before retrying; honours Retry-After when the provider sends it"""
+        if res is not None:
+            try:
+                return min(30.0, float(res.headers.get("retry-after", "")))
+            except ValueError:
+                pass
+        return min(30.0, 0.5 * (2 ** attempt))
+
+    def _extract_content(self, res: httpx.Response) -> str:
+        """Return the first choice's message content or raise LLMError"""
+        if res.status_code != 200:
+            raise LLMError(f"HTTP {res.status_code}: {res.text[:200]}", status_code=res.status_code)
+        try:
+            content = res.json()["choices"][0]["message"]["content"]
+        except (ValueError, KeyError, IndexError, TypeError) as e:
+            raise LLMError(f"Malformed completion response: {e}", status_code=res.status_code)
+        return content or ""
+
+    def _check_breaker(self):
+        try:
+            self.breaker.before_call()
+        except CircuitOpenError as e:
+            raise LLMUnavailableError(str(e)) from e
+
+    def _record_outcome(self, error: Optional[LLMError]):
+        """Feed the breaker: transport errors, timeouts, 429 and 5xx count as endpoint failures"""
+        if isinstance(error, LLMThrottleTimeoutError):
+            # Our own throttle queue was full; says nothing about the endpoint
+            self.breaker.release_trial()
+        elif error is None or (error.status_code is not None and error.status_code < 500
+                               and error.status_code != 429):
+            self.breaker.record_success()
+        else:
+            self.breaker.record_failure(error)
+
+    def chat(
+        self,
+        messages: List[Dict],
+        temperature: float = 0.7,
+        max_tokens: int = 250,
+        model: Optional[str] = None,
+        timeout: Optional[float] = None
+    ) -> str:
+        """Run a chat completion and return the reply text"""
+        payload = self._payload(messages, model, temperature, max_tokens)
+        if self.cassette and self.cassette.mode == REPLAY:
+            return self._replay(payload)
+
+        self._check_breaker()
+        try:
+            content = self._post_with_retries(payload, timeout)
+        except LLMError as e:
+            self._record_outcome(e)
+            raise
+        self._record_outcome(None)
+        if self.cassette:
+            self.cassette.record(payload, content)
+        return content
+
+    def _replay(self, payload: Dict) -> str:
+        try:
+            return self.cassette.replay(payload)
+        except CassetteMiss as e:
+            raise LLMError(str(e)) from e
+
+    def _post_with_retries(self, payload: Dict, timeout: Optional[float]) -> str:
+        tokens = self._estimate_tokens(payload)
+        for attempt in range(self.max_retries + 1):
+            try:
+                ticket = self.throttle.acquire(tokens)
+            except ThrottleTimeout as e:
+                raise LLMThrottleTimeoutError(str(e)) from e
+            try:
+                res = self._client.post(
+                    "/chat/completions",
+                    json=payload,
+                    timeout=self._timeout(timeout) if timeout else httpx.USE_CLIENT_DEFAULT
+                )
+            except httpx.TimeoutException as e:
+                self.throttle.release(ticket, congested=True)
+                raise LLMTimeoutError(f"LLM call timed out: {e}") from e
+            except httpx.HTTPError as e:
+                self.throttle.release(ticket)
+                raise LLMError(f"LLM call failed: {e}") from e
+
+            self.throttle.release(ticket, congested=res.status_code in CONGESTION_STATUSES)
+            if res.status_code in RETRYABLE_STATUSES and attempt < self.max_retries:
+                self.retries += 1
+                time.sleep(self._backoff(res, attempt))
+                continue
+            return self._extract_content(res)
+
+    def _get_async_client(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            client = self._async_clients.get(loop)
+            if client is None:
+                client = httpx.AsyncClient(
+                    base_url=self.base_url,
+                    headers=self._headers(),
+                    timeout=self._timeout(self.timeout),
+                    limits=self._limits
+                )
+                self._async_clients[loop] = client
+            return client
+
+    async def achat(
+        self,
+        messages: List[Dict],
+        temperature: float = 0.7,
+        max_tokens: int = 250,
+        model: Optional[str] = None,
+        timeout: Optional[float] = None
+    ) -> str:
+        """asyncio version of chat()"""
+        payload = self._payload(messages, model, temperature, max_tokens)
+        if self.cassette and self.cassette.mode == REPLAY:
+            return self._replay(payload)
+
+        self._check_breaker()
+        try:
+            content = await self._apost_with_retries(payload, timeout)
+        except LLMError as e:
+            self._record_outcome(e)
+            raise
+        self._record_outcome(None)
+        if self.cassette:
+            self.cassette.record(payload, content)
+        return content
+
+    async def _apost_with_retries(self, payload: Dict, timeout: Optional[float]) -> str:
+        tokens = self._estimate_tokens(payload)
+        client = self._get_async_client()
+        for attempt in range(self.max_retries + 1):
+            try:
+                ticket = await self.throttle.aacquire(tokens)
+            except ThrottleTimeout as e:
+                raise LLMThrottleTimeoutError(str(e)) from e
+            try:
+                res = await client.post(
+                    "/chat/completions",
+                    json=payload,
+                    timeout=self._timeout(timeout) if timeout else httpx.USE_CLIENT_DEFAULT
+                )
+            except httpx.TimeoutException as e:
+                self.throttle.release(ticket, congested=True)
+                raise LLMTimeoutError(f"LLM call timed out: {e}") from e
+            except httpx.HTTPError as e:
+                self.throttle.release(ticket)
+                raise LLMError(f"LLM call failed: {e}") from e
+
+            self.throttle.release(ticket, congested=res.status_code in CONGESTION_STATUSES)
+            if res.status_code in RETRYABLE_STATUSES and attempt < self.max_retries:
+                self.retries += 1
+                await asyncio.sleep(self._backoff(res, attempt))
+                continue
+            return self._extract_content(res)
+
+    def chat_many(self, calls: List[Dict]) -> List:
+        """
+        Run several chat() calls concurrently on a private event loop.
+
+        `calls` are chat() keyword arguments; returns the replies in order,
+        with the exception in place of any call that failed. Must not be
+        called from a thread that is already running an event loop.
+        """
+        async def run():
+            try:
+                return await asyncio.gather(*(self.achat(**call) for call in calls),
+                                            return_exceptions=True)
+            finally:
+                with self._lock:
+                    client = self._async_clients.pop(asyncio.get_running_loop(), None)
+                if client is not None:
+                    await client.aclose()
+
+        if not calls:
+            return []
+        return asyncio.run(run())
+
+    def metrics(self) -> Dict:
+        """Throttle state (queue depth, concurrency window, bucket levels), retry count and breaker state"""
+        metrics = self.throttle.metrics()
+        metrics["retries"] = self.retries
+        metrics["breaker"] = self.breaker.snapshot()["state"]
+        if self.cassette:
+            metrics["cassette"] = {"mode": self.cassette.mode, "hits": self.cassette.hits,
+                                   "misses": self.cassette.misses}
+        return metrics
+
+    def close(self):
+        """Close the pooled sync connections"""
+        self._client.close()
+
+
+_client: Optional[LLMClient] = None
+_client_lock = threading.Lock()
+_executor: Optional[ThreadPoolExecutor] = None
+
+
+def get_llm_client() -> LLMClient:
+    """Return the process-wide LLM client, creating it on first use"""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = LLMClient()
+    return _client
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """Return the process-wide thread pool for running LLM-bound work off the caller's thread"""
+    global _executor
+    if _executor is None:
+        with _client_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=LLM_WORKERS, thread_name_prefix="llm")
+    return _executor
+
+
+def llm_metrics() -> Dict:
+    """Shortcut for get_llm_client().metrics()"""
+    return get_llm_client().metrics()
+
+
+def chat(messages: List[Dict], **kwargs) -> str:
+    """Shortcut for get_llm_client().chat()"""
+    return get_llm_client().chat(messages, **kwargs)
+
+
+async def achat(messages: List[Dict], **kwargs) -> str:
+    """Shortcut for get_llm_client().achat()"""
+    return await get_llm_client().achat(messages, **kwargs)
+
+
+def chat_many(calls: List[Dict]) -> List:
+    """Shortcut for get_llm_client().chat_many()"""
+    return get_llm_client().chat_many(calls)
@@ -0,0 +1,250 @@
+# mock_llm_server.py
+# Local stand-in for the ChatCompletion endpoint, for offline runs and benchmarks.
+#
+#   python mock_llm_server.py --port 8099 --latency-ms 800 --throttle-rate 0.05
+#   LLM_BASE_URL=http://127.0.0.1:8099/v1 streamlit run app.py
+#
+# Replies are canned but follow the formats the app parses (question lists,
+# "Technical Accuracy: 7" evaluations, "Skills: ..." intro analyses).
+import argparse
+import hashlib
+import json
+import math
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+
+QUESTION_TEMPLATES = [
+    "How would you explain {skill} to a new team member, focusing on {focus}?",
+    "What trade-offs do you consider in {skill} when it comes to {focus}?",
+    "Describe a project where {skill} was critical to {focus}. What did you do?",
+    "How do you approach {focus} when working with {skill} in production?",
+    "Walk me through how you would debug a {skill} issue related to {focus}?",
+    "What common mistakes do developers make with {skill} regarding {focus}?",
+    "How has your use of {skill} changed as your projects grew, especially for {focus}?",
+    "If a {skill} deployment started failing, how would {focus} guide your response?",
+    "Which tools do you rely on for {focus} in {skill}, and why?",
+    "How would you review a teammate's {skill} code for {focus}?",
+    "What metrics would you track in a {skill} system to stay on top of {focus}?",
+    "Tell me about a {focus} decision in {skill} that you would make differently today?",
+]
+
+INTRO_LEVELS = ["junior", "mid", "senior"]
+
+
+class MockSettings:
+    """Latency and failure injection knobs (shared by all handler threads)"""
+
+    def __init__(self, latency_ms: float = 0.0, latency_sigma: float = 0.5,
+                 error_rate: float = 0.0, throttle_rate: float = 0.0,
+                 max_concurrency: int = 0, seed: Optional[int] = None):
+        self.latency_ms = latency_ms
+        self.latency_sigma = latency_sigma
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.max_concurrency = max_concurrency
+        self.rng = random.Random(seed)
+        self.lock = threading.Lock()
+        self.active = 0
+        self.stats = {"requests": 0, "ok": 0, "errors": 0, "throttled": 0}
+        self.prompt_calls: Dict[str, int] = {}
+
+    def reply_rng(self, prompt: str) -> random.Random:
+        """Per-prompt randomness: repeated prompts vary call to call, but identically on every run"""
+        digest = hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+        with self.lock:
+            call = self.prompt_calls.get(digest, 0)
+            self.prompt_calls[digest] = call + 1
+        return random.Random(f"{digest}:{call}")
+
+    def sample_latency(self) -> float:
+        """Log-normal latency in seconds with median `latency_ms`"""
+        if self.latency_ms <= 0:
+            return 0.0
+        with self.lock:
+            z = self.rng.gauss(0, 1)
+        return self.latency_ms / 1000.0 * math.exp(self.latency_sigma * z)
+
+    def roll(self, rate: float) -> bool:
+        if rate <= 0:
+            return False
+        with self.lock:
+            return self.rng.random() < rate
+
+
+def _field(prompt: str, name: str) -> str:
+    match = re.search(rf"{name}:\s*(.+)", prompt)
+    return match.group(1).strip() if match else ""
+
+
+def reply_questions(prompt: str, rng: random.Random) -> str:
+    skills = [s.strip() for s in _field(prompt, "Key skills").split(",") if s.strip()] or \
+        [_field(prompt, "Domain") or "your stack"]
+    focus = _field(prompt, "Focus on") or "best practices"
+    templates = rng.sample(QUESTION_TEMPLATES, 5)
+    lines = [
+        f"{i}. " + template.format(skill=rng.choice(skills), focus=focus)
+        for i, template in enumerate(templates, 1)
+    ]
+    return "\n".join(lines)
+
+
+def reply_evaluation(prompt: str, rng: random.Random) -> str:
+    answer = prompt.split("Answer:", 1)[-1].split("Score on a scale", 1)[0]
+    words = len(answer.split())
+    base = 4 if words < 30 else 6 if words < 80 else 7
+    scores = [max(1, min(10, base + rng.randint(-1, 2))) for _ in range(5)]
+    labels = ["Technical Accuracy", "Completeness", "Clarity", "Depth", "Practicality"]
+    lines = [f"{label}: {score}" for label, score in zip(labels, scores)]
+    lines.append(f"Overall: {sum(scores) / len(scores):.1f}")
+    lines.append("Strengths: Clear structure and relevant terminology")
+    lines.append("Weaknesses: Could include a concrete production example")
+    return "\n".join(lines)
+
+
+def reply_intro(prompt: str, rng: random.Random) -> str:
+    response = prompt.split("Response:", 1)[-1].split("Evaluation guidelines", 1)[0]
+    skills = re.findall(r"\b(Python|Java|React|AWS|Docker|Kubernetes|SQL|Node\.js|TypeScript|Django)\b", response)
+    skills = list(dict.fromkeys(skills)) or ["Python", "SQL"]
+    return "\n".join([
+        f"Experience Level: {rng.choice(INTRO_LEVELS)}",
+        "Primary Technical Area: backend",
+        f"Confidence: {rng.choice(['medium', 'high'])}",
+        "Communication: adequate",
+        f"Projects Mentioned: {rng.randint(0, 3)}",
+        f"Skills: {', '.join(skills)}"
+    ])
+
+
+def reply_summary(prompt: str, rng: random.Random) -> str:
+    return ("The candidate showed a solid grasp of fundamentals and communicated clearly. "
+            "Answers would benefit from more concrete examples from production work.")
+
+
+def build_reply(messages: List[Dict], rng_for=None) -> str:
+    """Pick a canned reply matching the prompt the app sent"""
+    prompt = "\n".join(str(m.get("content", "")) for m in messages)
+    rng = rng_for(prompt) if rng_for else random.Random(prompt)
+    if "fundamental questions" in prompt:
+        return reply_questions(prompt, rng)
+    if "Evaluate this technical interview answer" in prompt:
+        return reply_evaluation(prompt, rng)
+    if "interview performance" in prompt or "interview feedback" in prompt:
+        return reply_summary(prompt, rng)
+    if "introduction" in prompt and "Analyze" in prompt:
+        return reply_intro(prompt, rng)
+    return "This is a mock response."
+
+
+def make_handler(settings: MockSettings):
+    class MockHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def _send(self, status: int, body: Dict, headers: Optional[Dict] = None):
+            data = json.dumps(body).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            for key, value in (headers or {}).items():
+                self.send_header(key, value)
+            self.end_headers()
+            self.wfile.write(data)
+
+        def do_POST(self):
+            length = int(self.headers.get("Content-Length", 0))
+            try:
+                body = json.loads(self.rfile.read(length) or b"{}")
+            except ValueError:
+                self._send(400, {"error": {"message": "invalid JSON"}})
+                return
+
+            if not self.path.rstrip("/").endswith("/chat/completions"):
+                self._send(404, {"error": {"message": f"unknown path {self.path}"}})
+                return
+
+            with settings.lock:
+                settings.stats["requests"] += 1
+                settings.active += 1
+                over_capacity = settings.max_concurrency and settings.active > settings.max_concurrency
+            try:
+                if over_capacity or settings.roll(settings.throttle_rate):
+                    with settings.lock:
+                        settings.stats["throttled"] += 1
+                    self._send(429, {"error": {"message": "rate limit exceeded"}}, {"Retry-After": "1"})
+                    return
+
+                time.sleep(settings.sample_latency())
+
+                if settings.roll(settings.error_rate):
+                    with settings.lock:
+                        settings.stats["errors"] += 1
+                    self._send(500, {"error": {"message": "injected server error"}})
+                    return
+
+                content = build_reply(body.get("messages", []), settings.reply_rng)
+                with settings.lock:
+                    settings.stats["ok"] += 1
+                self._send(200, {
+                    "id": f"mock-{int(time.time() * 1000)}",
+                    "object": "chat.completion",
+                    "model": body.get("model", "mock"),
+                    "choices": [{
+                        "index": 0,
+                        "message": {"role": "assistant", "content": content},
+                        "finish_reason": "stop"
+                    }],
+                    "usage": {
+                        "prompt_tokens": len(json.dumps(body.get("messages", []))) // 4,
+                        "completion_tokens": len(content) // 4
+                    }
+                })
+            finally:
+                with settings.lock:
+                    settings.active -= 1
+
+        def do_GET(self):
+            if self.path.rstrip("/").endswith("/stats"):
+                with settings.lock:
+                    self._send(200, dict(settings.stats))
+            else:
+                self._send(404, {"error": {"message": "not found"}})
+
+        def log_message(self, *args):
+            pass
+
+    return MockHandler
+
+
+def start_mock_server(port: int = 0, settings: Optional[MockSettings] = None) -> Tuple[ThreadingHTTPServer, str]:
+    """Start the server on a daemon thread; returns (server, base_url)"""
+    server = ThreadingHTTPServer(("127.0.0.1", port), make_handler(settings or MockSettings()))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="mock-llm", daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}/v1"
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Local OpenAI-compatible mock LLM server")
+    parser.add_argument("--port", type=int, default=8099)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="median response latency")
+    parser.add_argument("--latency-sigma", type=float, default=0.5,
+                        help="log-normal spread of the latency (0 = constant)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of requests answered with HTTP 500")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="fraction of requests answered with HTTP 429")
+    parser.add_argument("--max-concurrency", type=int, default=0,
+                        help="answer 429 above this many in-flight requests (0 = unlimited)")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    settings = MockSettings(args.latency_ms, args.latency_sigma, args.error_rate,
+                            args.throttle_rate, args.max_concurrency, args.seed)
+    server = ThreadingHTTPServer(("127.0.0.1", args.port), make_handler(settings))
+    print(f"Mock LLM server listening on http://127.0.0.1:{args.port}/v1")
+    print(f"Use: LLM_BASE_URL=http://127.0.0.1:{args.port}/v1")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print(f"\nStats: {settings.stats}")
@@ -1,4 +1,4 @@
-from sqlalchemy import create_engine, Column, Integer, String, DateTime, ForeignKey, Float
+from sqlalchemy import create_engine, Column, Integer, String, DateTime, ForeignKey, Float, Text, Index, JSON
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, relationship
 from datetime import datetime
@@ -26,6 +26,91 @@ class Report(Base):
     
     user = relationship("User", back_populates="reports")
 
+class EvaluationCacheEntry(Base):
+    __tablename__ = 'evaluation_cache'
+    
+    key = Column(String, primary_key=True)  # sha256 of normalized question/answer/model/prompt version
+    model = Column(String, nullable=False)
+    prompt_version = Column(String, nullable=False)
+    payload = Column(Text, nullable=False)  # JSON evaluation dict
+    size_bytes = Column(Integer, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    last_used_at = Column(DateTime, default=datetime.utcnow, index=True)
+
+class QuestionBankEntry(Base):
+    __tablename__ = 'question_bank'
+    
+    id = Column(Integer, primary_key=True)
+    skill_category = Column(String, nullable=False)
+    candidate_level = Column(String, nullable=False)
+    focus_area = Column(String, nullable=False)
+    question = Column(Text, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    
+    __table_args__ = (
+        Index('ix_question_bank_bucket', 'skill_category', 'candidate_level', 'focus_area'),
+    )
+
+class CircuitBreakerState(Base):
+    __tablename__ = 'circuit_breaker_state'
+    
+    name = Column(String, primary_key=True)  # one row per breaker, e.g. "llm"
+    state = Column(String, nullable=False)  # closed / open / half_open
+    consecutive_failures = Column(Integer, default=0)
+    total_trips = Column(Integer, default=0)
+    last_error = Column(Text)
+    opened_at = Column(DateTime)
+    updated_at = Column(DateTime, default=datetime.utcnow)
+
+class ResumeCacheEntry(Base):
+    __tablename__ = 'resume_cache'
+    
+    file_hash = Column(String, primary_key=True)  # sha256 of the uploaded file's bytes
+    parser_version = Column(String, nullable=False)
+    text = Column(Text, nullable=False)  # parse_resume output
+    profile_version = Column(String)  # intro prompt version + model the profile was built with
+    profile = Column(Text)  # JSON candidate profile
+    size_bytes = Column(Integer, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    last_used_at = Column(DateTime, default=datetime.utcnow, index=True)
+
+class IngestedResume(Base):
+    __tablename__ = 'ingested_resumes'
+    
+    file_hash = Column(String, primary_key=True)  # sha256 of the file's bytes
+    file_name = Column(String, nullable=False)
+    batch = Column(String, index=True)  # e.g. the job posting the resumes came from
+    skills = Column(Text)  # JSON list of detected skills
+    primary_skill = Column(String, index=True)
+    experience_level = Column(String)
+    intro_score = Column(Float)
+    profile = Column(Text)  # JSON candidate profile (None if LLM analysis was skipped)
+    error = Column(Text)
+    ingested_at = Column(DateTime, default=datetime.utcnow)
+
+class InterviewReport(Base):
+    __tablename__ = 'interview_reports'
+    
+    id = Column(Integer, primary_key=True)
+    report_id = Column(String, unique=True, nullable=False)  # e.g. INT20240601120000 plus a random suffix
+    filename = Column(String, nullable=False)  # JSON file in interview_reports/
+    user_id = Column(Integer, ForeignKey('users.id'))
+    created_at = Column(DateTime, index=True)  # parsed report timestamp (naive local time)
+    overall_score = Column(Float, index=True)
+    final_score = Column(Float)
+    status = Column(String, index=True)  # Selected / Conditional / Rejected
+    primary_skill = Column(String, index=True)
+    experience_level = Column(String, index=True)
+    question_count = Column(Integer)
+    intro_score = Column(Float)
+    confidence = Column(String)
+    communication = Column(String)
+    payload = Column(JSON, nullable=False)  # the full report as saved to the JSON file
+
+    __table_args__ = (
+        Index('ix_interview_reports_status_created', 'status', 'created_at'),
+    )
+
 # Database setup
 DATABASE_URL = "sqlite:///hr_app.db"
 engine = create_engine(DATABASE_URL)
@@ -0,0 +1,123 @@
+# moderation.py
+import json
+import os
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from config import ABUSIVE_KEYWORDS, TERMINATION_KEYWORDS, MODERATION_KEYWORDS_FILE
+from keyword_matcher import AhoCorasick
+
+# Reason codes, highest priority first
+MISCONDUCT = "misconduct"
+CANDIDATE_REQUEST = "candidate_request"
+
+
+def default_rules() -> Dict[str, List[str]]:
+    """Moderation phrase lists from config"""
+    return {
+        MISCONDUCT: list(ABUSIVE_KEYWORDS),
+        CANDIDATE_REQUEST: list(TERMINATION_KEYWORDS)
+    }
+
+
+class _CompiledRules:
+    """Immutable snapshot of the rules; swapped as a whole on update"""
+
+    def __init__(self, rules: Dict[str, Iterable[str]]):
+        self.rules = {reason: tuple(phrases) for reason, phrases in rules.items()}
+        self.priority = {reason: i for i, reason in enumerate(self.rules)}
+        self.automaton = AhoCorasick(
+            (phrase for phrases in self.rules.values() for phrase in phrases),
+            word_boundary=True
+        )
+        self.pattern_reason: Dict[int, str] = {}
+        for reason, phrases in self.rules.items():
+            for phrase in phrases:
+                key = phrase.lower()
+                if not key:
+                    continue
+                pattern_id = self.automaton.pattern_index[key]
+                # A phrase listed under several reasons reports the highest-priority one
+                self.pattern_reason.setdefault(pattern_id, reason)
+
+
+class ModerationEngine:
+    """Whole-word phrase matcher that maps a response to a termination reason code.
+
+    All phrase lists are compiled into one automaton, so checking an answer is
+    a single pass regardless of list sizes. Lists can be replaced at runtime
+    (update_keywords / MODERATION_KEYWORDS_FILE) without restarting the app.
+    """
+
+    def __init__(self, rules: Optional[Dict[str, Iterable[str]]] = None,
+                 keywords_file: str = MODERATION_KEYWORDS_FILE):
+        self.keywords_file = keywords_file
+        self._file_mtime = None
+        self._lock = threading.Lock()
+        self._compiled = _CompiledRules(rules or default_rules())
+        self.reload_if_changed()
+
+    @property
+    def rules(self) -> Dict[str, Tuple[str, ...]]:
+        return dict(self._compiled.rules)
+
+    def update_keywords(self, reason: str, phrases: Iterable[str]):
+        """Replace the phrase list for one reason code"""
+        with self._lock:
+            rules = dict(self._compiled.rules)
+            rules[reason] = tuple(phrases)
+            self._compiled = _CompiledRules(rules)
+
+    def set_rules(self, rules: Dict[str, Iterable[str]]):
+        """Replace every phrase list at once (dict order is reason priority)"""
+        with self._lock:
+            self._compiled = _CompiledRules(rules)
+
+    def reload_if_changed(self):
+        """Recompile from MODERATION_KEYWORDS_FILE when it has been edited"""
+        if not self.keywords_file:
+            return
+        try:
+            mtime = os.path.getmtime(self.keywords_file)
+        except OSError:
+            return
+        if mtime == self._file_mtime:
+            return
+
+        try:
+            with open(self.keywords_file, "r", encoding="utf-8") as f:
+                overrides = json.load(f)
+            rules = default_rules()
+            rules.update({reason: list(phrases) for reason, phrases in overrides.items()})
+            self.set_rules(rules)
+            print(f"🔄 Moderation keywords reloaded from {self.keywords_file}")
+        except Exception as e:
+            print(f"⚠️ Could not load moderation keywords: {e}")
+        self._file_mtime = mtime
+
+    def check(self, text: str) -> Optional[Tuple[str, str]]:
+        """Return (reason, matched phrase) for the highest-priority match, or None"""
+        self.reload_if_changed()
+        compiled = self._compiled
+        best = None
+        for _, pattern_id in compiled.automaton.iter_matches(text or ""):
+            reason = compiled.pattern_reason[pattern_id]
+            if best is None or compiled.priority[reason] < compiled.priority[best[0]]:
+                best = (reason, compiled.automaton.patterns[pattern_id])
+                if compiled.priority[reason] == 0:
+                    break
+        return best
+
+
+_engine: Optional[ModerationEngine] = None
+_engine_lock = threading.Lock()
+
+
+def get_moderation_engine() -> ModerationEngine:
+    """Return the process-wide moderation engine"""
+    global _engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                _engine = ModerationEngine()
+    return _engine
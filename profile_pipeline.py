@@ -0,0 +1,188 @@
+# profile_pipeline.py
+from concurrent.futures import Future
+from typing import Dict, List, Optional, Tuple
+
+from config import QUESTION_BANK_FOCUS_AREAS
+from llm_client import get_executor
+from question_generator import QUESTIONS_PER_SET
+from resume_cache import get_resume_cache
+from response_analyzer import INTRO_PROMPT_VERSION
+from skill_mapper import map_skills_to_category
+from utils import extract_skills
+
+# Level assumed for the speculative question reservation before the LLM answers
+SPECULATIVE_LEVEL = "mid"
+
+
+def technical_fallbacks(locked_skill: str) -> List[str]:
+    """Generic technical questions used to top up a short question set"""
+    return [
+        f"Explain a core concept in {locked_skill}.",
+        f"Describe a real-world problem you solved using {locked_skill}.",
+        f"What challenges do you face when working in {locked_skill}?",
+        f"How do you handle performance optimization in {locked_skill}?",
+        f"Describe a time you had to debug a complex {locked_skill} issue.",
+        f"What are the key differences between versions of {locked_skill}?"
+    ]
+
+
+def pad_technical_questions(technical_questions: List[str], locked_skill: str, needed: int) -> List[str]:
+    """Ensure we have enough technical questions"""
+    technical_questions = list(technical_questions or [])
+    if len(technical_questions) < needed:
+        print(f"⚠️ Generated {len(technical_questions)} questions, need {needed}. Adding fallbacks.")
+        for q in technical_fallbacks(locked_skill):
+            if len(technical_questions) >= needed:
+                break
+            if q not in technical_questions:
+                technical_questions.append(q)
+    return technical_questions
+
+
+def profile_version(analyzer) -> str:
+    """Cache version of a candidate profile: intro prompt version + model"""
+    return f"{INTRO_PROMPT_VERSION}:{analyzer.llm.model}"
+
+
+def analyze_candidate(candidate_text: str, analyzer) -> Tuple[Dict, bool]:
+    """Run the LLM introduction analysis and lock the skill; returns (profile, from_fallback)"""
+    analysis = analyzer.analyze_introduction(candidate_text)
+    detected_skills = analysis.get("skills", [])
+
+    # 🔒 LOCK SKILL USING CONFIG
+    locked_skill = map_skills_to_category(detected_skills)
+
+    candidate_profile = {
+        "skills": detected_skills,
+        "experience_level": analysis.get("experience", "mid"),
+        "primary_skill": locked_skill,
+        "confidence": analysis.get("confidence", "medium"),
+        "communication": analysis.get("communication", "adequate"),
+        "intro_score": analysis.get("intro_score", 5),
+    }
+    return candidate_profile, analysis.get("fallback", False)
+
+
+def bank_unused_questions(question_generator, live_future: Future, skill_category: str,
+                          candidate_level: str, focus_area: str):
+    """Once a speculative live generation finishes, keep its questions in the bank"""
+    def deposit(future: Future):
+        if not future.cancelled() and future.exception() is None:
+            question_generator.question_bank.deposit(skill_category, candidate_level, focus_area, future.result())
+    live_future.add_done_callback(deposit)
+
+
+def build_interview_plan(
+    candidate_text: str,
+    analyzer,
+    question_generator,
+    total_questions: int,
+    generate_questions: bool = True,
+    resume_hash: Optional[str] = None
+) -> Tuple[Dict, List[str]]:
+    """
+    Analyze an introduction/resume and prepare the interview questions.
+
+    While the LLM analyzes the text, questions for the locally detected
+    skill lock are reserved from the bank (not consumed), and if the bank
+    is short a live set for that skill is generated at the same time. They
+    are used if the LLM's profile lands on the same (skill, level);
+    otherwise the reservation is put back and the live set is banked.
+    With `resume_hash`, a profile cached for the same file is reused and
+    a fresh LLM profile is cached.
+    Returns (candidate_profile, questions).
+    """
+    cache = get_resume_cache() if resume_hash else None
+    version = profile_version(analyzer)
+    candidate_profile = cache.get_profile(resume_hash, version) if cache else None
+    if candidate_profile is not None:
+        if not generate_questions:
+            return candidate_profile, []
+        technical_questions = question_generator.generate_initial_skill_questions(
+            skill_category=candidate_profile["primary_skill"],
+            candidate_level=candidate_profile["experience_level"]
+        )
+        return candidate_profile, finish_questions(
+            technical_questions, candidate_profile, question_generator, total_questions
+        )
+
+    executor = get_executor()
+    analysis_future = executor.submit(analyze_candidate, candidate_text, analyzer)
+
+    # 🔒 Local skill lock is known before the LLM returns
+    speculative_skill = map_skills_to_category(extract_skills(candidate_text))
+    reservation = None
+    live_future = None
+    if generate_questions:
+        reservation = question_generator.question_bank.reserve(
+            speculative_skill, SPECULATIVE_LEVEL, QUESTIONS_PER_SET, rng=question_generator.rng
+        )
+        if reservation is None or len(reservation.rows) < QUESTIONS_PER_SET:
+            # Bank is short: generate the rest alongside the analysis instead of after it
+            live_focus = question_generator.rng.choice(QUESTION_BANK_FOCUS_AREAS)
+            live_future = executor.submit(
+                question_generator.generate_live_questions, speculative_skill, SPECULATIVE_LEVEL, live_focus
+            )
+
+    try:
+        candidate_profile, from_fallback = analysis_future.result()
+    except Exception:
+        if reservation:
+            question_generator.question_bank.release(reservation)
+        if live_future:
+            bank_unused_questions(question_generator, live_future, speculative_skill, SPECULATIVE_LEVEL, live_focus)
+        raise
+
+    locked_skill = candidate_profile["primary_skill"]
+    if cache and not from_fallback:
+        cache.put_profile(resume_hash, version, candidate_profile)
+
+    if not generate_questions:
+        return candidate_profile, []
+
+    # Reconcile the speculative questions with the LLM's profile
+    banked = live = None
+    if (locked_skill, candidate_profile["experience_level"]) == (speculative_skill, SPECULATIVE_LEVEL):
+        if reservation:
+            question_generator.question_bank.commit(reservation)
+            banked = reservation.questions
+        else:
+            # Nothing banked for this skill yet; the live set below stands in for a draw
+            banked = []
+            question_generator.question_bank.request_refill(speculative_skill, SPECULATIVE_LEVEL, live_focus)
+        if live_future:
+            try:
+                live = live_future.result()
+            except Exception as e:
+                print(f"⚠️ Speculative question generation failed: {e}")
+    else:
+        if reservation:
+            question_generator.question_bank.release(reservation)
+        if live_future:
+            bank_unused_questions(question_generator, live_future, speculative_skill, SPECULATIVE_LEVEL, live_focus)
+    technical_questions = question_generator.generate_initial_skill_questions(
+        skill_category=locked_skill,
+        candidate_level=candidate_profile["experience_level"],
+        banked=banked,
+        live=live
+    )
+
+    return candidate_profile, finish_questions(
+        technical_questions, candidate_profile, question_generator, total_questions
+    )
+
+
+def finish_questions(technical_questions: List[str], candidate_profile: Dict,
+                     question_generator, total_questions: int) -> List[str]:
+    """Pad the technical questions and append the behavioral question"""
+    num_technical_needed = total_questions - 1
+    technical_questions = pad_technical_questions(
+        technical_questions, candidate_profile["primary_skill"], num_technical_needed
+    )
+
+    # Behavioral LAST
+    behavioral_question = question_generator.generate_behavioral_question_ai(
+        candidate_background=candidate_profile
+    )
+
+    return technical_questions[:num_technical_needed] + [behavioral_question]
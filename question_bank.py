@@ -0,0 +1,269 @@
+# question_bank.py
+import queue
+import random
+import threading
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+
+from config import (
+    QUESTION_BANK_FOCUS_AREAS, QUESTION_BANK_LOW_WATERMARK, QUESTION_BANK_TARGET,
+    QUESTION_BANK_MAX_PENDING_REFILLS
+)
+from models import Base, SessionLocal, QuestionBankEntry, engine
+
+Bucket = Tuple[str, str, str]  # (skill_category, candidate_level, focus_area)
+
+# Live generation calls allowed per bucket fill before giving up
+MAX_FILL_ATTEMPTS = 10
+
+
+@dataclass
+class Reservation:
+    """Questions taken out of a bucket but not yet consumed"""
+    bucket: Bucket
+    rows: List[Tuple[int, str]]
+
+    @property
+    def questions(self) -> List[str]:
+        return [question for _, question in self.rows]
+
+
+class QuestionBank:
+    """Pre-generated technical questions indexed by (category, level, focus area).
+
+    The whole bank is held in memory so drawing a question set is a dict lookup;
+    consumed rows are deleted and low buckets refilled by a background worker.
+    """
+
+    def __init__(self):
+        self._buckets: Dict[Bucket, List[Tuple[int, str]]] = {}
+        self._lock = threading.Lock()
+        self._generate: Optional[Callable[[str, str, str], List[str]]] = None
+        self._jobs = queue.Queue()
+        self._pending = set()
+        self._worker = None
+        self._load()
+
+    def _load(self):
+        """Load every stored question into memory"""
+        try:
+            Base.metadata.create_all(bind=engine, tables=[QuestionBankEntry.__table__])
+            db = SessionLocal()
+            try:
+                rows = db.query(
+                    QuestionBankEntry.id,
+                    QuestionBankEntry.skill_category,
+                    QuestionBankEntry.candidate_level,
+                    QuestionBankEntry.focus_area,
+                    QuestionBankEntry.question
+                ).all()
+            finally:
+                db.close()
+        except Exception as e:
+            print(f"⚠️ Question bank unavailable: {e}")
+            return
+
+        with self._lock:
+            for row_id, category, level, focus, question in rows:
+                self._buckets.setdefault((category, level, focus), []).append((row_id, question))
+
+    def set_generator(self, generate: Callable[[str, str, str], List[str]]):
+        """Register the live generator used to fill buckets"""
+        self._generate = generate
+
+    def size(self, skill_category: str, candidate_level: str, focus_area: str) -> int:
+        with self._lock:
+            return len(self._buckets.get((skill_category, candidate_level, focus_area), []))
+
+    def _take(self, skill_category: str, candidate_level: str, count: int,
+              rng) -> Optional[Tuple[Bucket, List[Tuple[int, str]]]]:
+        """Remove up to `count` rows from one focus-area bucket in memory (the DB rows stay)"""
+        with self._lock:
+            candidates = [
+                focus for focus in QUESTION_BANK_FOCUS_AREAS
+                if self._buckets.get((skill_category, candidate_level, focus))
+            ]
+            if not candidates:
+                return None
+            full = [f for f in candidates
+                    if len(self._buckets[(skill_category, candidate_level, f)]) >= count]
+            focus = rng.choice(full or candidates)
+            bucket_key = (skill_category, candidate_level, focus)
+            bucket = self._buckets[bucket_key]
+            picked = rng.sample(range(len(bucket)), min(count, len(bucket)))
+            picked_set = set(picked)
+            self._buckets[bucket_key] = [q for i, q in enumerate(bucket) if i not in picked_set]
+            return bucket_key, [bucket[i] for i in picked]
+
+    def draw(self, skill_category: str, candidate_level: str, count: int = 5,
+             rng: Optional[random.Random] = None) -> Optional[List[str]]:
+        """
+        Take up to `count` questions from one focus-area bucket, or None if
+        the bank is empty for this category and level. A short bucket gives
+        a short list; callers top it up with live generation.
+        """
+        rng = rng or random
+        taken = self._take(skill_category, candidate_level, count, rng)
+        if taken is None:
+            # Start with one bucket; the others fill as later draws find them empty
+            self.request_refill(skill_category, candidate_level, rng.choice(QUESTION_BANK_FOCUS_AREAS))
+            return None
+        reservation = Reservation(*taken)
+        self.commit(reservation)
+        return reservation.questions
+
+    def reserve(self, skill_category: str, candidate_level: str, count: int = 5,
+                rng: Optional[random.Random] = None) -> Optional["Reservation"]:
+        """
+        Hold questions for a guess without consuming them or triggering
+        refills; finish with commit() or release(). None if the bank is empty.
+        """
+        taken = self._take(skill_category, candidate_level, count, rng or random)
+        return Reservation(*taken) if taken else None
+
+    def commit(self, reservation: "Reservation"):
+        """Consume reserved questions (and refill their bucket if it ran low)"""
+        self._submit(("consume", [row_id for row_id, _ in reservation.rows]))
+        with self._lock:
+            remaining = len(self._buckets.get(reservation.bucket, []))
+        if remaining < QUESTION_BANK_LOW_WATERMARK:
+            self.request_refill(*reservation.bucket)
+
+    def release(self, reservation: "Reservation"):
+        """Return reserved questions to their bucket"""
+        with self._lock:
+            self._buckets.setdefault(reservation.bucket, []).extend(reservation.rows)
+
+    def deposit(self, skill_category: str, candidate_level: str, focus_area: str, questions: List[str]):
+        """Store live-generated questions that went unused (in the background, up to the bucket target)"""
+        if questions:
+            self._submit(("store", ((skill_category, candidate_level, focus_area), questions)))
+
+    def _deposit(self, bucket_key: Bucket, questions: List[str]):
+        with self._lock:
+            existing = {q.lower() for _, q in self._buckets.get(bucket_key, [])}
+        fresh = []
+        for question in questions:
+            if question.lower() not in existing:
+                existing.add(question.lower())
+                fresh.append(question)
+        room = QUESTION_BANK_TARGET - (len(existing) - len(fresh))
+        if fresh and room > 0:
+            self._store(bucket_key, fresh[:room])
+
+    def request_refill(self, skill_category: str, candidate_level: str, focus_area: str):
+        """
+        Queue a background refill for a bucket (deduplicated). At most
+        QUESTION_BANK_MAX_PENDING_REFILLS are queued so refills, which share
+        the LLM rate limit with live interviews, never build up a backlog.
+        """
+        bucket_key = (skill_category, candidate_level, focus_area)
+        with self._lock:
+            if self._generate is None or bucket_key in self._pending:
+                return
+            if len(self._pending) >= QUESTION_BANK_MAX_PENDING_REFILLS:
+                return
+            self._pending.add(bucket_key)
+        self._submit(("refill", bucket_key))
+
+    def fill_bucket(self, skill_category: str, candidate_level: str, focus_area: str,
+                    target: int = QUESTION_BANK_TARGET) -> int:
+        """Generate questions until the bucket holds `target`; returns how many were added"""
+        if self._generate is None:
+            raise RuntimeError("No question generator registered")
+
+        bucket_key = (skill_category, candidate_level, focus_area)
+        added = 0
+        for _ in range(MAX_FILL_ATTEMPTS):
+            with self._lock:
+                existing = {q.lower() for _, q in self._buckets.get(bucket_key, [])}
+            missing = target - len(existing)
+            if missing <= 0:
+                break
+
+            try:
+                generated = self._generate(skill_category, candidate_level, focus_area)
+            except Exception as e:
+                print(f"⚠️ Question bank refill failed for {bucket_key}: {e}")
+                break
+
+            fresh = []
+            for question in generated:
+                if question.lower() not in existing:
+                    existing.add(question.lower())
+                    fresh.append(question)
+            if not fresh:
+                break
+            self._store(bucket_key, fresh[:missing])
+            added += len(fresh[:missing])
+        return added
+
+    def _store(self, bucket_key: Bucket, questions: List[str]):
+        skill_category, candidate_level, focus_area = bucket_key
+        db = SessionLocal()
+        try:
+            entries = [
+                QuestionBankEntry(
+                    skill_category=skill_category,
+                    candidate_level=candidate_level,
+                    focus_area=focus_area,
+                    question=question
+                )
+                for question in questions
+            ]
+            db.add_all(entries)
+            db.commit()
+            stored = [(entry.id, entry.question) for entry in entries]
+        finally:
+            db.close()
+
+        with self._lock:
+            self._buckets.setdefault(bucket_key, []).extend(stored)
+
+    def _consume(self, row_ids: List[int]):
+        db = SessionLocal()
+        try:
+            db.query(QuestionBankEntry).filter(QuestionBankEntry.id.in_(row_ids)) \
+                .delete(synchronize_session=False)
+            db.commit()
+        finally:
+            db.close()
+
+    def _submit(self, job):
+        with self._lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(target=self._run, name="question-bank", daemon=True)
+                self._worker.start()
+        self._jobs.put(job)
+
+    def _run(self):
+        while True:
+            kind, arg = self._jobs.get()
+            try:
+                if kind == "consume":
+                    self._consume(arg)
+                elif kind == "refill":
+                    self.fill_bucket(*arg)
+                elif kind == "store":
+                    self._deposit(*arg)
+            except Exception as e:
+                print(f"⚠️ Question bank job {kind} failed: {e}")
+            finally:
+                if kind == "refill":
+                    with self._lock:
+                        self._pending.discard(arg)
+                self._jobs.task_done()
+
+
+_bank: Optional[QuestionBank] = None
+_bank_lock = threading.Lock()
+
+
+def get_question_bank() -> QuestionBank:
+    """Return the process-wide question bank"""
+    global _bank
+    if _bank is None:
+        with _bank_lock:
+            if _bank is None:
+                _bank = QuestionBank()
+    return _bank
@@ -1,12 +1,21 @@
-import openai
 import random
-from typing import List, Dict
-from config import SKILL_CATEGORIES, OPENROUTER_API_KEY, OPENROUTER_BASE_URL, MODEL_NAME
+import re
+from typing import List, Dict, Optional
+from config import SKILL_CATEGORIES, QUESTION_BANK_FOCUS_AREAS, INTERVIEW_SEED
+from llm_client import get_llm_client
+from question_bank import get_question_bank
+from token_budget import output_budget
+
+# Technical questions per interview plan
+QUESTIONS_PER_SET = 5
 
 class QuestionGenerator:
     def __init__(self):
-        openai.api_key = OPENROUTER_API_KEY
-        openai.api_base = OPENROUTER_BASE_URL
+        self.llm = get_llm_client()
+        self.question_bank = get_question_bank()
+        self.question_bank.set_generator(self.generate_live_questions)
+        # Seeded for repeatable runs (INTERVIEW_SEED, e.g. with a replayed LLM cassette)
+        self.rng = random.Random(INTERVIEW_SEED) if INTERVIEW_SEED is not None else random
 
     # 1️⃣ FIRST QUESTION (GENERIC)
     def generate_general_intro_question(self) -> str:
@@ -17,8 +26,35 @@ class QuestionGenerator:
 
     # 2️⃣ TECHNICAL QUESTIONS (CATEGORY LOCKED)
     def generate_initial_skill_questions(
-        self, skill_category: str, candidate_level: str = "mid"
+        self, skill_category: str, candidate_level: str = "mid", banked: Optional[List[str]] = None,
+        live: Optional[List[str]] = None
+    ) -> List[str]:
+        """
+        Question set from the bank (or `banked`, already taken from it),
+        topped up when short from `live` if given, else a live generation.
+        """
+
+        # Pre-generated bank first; live generation when the bucket is empty or short
+        if banked is None:
+            banked = self.question_bank.draw(skill_category, candidate_level, QUESTIONS_PER_SET, rng=self.rng)
+        banked = banked or []
+        if len(banked) >= QUESTIONS_PER_SET:
+            return banked
+
+        if live is None:
+            try:
+                live = self.generate_live_questions(
+                    skill_category, candidate_level, self.rng.choice(QUESTION_BANK_FOCUS_AREAS)
+                )
+            except Exception:
+                return banked or self._fallback(skill_category)
+        seen = {q.lower() for q in banked}
+        return banked + [q for q in live if q.lower() not in seen][:QUESTIONS_PER_SET - len(banked)]
+
+    def generate_live_questions(
+        self, skill_category: str, candidate_level: str, focus_area: str
     ) -> List[str]:
+        """Generate a fresh question set with the LLM (raises on failure)"""
 
         skills = SKILL_CATEGORIES.get(skill_category, [])
         skills_text = ", ".join(skills[:6]) if skills else skill_category
@@ -38,28 +74,22 @@ class QuestionGenerator:
         Each must be strictly related to the domain.
         
         IMPORTANT: Vary the questions. Do not use the same standard questions every time.
-        Focus on: {random.choice(['performance and optimization', 'security and best practices', 'architecture and design', 'debugging and troubleshooting', 'modern features and updates'])}
+        Focus on: {focus_area}
         """
 
-        try:
-            res = openai.ChatCompletion.create(
-                model=MODEL_NAME,
-                messages=[{"role": "user", "content": prompt}],
-                temperature=0.9, # Increased for variance
-                max_tokens=250
-            )
+        content = self.llm.chat(
+            messages=[{"role": "user", "content": prompt}],
+            temperature=0.9, # Increased for variance
+            max_tokens=output_budget("questions")
+        )
 
-            import re
-            # Clean up leading numbers (1. Question -> Question)
-            cleaned_questions = []
-            for q in [x for x in res.choices[0].message.content.split("\n") if x.strip().endswith("?")]:
-                cleaned = re.sub(r'^\d+[\.\)]\s*', '', q.strip())
-                cleaned_questions.append(cleaned)
-            
-            return cleaned_questions[:5] # Ensure max 5
-
-        except Exception:
-            return self._fallback(skill_category)
+        # Clean up leading numbers (1. Question -> Question)
+        cleaned_questions = []
+        for q in [x for x in content.split("\n") if x.strip().endswith("?")]:
+            cleaned = re.sub(r'^\d+[\.\)]\s*', '', q.strip())
+            cleaned_questions.append(cleaned)
+        
+        return cleaned_questions[:5] # Ensure max 5
 
     def generate_behavioral_question_ai(
         self,
@@ -0,0 +1,159 @@
+# rate_limiter.py
+import asyncio
+import threading
+import time
+from typing import Dict, Optional
+
+from config import (
+    LLM_RPM_LIMIT, LLM_TPM_LIMIT, LLM_MIN_CONCURRENCY, LLM_MAX_CONCURRENCY, LLM_QUEUE_TIMEOUT
+)
+
+# Sleep slice while polling for a slot (bounds how late a waiter notices a freed slot)
+POLL_INTERVAL = 0.05
+
+
+class ThrottleTimeout(Exception):
+    """Raised when a caller waited longer than the queue timeout for a slot"""
+
+
+class TokenBucket:
+    """Classic token bucket refilled continuously at `per_minute` tokens/minute"""
+
+    def __init__(self, per_minute: float):
+        self.capacity = float(per_minute)
+        self.rate = per_minute / 60.0
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+
+    def _refill(self, now: float):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self, amount: float, now: float) -> float:
+        """Seconds until `amount` tokens are available (0 if available now)"""
+        self._refill(now)
+        amount = min(amount, self.capacity)
+        if self.tokens >= amount:
+            return 0.0
+        return (amount - self.tokens) / self.rate
+
+    def take(self, amount: float):
+        self.tokens -= min(amount, self.capacity)
+
+
+class LLMThrottle:
+    """Process-wide gate in front of every LLM call.
+
+    A call must get a request token (rpm), its estimated tokens (tpm) and a
+    slot in the AIMD concurrency window. The window grows by roughly one slot
+    per window of successful calls and halves on 429s/timeouts. Callers that
+    cannot proceed wait in line instead of failing, up to `queue_timeout`.
+    """
+
+    def __init__(
+        self,
+        rpm: int = LLM_RPM_LIMIT,
+        tpm: int = LLM_TPM_LIMIT,
+        min_window: int = LLM_MIN_CONCURRENCY,
+        max_window: int = LLM_MAX_CONCURRENCY,
+        queue_timeout: float = LLM_QUEUE_TIMEOUT
+    ):
+        self.requests = TokenBucket(rpm) if rpm > 0 else None
+        self.tokens = TokenBucket(tpm) if tpm > 0 else None
+        self.min_window = max(1, min_window)
+        self.max_window = max(self.min_window, max_window)
+        self.window = float(self.max_window)
+        self.queue_timeout = queue_timeout
+        self.in_flight = 0
+        self.waiting = 0
+        self.throttled = 0
+        self._last_decrease = float("-inf")
+        self._lock = threading.Lock()
+        self._slot_freed = threading.Condition(self._lock)
+
+    def _try_acquire(self, tokens: int) -> float:
+        """Take a slot if possible (lock held); returns 0 on success, else seconds to wait"""
+        if self.in_flight >= int(self.window):
+            return POLL_INTERVAL
+        now = time.monotonic()
+        wait = 0.0
+        if self.requests:
+            wait = max(wait, self.requests.wait_time(1, now))
+        if self.tokens:
+            wait = max(wait, self.tokens.wait_time(tokens, now))
+        if wait > 0:
+            return wait
+        if self.requests:
+            self.requests.take(1)
+        if self.tokens:
+            self.tokens.take(tokens)
+        self.in_flight += 1
+        return 0.0
+
+    def acquire(self, tokens: int, timeout: Optional[float] = None) -> float:
+        """Block until the call may proceed; returns the ticket to pass to release()"""
+        deadline = time.monotonic() + (self.queue_timeout if timeout is None else timeout)
+        with self._lock:
+            self.waiting += 1
+            try:
+                while True:
+                    wait = self._try_acquire(tokens)
+                    if wait == 0:
+                        return time.monotonic()
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise ThrottleTimeout("Timed out waiting for an LLM slot")
+                    self._slot_freed.wait(min(wait, remaining))
+            finally:
+                self.waiting -= 1
+
+    async def aacquire(self, tokens: int, timeout: Optional[float] = None) -> float:
+        """asyncio version of acquire() (never blocks the event loop)"""
+        deadline = time.monotonic() + (self.queue_timeout if timeout is None else timeout)
+        with self._lock:
+            self.waiting += 1
+        try:
+            while True:
+                with self._lock:
+                    wait = self._try_acquire(tokens)
+                if wait == 0:
+                    return time.monotonic()
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise ThrottleTimeout("Timed out waiting for an LLM slot")
+                await asyncio.sleep(min(wait, remaining, POLL_INTERVAL))
+        finally:
+            with self._lock:
+                self.waiting -= 1
+
+    def release(self, ticket: float, congested: bool = False):
+        """Give the slot back; congested=True for 429s and timeouts"""
+        with self._lock:
+            self.in_flight = max(0, self.in_flight - 1)
+            if congested:
+                self.throttled += 1
+                # Calls already in flight when we last backed off report the same congestion;
+                # only halve once per "round" of requests
+                if ticket >= self._last_decrease:
+                    self.window = max(float(self.min_window), self.window / 2)
+                    self._last_decrease = time.monotonic()
+            else:
+                self.window = min(float(self.max_window), self.window + 1.0 / self.window)
+            self._slot_freed.notify_all()
+
+    def metrics(self) -> Dict:
+        """Current queue depth, window size and bucket levels"""
+        with self._lock:
+            now = time.monotonic()
+            if self.requests:
+                self.requests._refill(now)
+            if self.tokens:
+                self.tokens._refill(now)
+            return {
+                "queue_depth": self.waiting,
+                "in_flight": self.in_flight,
+                "window": round(self.window, 2),
+                "throttled": self.throttled,
+                "requests_available": round(self.requests.tokens, 1) if self.requests else None,
+                "tokens_available": round(self.tokens.tokens) if self.tokens else None
+            }
@@ -0,0 +1,208 @@
+# report_charts.py
+import hashlib
+import json
+import threading
+from typing import Dict, Optional
+
+import plotly.graph_objects as go
+import plotly.io as pio
+from plotly.subplots import make_subplots
+
+from config import FIGURE_CACHE_BYTES, FIGURE_PREWARM_REPORTS
+from utils import ByteLRUCache
+
+
+def create_score_chart(report_data, chart_id="default"):
+    """Create visualization charts for a report with unique ID"""
+    if not report_data.get('question_evaluations'):
+        return None
+    
+    # Extract scores
+    question_scores = [e["evaluation"]["overall"] for e in report_data['question_evaluations']]
+    intro_score = report_data['candidate_profile'].get('intro_score', 0)
+    all_scores = [intro_score] + question_scores
+    
+    # Create figure with subplots
+    fig = make_subplots(
+        rows=2, cols=2,
+        subplot_titles=('Score Distribution', 'Category Breakdown', 
+                       'Score Trend', 'Performance Summary'),
+        specs=[[{'type': 'pie'}, {'type': 'bar'}],
+               [{'type': 'scatter'}, {'type': 'box'}]]
+    )
+    
+    # 1. Pie chart for score distribution
+    labels = ['Excellent (8-10)', 'Good (6-7)', 'Average (4-5)', 'Poor (0-3)']
+    values = [0, 0, 0, 0]
+    avg_score = sum(all_scores) / len(all_scores) if all_scores else 0
+    
+    if avg_score >= 8:
+        values[0] = 1
+    elif avg_score >= 6:
+        values[1] = 1
+    elif avg_score >= 4:
+        values[2] = 1
+    else:
+        values[3] = 1
+    
+    fig.add_trace(
+        go.Pie(labels=labels, values=values, hole=0.3,
+               marker_colors=['#10b981', '#3b82f6', '#f59e0b', '#ef4444'],
+               name=f"pie_{chart_id}"),
+        row=1, col=1
+    )
+    
+    # 2. Bar chart for category scores
+    if report_data['question_evaluations']:
+        categories = ['Technical', 'Completeness', 'Clarity', 'Depth', 'Practical']
+        category_keys = ['technical_accuracy', 'completeness', 'clarity', 'depth', 'practicality']
+        
+        category_scores = []
+        for key in category_keys:
+            scores = [e["evaluation"].get(key, 0) for e in report_data['question_evaluations']]
+            avg = sum(scores) / len(scores) if scores else 0
+            category_scores.append(avg)
+        
+        fig.add_trace(
+            go.Bar(x=categories, y=category_scores, marker_color='#4f46e5',
+                   text=[f'{score:.1f}' for score in category_scores],
+                   textposition='auto',
+                   name=f"bar_{chart_id}"),
+            row=1, col=2
+        )
+    
+    # 3. Line chart for score trend
+    question_numbers = list(range(1, len(question_scores) + 1))
+    fig.add_trace(
+        go.Scatter(x=question_numbers, y=question_scores, mode='lines+markers',
+                   name=f'line_{chart_id}', line=dict(color='#f59e0b', width=3),
+                   marker=dict(size=8)),
+        row=2, col=1
+    )
+    
+    # Add average line
+    if question_scores:
+        avg_line = [sum(question_scores)/len(question_scores)] * len(question_numbers)
+        fig.add_trace(
+            go.Scatter(x=question_numbers, y=avg_line, mode='lines',
+                       name=f'avg_{chart_id}', line=dict(color='#10b981', width=2, dash='dash')),
+            row=2, col=1
+        )
+    
+    # 4. Box plot for score distribution
+    if question_scores:
+        fig.add_trace(
+            go.Box(y=question_scores, name=f'box_{chart_id}', 
+                   marker_color='#3b82f6', boxmean=True),
+            row=2, col=2
+        )
+    
+    fig.update_layout(
+        height=600,
+        showlegend=False,
+        paper_bgcolor='white',
+        plot_bgcolor='white',
+        font=dict(color='#334155')
+    )
+    
+    # Update subplot titles
+    fig.update_annotations(font_size=14, font_color='#1e293b')
+    
+    return fig
+
+
+def chart_key(report_data: Dict) -> str:
+    """Stable id of a report (also used to name its traces)"""
+    return report_data.get('report_id') or report_data.get('filename', 'report')
+
+
+def chart_hash(report_data: Dict) -> str:
+    """Hash of the fields create_score_chart reads"""
+    inputs = {
+        "intro_score": report_data.get('candidate_profile', {}).get('intro_score', 0),
+        "scores": [e.get("evaluation", {}) for e in report_data.get('question_evaluations', [])]
+    }
+    return hashlib.sha256(json.dumps(inputs, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+class FigureCache:
+    """
+    Score charts keyed by report id in a byte-bounded LRU. Each entry
+    holds the figure JSON and the hash of the data it was drawn from, so a
+    report that changed on disk is redrawn. Every lookup rebuilds its own
+    Figure from the JSON, so sessions never share a mutable figure.
+    """
+
+    def __init__(self, max_bytes: int = FIGURE_CACHE_BYTES):
+        self.memory = ByteLRUCache(max_bytes)
+        self._lock = threading.Lock()
+        self._prewarm_version = None
+        self._prewarm_thread: Optional[threading.Thread] = None
+        self.hits = 0
+        self.misses = 0
+
+    def get_chart(self, report_data: Dict) -> Optional[go.Figure]:
+        """Cached score chart for a report, built on a miss (None if it has no answers)"""
+        key = chart_key(report_data)
+        digest = chart_hash(report_data)
+        entry = self.memory.get(key)
+        hit = entry is not None and entry[0] == digest
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+        if hit:
+            return pio.from_json(entry[1]) if entry[1] is not None else None
+
+        fig = create_score_chart(report_data, chart_id=key)
+        fig_json = pio.to_json(fig, validate=False) if fig is not None else None
+        self.memory.put(key, (digest, fig_json), len(fig_json) if fig_json is not None else len(digest))
+        return fig
+
+    def prewarm(self, manager, snapshot, limit: int = FIGURE_PREWARM_REPORTS):
+        """Draw the newest `limit` reports of a snapshot in a background thread (once per snapshot version)"""
+        with self._lock:
+            if self._prewarm_version == snapshot.version:
+                return
+            if self._prewarm_thread is not None and self._prewarm_thread.is_alive():
+                return  # the next rerun picks up the newer snapshot
+            self._prewarm_version = snapshot.version
+            report_pks = [row["id"] for row in snapshot.rows[:limit]]
+            self._prewarm_thread = threading.Thread(
+                target=self._prewarm, args=(manager, report_pks), name="figure-prewarm", daemon=True
+            )
+            self._prewarm_thread.start()
+
+    def _prewarm(self, manager, report_pks):
+        for report_pk in report_pks:
+            try:
+                report = manager.get_report(report_pk)
+                if report is not None:
+                    self.get_chart(report)
+            except Exception as e:
+                print(f"⚠️ Chart prewarm failed for report {report_pk}: {e}")
+
+    def stats(self) -> Dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "memory_entries": len(self.memory)
+            }
+
+
+_cache: Optional[FigureCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_figure_cache() -> FigureCache:
+    """Return the process-wide figure cache"""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = FigureCache()
+    return _cache
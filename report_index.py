@@ -0,0 +1,230 @@
+# report_index.py
+import os
+import queue
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime
+from functools import cached_property
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Set, Tuple
+
+import numpy as np
+import pandas as pd
+
+from config import REPORT_INDEX_DEBOUNCE
+from report_manager import ReportManager, ReportFilters, STATUS_OPTIONS
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:  # live updates are optional
+    FileSystemEventHandler = object
+    Observer = None
+
+
+def _newest_first(row: Mapping) -> Tuple:
+    return (row["created_at"] or datetime.min, row["id"])
+
+
+# Filtered views memoized per snapshot (one per distinct filter combination)
+FILTER_MEMO_SIZE = 32
+
+FRAME_COLUMNS = ["id", "filename", "created_at", "display_date_short", "status", "primary_skill",
+                 "experience_level", "overall_score", "intro_score", "question_count",
+                 "confidence", "communication"]
+
+
+@dataclass(frozen=True)
+class ReportSnapshot:
+    """Immutable view of every report summary; shared by all dashboard sessions"""
+    version: int = 0
+    rows: Tuple[Mapping, ...] = ()
+    by_filename: Mapping[str, Mapping] = field(default_factory=lambda: MappingProxyType({}))
+    _filtered: Dict = field(default_factory=OrderedDict, compare=False, repr=False)
+    _memo_lock: threading.Lock = field(default_factory=threading.Lock, compare=False, repr=False)
+
+    @classmethod
+    def build(cls, version: int, rows: List[Dict]) -> "ReportSnapshot":
+        frozen = [row if isinstance(row, MappingProxyType) else MappingProxyType(row) for row in rows]
+        frozen.sort(key=_newest_first, reverse=True)
+        return cls(version, tuple(frozen), MappingProxyType({row["filename"]: row for row in frozen}))
+
+    @cached_property
+    def frame(self) -> pd.DataFrame:
+        """Summary rows as typed columns; the index is the position in `rows`"""
+        frame = pd.DataFrame([{c: row[c] for c in FRAME_COLUMNS} for row in self.rows], columns=FRAME_COLUMNS)
+        return frame.astype({
+            "created_at": "datetime64[ns]",
+            "status": pd.CategoricalDtype(STATUS_OPTIONS),
+            "primary_skill": "category",
+            "experience_level": "category",
+            "overall_score": "float64",
+            "intro_score": "float64",
+            "question_count": "int64"
+        })
+
+    def _mask(self, filters: ReportFilters) -> np.ndarray:
+        frame = self.frame
+        mask = np.ones(len(frame), dtype=bool)
+        if filters.status and filters.status != 'All':
+            mask &= (frame["status"] == filters.status).to_numpy()
+        if filters.experience_levels is not None:
+            mask &= frame["experience_level"].isin(filters.experience_levels).to_numpy()
+        if filters.primary_skills is not None:
+            mask &= frame["primary_skill"].isin(filters.primary_skills).to_numpy()
+        if filters.score_range is not None:
+            mask &= frame["overall_score"].between(*filters.score_range).to_numpy()
+        if filters.date_range is not None:
+            start = pd.Timestamp(filters.date_range[0])
+            end = pd.Timestamp(filters.date_range[1]) + pd.Timedelta(days=1)
+            created = frame["created_at"]
+            # Reports without a timestamp are never hidden by the date filter
+            mask &= (created.isna() | ((created >= start) & (created < end))).to_numpy()
+        return mask
+
+    def filtered(self, filters: Optional[ReportFilters] = None) -> pd.DataFrame:
+        """Rows matching the filters, newest first; memoized, so treat the result as read-only"""
+        if filters is None:
+            return self.frame
+        with self._memo_lock:
+            if filters in self._filtered:
+                self._filtered.move_to_end(filters)
+                return self._filtered[filters]
+        result = self.frame[self._mask(filters)]
+        with self._memo_lock:
+            self._filtered[filters] = result
+            while len(self._filtered) > FILTER_MEMO_SIZE:
+                self._filtered.popitem(last=False)
+        return result
+
+    def query(self, filters: Optional[ReportFilters] = None,
+              offset: int = 0, limit: Optional[int] = None) -> List[Mapping]:
+        """Summary rows matching the filters, newest first"""
+        positions = self.filtered(filters).index[offset:None if limit is None else offset + limit]
+        return [self.rows[i] for i in positions]
+
+    def stats(self, filters: Optional[ReportFilters] = None) -> Dict:
+        """Counts per status, average score and average question count for the filters"""
+        frame = self.filtered(filters)
+        status_counts = {status: int(count) for status, count in frame["status"].value_counts().items()}
+        return {
+            "count": len(frame),
+            "status_counts": status_counts,
+            "avg_score": float(frame["overall_score"].mean()) if len(frame) else 0,
+            "avg_questions": float(frame["question_count"].mean()) if len(frame) else 0
+        }
+
+    def filter_options(self) -> Dict:
+        """Distinct values and the date span for the dashboard filter widgets"""
+        frame = self.frame
+        created = frame["created_at"].dropna()
+        return {
+            "experience_levels": sorted(frame["experience_level"].dropna().unique()),
+            "primary_skills": sorted(frame["primary_skill"].dropna().unique()),
+            "min_date": created.min().date() if len(created) else None,
+            "max_date": created.max().date() if len(created) else None
+        }
+
+
+class _ReportEvents(FileSystemEventHandler):
+    """Forwards *.json create/modify/move/delete events to the index queue"""
+
+    def __init__(self, changes: queue.Queue):
+        self.changes = changes
+
+    def _put(self, path: str):
+        if path.endswith('.json'):
+            self.changes.put(os.path.basename(path))
+
+    def on_any_event(self, event):
+        if event.is_directory or event.event_type not in ('created', 'modified', 'moved', 'deleted'):
+            return
+        self._put(event.src_path)
+        if event.event_type == 'moved':
+            self._put(event.dest_path)
+
+
+class ReportIndex:
+    """
+    In-memory index of interview reports, kept in sync with the report
+    files by a watchdog observer. Each batch of file events re-indexes only
+    the files that changed and publishes a new immutable snapshot, so
+    dashboard reruns never rescan the directory or the table.
+    """
+
+    def __init__(self, manager: ReportManager, debounce: float = REPORT_INDEX_DEBOUNCE):
+        self.manager = manager
+        self.debounce = debounce
+        self._changes: queue.Queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._observer = None
+
+        manager.import_report_files()
+        self._snapshot = ReportSnapshot.build(1, manager.query_reports())
+        self._start_watching()
+
+    @property
+    def snapshot(self) -> ReportSnapshot:
+        return self._snapshot
+
+    def _start_watching(self):
+        if Observer is None:
+            print("⚠️ watchdog not installed; the report index will not pick up new reports until restart")
+            return
+        try:
+            observer = Observer()
+            observer.schedule(_ReportEvents(self._changes), self.manager.reports_dir, recursive=False)
+            observer.daemon = True
+            observer.start()
+        except Exception as e:
+            print(f"⚠️ Report index cannot watch {self.manager.reports_dir}: {e}")
+            return
+        self._observer = observer
+        threading.Thread(target=self._apply_changes, name="report-index", daemon=True).start()
+
+    def _apply_changes(self):
+        while not self._stopped.is_set():
+            try:
+                first = self._changes.get(timeout=1.0)
+            except queue.Empty:
+                continue
+            # Saving a report fires several events; collect them into one batch
+            time.sleep(self.debounce)
+            batch = {first}
+            while True:
+                try:
+                    batch.add(self._changes.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                self.apply(batch)
+            except Exception as e:
+                print(f"⚠️ Report index update failed: {e}")
+
+    def apply(self, filenames: Set[str]) -> ReportSnapshot:
+        """Re-index the given files (dropping those that no longer exist) and publish a new snapshot"""
+        changed, removed = [], set()
+        for filename in filenames:
+            if not os.path.exists(os.path.join(self.manager.reports_dir, filename)):
+                self.manager.remove_report(filename)
+                removed.add(filename)
+            elif self.manager.index_report_file(filename) is not None:
+                changed.append(filename)
+            # A file still being written fails to parse: keep the old row, its next event retries it
+
+        if not changed and not removed:
+            return self._snapshot
+        fresh = self.manager.query_reports(filenames=changed) if changed else []
+        with self._lock:
+            rows = {name: row for name, row in self._snapshot.by_filename.items() if name not in removed}
+            rows.update((row["filename"], row) for row in fresh)
+            self._snapshot = ReportSnapshot.build(self._snapshot.version + 1, list(rows.values()))
+            return self._snapshot
+
+    def stop(self):
+        self._stopped.set()
+        if self._observer is not None:
+            self._observer.stop()
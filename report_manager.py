@@ -1,65 +1,256 @@
 # report_manager.py
 import os
+import csv
+import copy
 import json
-import pandas as pd
-from datetime import datetime
-from typing import Dict, List, Optional
+import time
+import queue
+import atexit
+import threading
+import uuid
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from dataclasses import dataclass
+from datetime import datetime, date
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy.orm import load_only
+
+from config import REPORT_FLUSH_TIMEOUT
+from models import Base, SessionLocal, InterviewReport, engine
+
+STATUS_OPTIONS = ['Selected', 'Conditional', 'Rejected']
+STATUS_COLORS = {'Selected': 'success', 'Conditional': 'warning', 'Rejected': 'error'}
+
+
+def report_status(overall_score: float) -> str:
+    """Hiring status shown on the dashboard for an overall score"""
+    if overall_score >= 7:
+        return 'Selected'
+    elif overall_score >= 6:
+        return 'Conditional'
+    return 'Rejected'
+
+
+def parse_report_timestamp(timestamp_str: str) -> Optional[datetime]:
+    """Report timestamp as a naive datetime, or None if missing/invalid"""
+    if not timestamp_str:
+        return None
+    try:
+        dt = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    return dt.replace(tzinfo=None)
+
+
+# Session state read when building a report (copied before it is queued)
+REPORT_STATE_KEYS = ('candidate_profile', 'question_evaluations', 'questions', 'overall_score',
+                     'final_score', 'introduction_analyzed', 'messages', 'tab_switch_count',
+                     'auto_terminate_tab_switch', 'user_id')
+
+
+def write_json_atomic(path: str, data: Dict):
+    """Write JSON to a temp file, fsync it and rename it over `path` (readers never see a partial file)"""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+    try:
+        dir_fd = os.open(os.path.dirname(path) or '.', os.O_RDONLY)
+    except OSError:
+        return  # directories cannot be opened on Windows; the rename is already durable there
+    try:
+        os.fsync(dir_fd)
+    finally:
+        os.close(dir_fd)
+
+
+class ReportSaveError(Exception):
+    """Raised by wait_until_saved() when a report's JSON file could not be written"""
+
+
+class ReportWriter:
+    """
+    Process-wide queue and writer thread for interview reports. A report
+    is acknowledged (its Future resolved) as soon as its JSON file is
+    fsynced; the database rows and text/CSV files follow off the request path.
+    """
+
+    def __init__(self):
+        self._jobs = queue.Queue()
+        self._pending: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self._worker = None
+
+    def submit(self, manager: "ReportManager", json_path: str, report_data: Dict, state: Dict):
+        saved = Future()
+        with self._lock:
+            self._pending[json_path] = saved
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(target=self._run, name="report-writer", daemon=True)
+                self._worker.start()
+        self._jobs.put((saved, manager, json_path, report_data, state))
+
+    def wait(self, json_path: str, timeout: Optional[float] = None) -> bool:
+        with self._lock:
+            saved = self._pending.get(json_path)
+        if saved is None:
+            return os.path.exists(json_path)
+        try:
+            saved.result(timeout)
+            return True
+        except FutureTimeoutError:
+            return False
+        except Exception as e:
+            raise ReportSaveError(str(e)) from e
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait for every queued report (including its derived files); False on timeout"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._jobs.all_tasks_done:
+            while self._jobs.unfinished_tasks:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._jobs.all_tasks_done.wait(remaining)
+        return True
+
+    def _run(self):
+        while True:
+            saved, manager, json_path, report_data, state = self._jobs.get()
+            try:
+                self._write(saved, manager, json_path, report_data, state)
+            except Exception as e:
+                print(f"❌ Report writer error for {json_path}: {e}")
+            finally:
+                self._jobs.task_done()
+
+    def _write(self, saved: Future, manager: "ReportManager", json_path: str, report_data: Dict, state: Dict):
+        try:
+            write_json_atomic(json_path, report_data)
+        except Exception as e:
+            print(f"❌ Failed to write report {json_path}: {e}")
+            # Failed saves stay in _pending so wait() can report the error
+            saved.set_exception(e)
+            return
+        saved.set_result(json_path)
+        try:
+            manager._persist_derived(json_path, report_data, state)
+        except Exception as e:
+            print(f"❌ Failed to store report data for {json_path}: {e}")
+        finally:
+            with self._lock:
+                # Only drop our own entry, never a later job's
+                if self._pending.get(json_path) is saved:
+                    del self._pending[json_path]
+
+
+_writer: Optional[ReportWriter] = None
+_writer_lock = threading.Lock()
+
+
+def get_report_writer() -> ReportWriter:
+    """Return the process-wide report writer (drained at exit)"""
+    global _writer
+    if _writer is None:
+        with _writer_lock:
+            if _writer is None:
+                _writer = ReportWriter()
+                atexit.register(_writer.flush, REPORT_FLUSH_TIMEOUT)
+    return _writer
+
+
+@dataclass(frozen=True)
+class ReportFilters:
+    """Dashboard filters; None means "no restriction" """
+    status: Optional[str] = None
+    experience_levels: Optional[Tuple[str, ...]] = None
+    primary_skills: Optional[Tuple[str, ...]] = None
+    score_range: Optional[Tuple[float, float]] = None
+    date_range: Optional[Tuple[date, date]] = None
+
 
 class ReportManager:
     def __init__(self, reports_dir: str = "interview_reports"):
         self.reports_dir = reports_dir
         os.makedirs(self.reports_dir, exist_ok=True)
+        try:
+            Base.metadata.create_all(bind=engine, tables=[InterviewReport.__table__])
+        except Exception as e:
+            print(f"⚠️ Interview report table unavailable: {e}")
     
-    def save_interview_report(self, session_state: Dict) -> str:
-        """Save interview report to a file"""
+    def save_interview_report(self, session_state: Dict) -> Optional[str]:
+        """
+        Queue an interview report for the background writer and return its
+        JSON path straight away; wait_until_saved() tells when it is on disk.
+        """
         # VALIDATION: Check if we have data to save
         # We don't want to fail just because score is 0, but we need evaluations or at least some data
         if not session_state.get('candidate_profile') and not session_state.get('question_evaluations'):
             print("⚠️ Insufficient data for report (no profile or evaluations)")
             return None
 
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"candidate_report_{timestamp}"
-        
-        # Save JSON report
+        # Interviews can finish in the same second: a random suffix keeps names and ids unique
+        now = datetime.now()
+        suffix = uuid.uuid4().hex[:8]
+        filename = f"candidate_report_{now.strftime('%Y%m%d_%H%M%S')}_{suffix}"
         json_path = os.path.join(self.reports_dir, f"{filename}.json")
-        with open(json_path, 'w', encoding='utf-8') as f:
-            json.dump(self._prepare_report_data(session_state), f, indent=2, ensure_ascii=False)
-        
-        # Save text report
-        text_path = os.path.join(self.reports_dir, f"{filename}.txt")
-        with open(text_path, 'w', encoding='utf-8') as f:
-            f.write(self._generate_text_report(session_state))
-        
-        # Save CSV summary
-        csv_path = os.path.join(self.reports_dir, f"{filename}.csv")
-        self._save_csv_summary(session_state, csv_path)
-        
-    
+
+        # Copy what the writer needs; the session keeps changing after this rerun
+        state = copy.deepcopy({key: session_state.get(key) for key in REPORT_STATE_KEYS
+                               if session_state.get(key) is not None})
+        report_data = self._prepare_report_data(state, f"INT{now.strftime('%Y%m%d%H%M%S')}{suffix.upper()}")
+
+        get_report_writer().submit(self, json_path, report_data, state)
+        return json_path
+
+    def wait_until_saved(self, json_path: str, timeout: Optional[float] = None) -> bool:
+        """
+        True once the report's JSON file is durably on disk, False if it is
+        still being written after `timeout`. Raises ReportSaveError if the write failed.
+        """
+        return get_report_writer().wait(json_path, timeout)
+
+    def _persist_derived(self, json_path: str, report_data: Dict, state: Dict):
+        """Store everything derived from a report whose JSON file is already written"""
+        filename = os.path.basename(json_path)
+        base_path = os.path.splitext(json_path)[0]
+        user_id = state.get('user_id')
+
+        # Index for the HR dashboard
+        self.index_report(report_data, filename, user_id)
+
         # Save to Database if user is logged in
-        user_id = session_state.get('user_id')
         if user_id:
             try:
-                from models import SessionLocal, Report
+                from models import Report
                 db = SessionLocal()
-                new_report = Report(
-                    user_id=user_id,
-                    file_path=json_path,
-                    score=session_state.get('overall_score', 0)
-                )
-                db.add(new_report)
-                db.commit()
-                db.close()
+                try:
+                    db.add(Report(
+                        user_id=user_id,
+                        file_path=json_path,
+                        score=state.get('overall_score', 0)
+                    ))
+                    db.commit()
+                finally:
+                    db.close()
                 print(f"✅ Report linked to user {user_id}")
             except Exception as e:
                 print(f"❌ Failed to link report to user: {e}")
-        
-        return json_path
+
+        # Save text report and CSV summary
+        try:
+            with open(f"{base_path}.txt", 'w', encoding='utf-8') as f:
+                f.write(self._generate_text_report(state))
+            self._save_csv_summary(state, f"{base_path}.csv")
+        except Exception as e:
+            print(f"❌ Failed to write derived files for {filename}: {e}")
     
-    def _prepare_report_data(self, session_state: Dict) -> Dict:
+    def _prepare_report_data(self, session_state: Dict, report_id: Optional[str] = None) -> Dict:
         """Prepare report data for JSON serialization"""
         return {
-            "report_id": f"INT{datetime.now().strftime('%Y%m%d%H%M%S')}",
+            "report_id": report_id or f"INT{datetime.now().strftime('%Y%m%d%H%M%S')}",
             "timestamp": datetime.now().isoformat(),
             "display_date": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
             "candidate_profile": session_state.get('candidate_profile', {}),
@@ -214,24 +405,153 @@ class ReportManager:
                 }
                 data.append(row)
             
-            df = pd.DataFrame(data)
-            df.to_csv(csv_path, index=False)
+            with open(csv_path, 'w', encoding='utf-8', newline='') as f:
+                writer = csv.DictWriter(f, fieldnames=list(data[0]))
+                writer.writeheader()
+                writer.writerows(data)
     
-    def get_all_reports(self) -> List[Dict]:
-        """Load all saved reports"""
-        reports = []
-        for filename in os.listdir(self.reports_dir):
-            if filename.endswith('.json'):
-                filepath = os.path.join(self.reports_dir, filename)
-                try:
-                    with open(filepath, 'r', encoding='utf-8') as f:
-                        report = json.load(f)
-                        report['filename'] = filename
-                        report['filepath'] = filepath
-                        reports.append(report)
-                except Exception as e:
-                    print(f"Error loading {filename}: {e}")
-        
-        # Sort by timestamp (newest first)
-        reports.sort(key=lambda x: x.get('timestamp', ''), reverse=True)
-        return reports
\ No newline at end of file
+    def _summary_columns(self, report_data: Dict) -> Dict:
+        """Indexed summary columns for a report"""
+        profile = report_data.get('candidate_profile') or {}
+        overall_score = report_data.get('overall_score', 0) or 0
+        return {
+            "created_at": parse_report_timestamp(report_data.get('timestamp', '')),
+            "overall_score": overall_score,
+            "final_score": report_data.get('final_score', 0) or 0,
+            "status": report_status(overall_score),
+            "primary_skill": profile.get('primary_skill', 'N/A'),
+            "experience_level": profile.get('experience_level', 'N/A'),
+            "question_count": len(report_data.get('question_evaluations', [])),
+            "intro_score": profile.get('intro_score', 0),
+            "confidence": profile.get('confidence', 'N/A'),
+            "communication": profile.get('communication', 'N/A')
+        }
+
+    def index_report(self, report_data: Dict, filename: str, user_id: Optional[int] = None) -> Optional[int]:
+        """Store a report in the interview_reports table; returns its row id"""
+        try:
+            db = SessionLocal()
+            try:
+                row = db.query(InterviewReport).filter(InterviewReport.filename == filename).first()
+                if row is None:
+                    row = InterviewReport(filename=filename)
+                    db.add(row)
+                row.report_id = report_data.get('report_id') or os.path.splitext(filename)[0]
+                row.user_id = user_id if user_id is not None else row.user_id
+                row.payload = report_data
+                for column, value in self._summary_columns(report_data).items():
+                    setattr(row, column, value)
+                db.commit()
+                return row.id
+            finally:
+                db.close()
+        except Exception as e:
+            print(f"❌ Failed to index report {filename}: {e}")
+            return None
+
+    def index_report_file(self, filename: str) -> Optional[int]:
+        """(Re)index one JSON report file from the reports directory"""
+        try:
+            with open(os.path.join(self.reports_dir, filename), 'r', encoding='utf-8') as f:
+                report_data = json.load(f)
+        except Exception as e:
+            print(f"Error loading {filename}: {e}")
+            return None
+        return self.index_report(report_data, filename)
+
+    def remove_report(self, filename: str) -> bool:
+        """Drop a report whose JSON file was deleted"""
+        try:
+            db = SessionLocal()
+            try:
+                deleted = db.query(InterviewReport).filter(InterviewReport.filename == filename) \
+                    .delete(synchronize_session=False)
+                db.commit()
+                return deleted > 0
+            finally:
+                db.close()
+        except Exception as e:
+            print(f"❌ Failed to remove report {filename}: {e}")
+            return False
+
+    def import_report_files(self) -> int:
+        """Index JSON reports on disk that are not in the database yet (e.g. saved before the table existed)"""
+        db = SessionLocal()
+        try:
+            known = {name for (name,) in db.query(InterviewReport.filename)}
+        finally:
+            db.close()
+
+        imported = 0
+        for filename in sorted(os.listdir(self.reports_dir)):
+            if not filename.endswith('.json') or filename in known:
+                continue
+            if self.index_report_file(filename) is not None:
+                imported += 1
+        if imported:
+            print(f"✅ Imported {imported} report files into the database")
+        return imported
+
+    @staticmethod
+    def _summary_row(row: InterviewReport) -> Dict:
+        created_at = row.created_at
+        return {
+            "id": row.id,
+            "report_id": row.report_id,
+            "filename": row.filename,
+            "created_at": created_at,
+            "display_date": created_at.strftime("%Y-%m-%d %H:%M:%S") if created_at else 'N/A',
+            "display_date_short": created_at.strftime("%b %d, %Y") if created_at else 'N/A',
+            "overall_score": row.overall_score or 0,
+            "final_score": row.final_score or 0,
+            "status": row.status,
+            "status_color": STATUS_COLORS.get(row.status, 'default'),
+            "primary_skill": row.primary_skill,
+            "experience_level": row.experience_level,
+            "question_count": row.question_count or 0,
+            "intro_score": row.intro_score or 0,
+            "confidence": row.confidence,
+            "communication": row.communication
+        }
+
+    def query_reports(self, filenames: Optional[List[str]] = None) -> List[Dict]:
+        """
+        Summary rows (no payload), newest first, optionally only for the
+        given files. Filtering, counts and paging live in report_index.ReportSnapshot.
+        """
+        summary_columns = [c for c in InterviewReport.__table__.columns if c.name != 'payload']
+        db = SessionLocal()
+        try:
+            query = db.query(InterviewReport)
+            if filenames is not None:
+                query = query.filter(InterviewReport.filename.in_(filenames))
+            query = query.options(load_only(*[getattr(InterviewReport, c.name) for c in summary_columns])) \
+                .order_by(InterviewReport.created_at.desc(), InterviewReport.id.desc())
+            return [self._summary_row(row) for row in query]
+        finally:
+            db.close()
+
+    def get_report(self, report_pk: int) -> Optional[Dict]:
+        """Full report payload plus the dashboard's derived fields"""
+        db = SessionLocal()
+        try:
+            row = db.get(InterviewReport, report_pk)
+            if row is None:
+                return None
+            report = dict(row.payload or {})
+            summary = self._summary_row(row)
+        finally:
+            db.close()
+
+        report.setdefault('total_questions_answered', len(report.get('question_evaluations', [])))
+        report.setdefault('overall_score', 0)
+        report.setdefault('final_score', 0)
+        report.setdefault('candidate_profile', {})
+        report.setdefault('question_evaluations', [])
+        report.setdefault('timestamp', '')
+        report.setdefault('report_id', summary['report_id'])
+        report['filename'] = summary['filename']
+        report['filepath'] = os.path.join(self.reports_dir, summary['filename'])
+        for key in ('status', 'status_color', 'display_date', 'display_date_short'):
+            report[key] = summary[key]
+        return report
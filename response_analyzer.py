@@ -1,35 +1,33 @@
-import openai
 import re
+from collections import Counter
 from typing import Dict, List, Tuple
-from config import OPENROUTER_API_KEY, OPENROUTER_BASE_URL, MODEL_NAME, SKILL_CATEGORIES
-from utils import extract_skills, analyze_response_quality
-from skill_mapper import map_skills_to_category
+from utils import extract_skills
+from answer_features import extract_answer_features, AnswerFeatures
+from skill_mapper import map_skills_to_category, get_skill_matcher
+from llm_client import get_llm_client
+from evaluation_cache import get_evaluation_cache
+from moderation import get_moderation_engine
+from config import INTRO_INPUT_TOKENS, RESUME_CHUNK_TOKENS, RESUME_MAX_CHUNKS, RESUME_MAX_TOKENS
+from token_budget import (condense_resume, cap_answer, chunk_resume, estimate_messages_tokens,
+                          output_budget, resume_tokens)
+
+# Bump when the evaluate_answer prompt or parsing changes so cached results are not reused
+EVALUATION_PROMPT_VERSION = "eval-v2"
+# Bump when the analyze_introduction prompt or parsing changes so cached resume profiles are rebuilt
+INTRO_PROMPT_VERSION = "intro-v2"
 
 class ResponseAnalyzer:
     def __init__(self):
-        openai.api_key = OPENROUTER_API_KEY
-        openai.api_base = OPENROUTER_BASE_URL
+        self.llm = get_llm_client()
+        self.evaluation_cache = get_evaluation_cache()
+        self.moderation = get_moderation_engine()
 
     def _fallback_analysis(self, response: str) -> Dict:
         """Fallback analysis when AI analysis fails"""
-        from utils import extract_skills
-        
         skills = extract_skills(response)
         
-        # Simple skill categorization
-        skill_counts = {cat: 0 for cat in SKILL_CATEGORIES}
-        
-        for skill in skills:
-            s = skill.lower()
-            for cat, keywords in SKILL_CATEGORIES.items():
-                for k in keywords:
-                    if k.lower() in s:
-                        skill_counts[cat] += 1
-        
         # Determine primary skill
-        primary_skill = max(skill_counts, key=skill_counts.get) if skill_counts else "backend"
-        if skill_counts.get(primary_skill, 0) == 0:
-            primary_skill = "backend"
+        primary_skill = map_skills_to_category(skills)
         
         # Estimate experience level based on word count and content
         word_count = len(response.split())
@@ -87,7 +85,7 @@ class ResponseAnalyzer:
         Analyze this candidate introduction:
 
         Response:
-        {response}
+        {condense_resume(response)}
 
         Extract:
         - Skills mentioned
@@ -102,17 +100,14 @@ class ResponseAnalyzer:
         # 1️⃣ AI ANALYSIS (SOFT SIGNALS)
         # --------------------------------------------------
         try:
-            res = openai.ChatCompletion.create(
-                model=MODEL_NAME,
+            ai_text = self.llm.chat(
                 messages=[
                     {"role": "system", "content": "You are a technical recruiter."},
                     {"role": "user", "content": prompt}
                 ],
                 temperature=0.3,
-                max_tokens=150
-            )
-
-            ai_text = res.choices[0].message.content.lower()
+                max_tokens=output_budget("intro_signals")
+            ).lower()
 
             ai_analysis = {
                 "experience": "senior" if "senior" in ai_text else
@@ -132,15 +127,7 @@ class ResponseAnalyzer:
         # --------------------------------------------------
         # 2️⃣ CONFIG-DRIVEN SKILL EXTRACTION (SOURCE OF TRUTH)
         # --------------------------------------------------
-        response_lower = response.lower()
-        detected_skills = []
-
-        for category, keywords in SKILL_CATEGORIES.items():
-            for keyword in keywords:
-                if keyword.lower() in response_lower:
-                    detected_skills.append(keyword)
-
-        detected_skills = list(set(detected_skills))
+        detected_skills = extract_skills(response)
 
         # --------------------------------------------------
         # 3️⃣ DOMAIN LOCKING (NO AI GUESSING)
@@ -259,17 +246,12 @@ class ResponseAnalyzer:
     
     def _extract_skill_from_text(self, text: str) -> str:
         """Extract skill category from text using config first"""
-        text_lower = text.lower()
-        
         # Use config-driven mapping first (Source of Truth)
-        try:
-            from config import SKILL_CATEGORIES
-            for category, keywords in SKILL_CATEGORIES.items():
-                for keyword in keywords:
-                    if keyword.lower() in text_lower:
-                        return category
-        except ImportError:
-            pass # Fallback to hardcoded if import fails
+        category = get_skill_matcher().first_category(text)
+        if category:
+            return category
+        
+        text_lower = text.lower()
             
         skill_mapping = {
             "backend": ["backend", "back-end", "server", "api", "database", "python", "java", "node", "spring"],
@@ -531,22 +513,30 @@ class ResponseAnalyzer:
             "communication": communication,
             "projects_mentioned": projects_mentioned,
             "word_count": word_count,
-            "intro_score": min(10, max(1, intro_score))
+            "intro_score": min(10, max(1, intro_score)),
+            "fallback": True  # heuristic result, not worth caching
         }
 
     def evaluate_answer(self, question: str, answer: str) -> Dict:
         """Evaluate candidate's answer quality with detailed scoring"""
         
+        # Identical question/answer pairs (retakes, demo runs) are served from cache
+        cache_key = self.evaluation_cache.make_key(question, answer, self.llm.model, EVALUATION_PROMPT_VERSION)
+        cached = self.evaluation_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
         # First, get basic metrics
-        word_count = len(answer.split())
-        metrics = analyze_response_quality(answer)
+        features = extract_answer_features(answer)
+        word_count = features.word_count
+        metrics = features.quality_metrics()
         
         # Use AI for detailed evaluation
         prompt = f"""
             Evaluate this technical interview answer:
             
             Question: {question}
-            Answer: {answer}
+            Answer: {cap_answer(answer)}
             
             Score on a scale of 1-10 for each category:
             1. Technical Accuracy (1-10): How correct is the technical information?
@@ -573,23 +563,23 @@ class ResponseAnalyzer:
         """
         
         try:
-            evaluation = openai.ChatCompletion.create(
-                model=MODEL_NAME,
+            eval_text = self.llm.chat(
                 messages=[
                     {"role": "system", "content": "You are a technical interviewer evaluating answers. Be fair but critical."},
                     {"role": "user", "content": prompt}
                 ],
                 temperature=0.4,
-                max_tokens=250
+                max_tokens=output_budget("evaluation")
             )
             
-            eval_text = evaluation.choices[0].message.content # type: ignore
-            return self._parse_detailed_evaluation(eval_text, word_count, metrics)
+            scores = self._parse_detailed_evaluation(eval_text, word_count, metrics)
+            self.evaluation_cache.put(cache_key, scores, self.llm.model, EVALUATION_PROMPT_VERSION)
+            return scores
             
         except Exception as e:
             print(f"AI evaluation error: {e}")
             # Fallback to rule-based scoring
-            return self._fallback_evaluation(question, answer, word_count, metrics)
+            return self._fallback_evaluation(question, features)
 
     def _parse_detailed_evaluation(self, eval_text: str, word_count: int, metrics: Dict) -> Dict:
         """Parse detailed AI evaluation"""
@@ -691,8 +681,13 @@ class ResponseAnalyzer:
         
         return scores
 
-    def _fallback_evaluation(self, question: str, answer: str, word_count: int, metrics: Dict) -> Dict:
+    def heuristic_evaluation(self, question: str, answer: str) -> Dict:
+        """Rule-based evaluation without an LLM call"""
+        return self._fallback_evaluation(question, extract_answer_features(answer))
+
+    def _fallback_evaluation(self, question: str, features: AnswerFeatures) -> Dict:
         """Fallback evaluation when AI fails"""
+        word_count = features.word_count
         base_score = 5
         
         # Adjust based on word count
@@ -706,24 +701,23 @@ class ResponseAnalyzer:
             base_score = 6  # Might be too verbose
         
         # Adjust based on metrics
-        if metrics["has_examples"]:
+        if features.has("examples"):
             base_score += 1
-        if metrics["has_technical_terms"]:
+        if features.has("technical_terms"):
             base_score += 1
-        if metrics["has_explanation"]:
+        if features.has("explanation"):
             base_score += 1
         
         # Check for question-specific indicators
-        answer_lower = answer.lower()
         question_lower = question.lower()
         
-        if "debug" in question_lower and any(term in answer_lower for term in ["log", "monitor", "analyze", "profile"]):
+        if "debug" in question_lower and features.has("debug_terms"):
             base_score += 1
         
-        if "design" in question_lower and any(term in answer_lower for term in ["scalable", "architecture", "components", "trade-off"]):
+        if "design" in question_lower and features.has("design_terms"):
             base_score += 1
         
-        if "difference between" in question_lower and any(term in answer_lower for term in ["vs", "versus", "while", "whereas", "on the other hand"]):
+        if "difference between" in question_lower and features.has("comparison_terms"):
             base_score += 1
         
         # Cap score
@@ -738,7 +732,7 @@ class ResponseAnalyzer:
         else:
             weaknesses.append("Could provide more detail")
         
-        if metrics["has_examples"]:
+        if features.has("examples"):
             strengths.append("Uses practical examples")
         else:
             weaknesses.append("Lacks concrete examples")
@@ -756,38 +750,32 @@ class ResponseAnalyzer:
 
     def check_for_termination(self, response: str) -> Tuple[bool, str]:
         """Check if interview should be terminated"""
-        from config import ABUSIVE_KEYWORDS, TERMINATION_KEYWORDS
-        
         if not response or response.isspace():
             return False, ""
         
-        response_lower = response.lower().strip()
-        
-        # Check for abusive language
-        for keyword in ABUSIVE_KEYWORDS:
-            if keyword in response_lower:
-                return True, "misconduct"
+        # Abusive language ("misconduct") or an explicit termination request ("candidate_request").
+        # Whole words only to avoid false positives (e.g., "backend" matching "end")
+        match = self.moderation.check(response)
+        if match:
+            return True, match[0]
         
-        # Check for explicit termination request
-        # Use regex to match whole words only to avoid false positives (e.g., "backend" matching "end")
-        for keyword in TERMINATION_KEYWORDS:
-            if re.search(r'\b' + re.escape(keyword) + r'\b', response_lower):
-                return True, "candidate_request"
+        features = extract_answer_features(response.strip())
         
         # Check for extremely poor responses
-        if len(response.split()) < 5 and "skip" not in response_lower:
+        if features.word_count < 5 and not features.has("skip"):
             return True, "poor_response"
         
         return False, ""
     
-    def analyze_introduction(self, response: str) -> Dict:
-        """Analyze candidate's introduction with better AI analysis"""
+    def _intro_analysis_messages(self, text: str, part: str = "") -> List[Dict]:
+        """Chat messages for the structured introduction analysis"""
+        part_note = f"\n            This is {part} of a longer resume; report only what this part shows." if part else ""
         prompt = f"""
             Analyze the candidate's introduction as a technical recruiter conducting a
-            medium-difficulty interview.
+            medium-difficulty interview.{part_note}
 
             Response:
-            {response[:500]}
+            {text}
 
             Evaluation guidelines:
             - Be fair and slightly liberal in interpretation, but do NOT overestimate the
@@ -798,12 +786,12 @@ class ResponseAnalyzer:
 
             Provide the analysis in EXACTLY the following format:
 
-            Skills: [comma-separated list of specific technical skills explicitly mentioned or strongly implied]
             Experience Level: [junior/mid/senior]
             Primary Technical Area: [backend/frontend/fullstack/devops/data/mobile]
             Confidence: [low/medium/high]
             Communication: [weak/adequate/strong]
             Projects Mentioned: [number]
+            Skills: [comma-separated list of specific technical skills explicitly mentioned or strongly implied]
 
             Evaluation focus:
             - Technical skills demonstrated (not guessed)
@@ -811,13 +799,8 @@ class ResponseAnalyzer:
             - Evidence of hands-on or project experience
             - Professional tone and confidence level
         """
-        
-        try:
-            print("[DEBUG] Sending to AI for analysis...")
-            response_analysis = openai.ChatCompletion.create(
-                model=MODEL_NAME,
-                messages=[
-                    {"role": "system", "content": '''
+        return [
+            {"role": "system", "content": '''
                             You are a technical recruiter evaluating candidate responses during an interview. Analyze each answer carefully and provide specific, detailed, and objective feedback based strictly on the content provided.
                             Evaluate the candidate liberally and fairly, recognizing effort, clarity, and correct reasoning, but do not inflate scores or assessments beyond what the response genuinely demonstrates.
                             The interview difficulty level should be considered medium, so expectations should align with a competent junior-to-mid-level candidate rather than an expert.
@@ -828,18 +811,80 @@ class ResponseAnalyzer:
                             Completeness of the response relative to the question
                             Be balanced in your judgment: acknowledge strengths clearly, point out gaps constructively, and avoid overly harsh or overly generous evaluations. The goal is to provide a realistic assessment of the candidate’s readiness at a medium-level technical interview. 
                     '''},
-                    {"role": "user", "content": prompt}
-                ],
+            {"role": "user", "content": prompt}
+        ]
+
+    def analyze_introduction(self, response: str) -> Dict:
+        """Analyze candidate's introduction with better AI analysis"""
+        # Only a resume that does not fit one prompt, even condensed, is map-reduced
+        chunks = chunk_resume(response, max_chunks=self._resume_chunk_limit()) \
+            if resume_tokens(response) > INTRO_INPUT_TOKENS else []
+        if len(chunks) > 1:
+            return self._analyze_resume_chunks(response, chunks)
+
+        try:
+            print("[DEBUG] Sending to AI for analysis...")
+            analysis_text = self.llm.chat(
+                messages=self._intro_analysis_messages(condense_resume(response)),
                 temperature=0.7,  # Slightly higher temperature for more varied responses
-                max_tokens=250
+                max_tokens=output_budget("intro_analysis")
             )
             
-            analysis_text = response_analysis.choices[0].message.content # type: ignore
             # (f"[DEBUG] AI Response:\n{analysis_text}")
             
             return self._parse_intro_analysis(analysis_text, response)
         except Exception as e:
             print(f"[DEBUG] AI analysis error: {e}")
             return self._enhanced_fallback_analysis(response)
+
+    def _resume_chunk_limit(self) -> int:
+        """Chunks one resume may use so that prompts plus replies stay within RESUME_MAX_TOKENS"""
+        per_chunk = (estimate_messages_tokens(self._intro_analysis_messages("", "part 1 of 1"))
+                     + RESUME_CHUNK_TOKENS + output_budget("intro_analysis"))
+        return max(1, min(RESUME_MAX_CHUNKS, RESUME_MAX_TOKENS // per_chunk))
+
+    def _analyze_resume_chunks(self, response: str, chunks: List[str]) -> Dict:
+        """Map-reduce a long resume: analyze the chunks concurrently, then merge the profiles"""
+        print(f"[DEBUG] Sending {len(chunks)} resume chunks to AI for analysis...")
+        replies = self.llm.chat_many([
+            {
+                "messages": self._intro_analysis_messages(chunk, f"part {i} of {len(chunks)}"),
+                "temperature": 0.7,
+                "max_tokens": output_budget("intro_analysis")
+            }
+            for i, chunk in enumerate(chunks, 1)
+        ])
+
+        partials = []
+        for chunk, reply in zip(chunks, replies):
+            if isinstance(reply, Exception):
+                print(f"[DEBUG] AI analysis error on resume chunk: {reply}")
+                continue
+            partials.append(self._parse_intro_analysis(reply, chunk))
+        if not partials:
+            return self._enhanced_fallback_analysis(response)
+        return self._merge_intro_analyses(partials, response)
+
+    def _merge_intro_analyses(self, partials: List[Dict], response: str) -> Dict:
+        """Combine per-chunk profiles: union of skills, highest experience, summed projects"""
+        # Chunks over the token cap are never sent; local matching still sees the whole resume
+        skills = list(dict.fromkeys([skill for p in partials for skill in p["skills"]] + extract_skills(response)))
+        experience_rank = {"junior": 0, "mid": 1, "senior": 2}
+
+        def most_common(key: str) -> str:
+            # Ties go to the earliest chunk
+            return Counter(p[key] for p in partials).most_common(1)[0][0]
+
+        result = {
+            "skills": skills,
+            "experience": max((p["experience"] for p in partials), key=lambda e: experience_rank.get(e, 1)),
+            "primary_skill": map_skills_to_category(skills) if skills else most_common("primary_skill"),
+            "confidence": most_common("confidence"),
+            "communication": most_common("communication"),
+            "projects_mentioned": sum(p["projects_mentioned"] for p in partials),
+            "word_count": len(response.split())
+        }
+        result["intro_score"] = self._calculate_intro_score(result, response)
+        return result
         
     
\ No newline at end of file
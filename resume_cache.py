@@ -0,0 +1,209 @@
+# resume_cache.py
+import hashlib
+import json
+import threading
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+
+from sqlalchemy import func
+
+from config import RESUME_CACHE_MEMORY_BYTES, RESUME_CACHE_DB_BYTES
+from models import Base, SessionLocal, ResumeCacheEntry, engine
+from resume_parser import parse_resume_result, check_upload_size, iter_upload_chunks, PARSER_VERSION
+from utils import ByteLRUCache
+
+PARSE_ERROR_PREFIX = "Error parsing"
+
+# Check the SQLite tier against its byte budget every N writes
+PRUNE_EVERY = 50
+
+
+class ResumeCache:
+    """
+    Parsed resume text and candidate profiles keyed by the SHA-256 of the
+    uploaded file, in an in-process LRU backed by SQLite. Text is only
+    served for the current PARSER_VERSION and a profile only for the
+    version (intro prompt + model) it was built with.
+    """
+
+    def __init__(self, memory_bytes: int = RESUME_CACHE_MEMORY_BYTES, db_bytes: int = RESUME_CACHE_DB_BYTES):
+        self.memory = ByteLRUCache(memory_bytes)
+        self.db_bytes = db_bytes
+        self._lock = threading.Lock()
+        self._writes = 0
+        self.hits = 0
+        self.misses = 0
+        try:
+            Base.metadata.create_all(bind=engine, tables=[ResumeCacheEntry.__table__])
+        except Exception as e:
+            print(f"⚠️ Resume cache table unavailable: {e}")
+
+    @staticmethod
+    def hash_file(file) -> str:
+        """SHA-256 of an upload or open binary file, read in chunks"""
+        digest = hashlib.sha256()
+        for chunk in iter_upload_chunks(file):
+            digest.update(chunk)
+        return digest.hexdigest()
+
+    def _load(self, file_hash: str) -> Optional[Dict]:
+        """Cached row as a dict (memory first, then SQLite)"""
+        row = self.memory.get(file_hash)
+        if row is not None:
+            return row
+        try:
+            db = SessionLocal()
+            try:
+                entry = db.get(ResumeCacheEntry, file_hash)
+                if entry is None:
+                    return None
+                row = {
+                    "parser_version": entry.parser_version,
+                    "text": entry.text,
+                    "profile_version": entry.profile_version,
+                    "profile": entry.profile
+                }
+                entry.last_used_at = datetime.utcnow()
+                db.commit()
+            finally:
+                db.close()
+        except Exception as e:
+            print(f"⚠️ Resume cache read failed: {e}")
+            return None
+        self._remember(file_hash, row)
+        return row
+
+    @staticmethod
+    def _size(row: Dict) -> int:
+        return len(row["text"].encode("utf-8")) + len((row["profile"] or "").encode("utf-8"))
+
+    def _remember(self, file_hash: str, row: Dict):
+        self.memory.put(file_hash, row, self._size(row))
+
+    def _count(self, hit: bool):
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def get_text(self, file_hash: str) -> Optional[str]:
+        row = self._load(file_hash)
+        hit = row is not None and row["parser_version"] == PARSER_VERSION
+        self._count(hit)
+        return row["text"] if hit else None
+
+    def get_profile(self, file_hash: str, profile_version: str) -> Optional[Dict]:
+        """Return a copy of the cached profile or None"""
+        row = self._load(file_hash)
+        hit = (row is not None and row["profile"] is not None and row["parser_version"] == PARSER_VERSION
+               and row["profile_version"] == profile_version)
+        self._count(hit)
+        return json.loads(row["profile"]) if hit else None
+
+    def put_text(self, file_hash: str, text: str):
+        """Store parsed text (drops any profile built from older text)"""
+        self._save(file_hash, {
+            "parser_version": PARSER_VERSION,
+            "text": text,
+            "profile_version": None,
+            "profile": None
+        })
+
+    def put_profile(self, file_hash: str, profile_version: str, profile: Dict):
+        """Attach a profile to a cached resume; ignored if the text is not cached"""
+        row = self._load(file_hash)
+        if row is None or row["parser_version"] != PARSER_VERSION:
+            return
+        self._save(file_hash, dict(row, profile_version=profile_version,
+                                   profile=json.dumps(profile, ensure_ascii=False)))
+
+    def _save(self, file_hash: str, row: Dict):
+        self._remember(file_hash, row)
+        try:
+            db = SessionLocal()
+            try:
+                db.merge(ResumeCacheEntry(
+                    file_hash=file_hash,
+                    parser_version=row["parser_version"],
+                    text=row["text"],
+                    profile_version=row["profile_version"],
+                    profile=row["profile"],
+                    size_bytes=self._size(row),
+                    last_used_at=datetime.utcnow()
+                ))
+                db.commit()
+            finally:
+                db.close()
+        except Exception as e:
+            print(f"⚠️ Resume cache write failed: {e}")
+            return
+
+        with self._lock:
+            self._writes += 1
+            should_prune = self._writes % PRUNE_EVERY == 0
+        if should_prune:
+            self.prune()
+
+    def prune(self):
+        """Evict least recently used rows until the SQLite tier fits its byte budget"""
+        try:
+            db = SessionLocal()
+            try:
+                total = db.query(func.coalesce(func.sum(ResumeCacheEntry.size_bytes), 0)).scalar()
+                excess = total - self.db_bytes
+                if excess <= 0:
+                    return
+                stale_hashes = []
+                rows = db.query(ResumeCacheEntry.file_hash, ResumeCacheEntry.size_bytes) \
+                    .order_by(ResumeCacheEntry.last_used_at.asc())
+                for file_hash, size in rows:
+                    if excess <= 0:
+                        break
+                    stale_hashes.append(file_hash)
+                    excess -= size
+                db.query(ResumeCacheEntry).filter(ResumeCacheEntry.file_hash.in_(stale_hashes)) \
+                    .delete(synchronize_session=False)
+                db.commit()
+            finally:
+                db.close()
+        except Exception as e:
+            print(f"⚠️ Resume cache prune failed: {e}")
+
+    def stats(self) -> Dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "memory_entries": len(self.memory)
+            }
+
+
+_cache: Optional[ResumeCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_resume_cache() -> ResumeCache:
+    """Return the process-wide resume cache"""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = ResumeCache()
+    return _cache
+
+
+def parse_resume_cached(uploaded_file) -> Tuple[str, str]:
+    """parse_resume() behind the cache; returns (file_hash, text). Raises UploadTooLarge."""
+    check_upload_size(uploaded_file)
+    cache = get_resume_cache()
+    file_hash = cache.hash_file(uploaded_file)
+    text = cache.get_text(file_hash)
+    if text is None:
+        text, complete = parse_resume_result(uploaded_file)
+        # Text cut short by a PDF timeout is served this once but never cached
+        if complete and text.strip() and not text.startswith(PARSE_ERROR_PREFIX):
+            cache.put_text(file_hash, text)
+    return file_hash, text
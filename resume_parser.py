@@ -1,46 +1,382 @@
 import PyPDF2
-import docx
+import codecs
 import io
+import mmap
+import multiprocessing
+import os
+import tempfile
+import threading
+import time
+import zipfile
+import xml.etree.ElementTree as ET
+from contextlib import ExitStack, contextmanager
+from typing import Generator, Iterator, List, Tuple
+
+from config import PDF_WORKERS, PDF_MAX_PAGES, PDF_PAGE_TIMEOUT, PDF_DEADLINE, MAX_UPLOAD_BYTES
+
+# Bump when extraction changes so cached resume text is re-parsed
+PARSER_VERSION = "parser-v3"
+
+# WordprocessingML tags read by the streaming DOCX extractor
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+W_BODY, W_P, W_R, W_T, W_TAB, W_BR, W_CR = (_W + t for t in ("body", "p", "r", "t", "tab", "br", "cr"))
+W_TBL, W_TR, W_TC = (_W + t for t in ("tbl", "tr", "tc"))
+
+# Uploads are read, copied and decoded in chunks of this size
+READ_CHUNK_BYTES = 1024 * 1024
+
+
+class UploadTooLarge(ValueError):
+    """Raised before parsing when a resume exceeds MAX_UPLOAD_BYTES"""
+
+    def __init__(self, size: int, limit: int):
+        super().__init__(f"File is {size / 1048576:.1f} MB, the limit is {limit / 1048576:.0f} MB")
+        self.size = size
+        self.limit = limit
+
+
+def _as_stream(file):
+    """Seekable binary stream for an upload (objects that only offer getvalue() are wrapped)"""
+    if hasattr(file, "read") and hasattr(file, "seek"):
+        return file
+    return io.BytesIO(file.getvalue())
+
+
+def check_upload_size(file, max_bytes: int = MAX_UPLOAD_BYTES) -> int:
+    """Size of an upload (without reading it); raises UploadTooLarge over the limit"""
+    size = getattr(file, "size", None)
+    if size is None:
+        file = _as_stream(file)
+        position = file.tell()
+        size = file.seek(0, io.SEEK_END)
+        file.seek(position)
+    if size > max_bytes:
+        raise UploadTooLarge(size, max_bytes)
+    return size
+
+
+def iter_upload_chunks(file) -> Iterator[bytes]:
+    """Read an upload from the start in READ_CHUNK_BYTES pieces, then rewind it"""
+    file = _as_stream(file)
+    file.seek(0)
+    try:
+        while True:
+            chunk = file.read(READ_CHUNK_BYTES)
+            if not chunk:
+                return
+            yield chunk
+    finally:
+        file.seek(0)
+
+
+@contextmanager
+def spool_upload(file) -> Iterator[str]:
+    """
+    Copy an upload to a temp file in chunks; yields its path and deletes it afterwards.
+
+    Streamlit uploads are already in memory, so this is an extra copy: it
+    exists so PDF worker processes can map the file instead of receiving
+    the bytes pickled through the pool.
+    """
+    fd, path = tempfile.mkstemp(prefix="resume-", suffix=".upload")
+    try:
+        with os.fdopen(fd, "wb") as out:
+            for chunk in iter_upload_chunks(file):
+                out.write(chunk)
+        yield path
+    finally:
+        try:
+            os.remove(path)
+        except OSError as e:  # still open in a worker on Windows
+            print(f"⚠️ Could not remove spooled upload {path}: {e}")
+
+
+@contextmanager
+def open_mapped(path: str):
+    """Read-only memory map of a file (an empty buffer for empty files)"""
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield io.BytesIO(b"")
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as view:
+            yield view
+
+
+def decode_text(file, encoding: str = "utf-8") -> str:
+    """Decode a text upload chunk by chunk (multi-byte characters may straddle chunks)"""
+    decoder = codecs.getincrementaldecoder(encoding)()
+    parts = [decoder.decode(chunk) for chunk in iter_upload_chunks(file)]
+    parts.append(decoder.decode(b"", final=True))
+    return "".join(parts)
+
+
+_pdf_pool = None
+_pdf_pool_lock = threading.Lock()
+
+
+def get_pdf_pool():
+    """Return the process-wide PDF worker pool, creating it on first use"""
+    global _pdf_pool
+    if _pdf_pool is None:
+        with _pdf_pool_lock:
+            if _pdf_pool is None:
+                # spawn: forking the Streamlit server process is not safe
+                _pdf_pool = multiprocessing.get_context("spawn").Pool(processes=PDF_WORKERS)
+    return _pdf_pool
+
+
+def _retire_pdf_pool(pool):
+    """
+    Stop sending work to a pool with a stuck worker. New documents get a
+    fresh pool; jobs already queued on the old one (other sessions'
+    documents) still run, and it is killed once their deadline has passed.
+    """
+    global _pdf_pool
+    with _pdf_pool_lock:
+        if _pdf_pool is not pool:
+            return  # already retired by another document
+        _pdf_pool = None
+    pool.close()
+    reaper = threading.Timer(PDF_DEADLINE, pool.terminate)
+    reaper.daemon = True
+    reaper.start()
+
+
+# Worker side: the document a worker process opened last, so that
+# successive page jobs for the same file parse it only once
+_worker_document = None  # (file identity, ExitStack holding the map, PdfReader)
+
+
+def _worker_reader(path: str) -> "PyPDF2.PdfReader":
+    global _worker_document
+    stat = os.stat(path)
+    identity = (path, stat.st_ino, stat.st_size, stat.st_mtime_ns)
+    if _worker_document is None or _worker_document[0] != identity:
+        if _worker_document is not None:
+            _worker_document[1].close()
+            _worker_document = None
+        stack = ExitStack()
+        try:
+            reader = PyPDF2.PdfReader(stack.enter_context(open_mapped(path)))
+        except Exception:
+            stack.close()
+            raise
+        _worker_document = (identity, stack, reader)
+    return _worker_document[2]
+
+
+def _pdf_page_count(path: str) -> int:
+    return len(_worker_reader(path).pages)
+
+
+def _pdf_page_text(path: str, index: int) -> str:
+    return _worker_reader(path).pages[index].extract_text() or ""
+
+
+def iter_pdf_pages(
+    file,
+    max_pages: int = PDF_MAX_PAGES,
+    page_timeout: float = PDF_PAGE_TIMEOUT,
+    deadline: float = PDF_DEADLINE
+) -> Iterator[str]:
+    """
+    Yield the text of each page, in order, as soon as it and every earlier
+    page are extracted.
+
+    Each page is a separate job in the worker pool, so a malformed or huge
+    PDF cannot block the caller; workers keep the open document between
+    jobs. Only the first `max_pages` pages are read, a page that takes
+    longer than `page_timeout` is skipped, and extraction stops once
+    `deadline` seconds have passed for the document.
+
+    The generator returns True when no pages were lost to a timeout.
+    """
+    with spool_upload(file) as path:
+        return (yield from _iter_spooled_pdf_pages(path, max_pages, page_timeout, deadline))
+
+
+def _iter_spooled_pdf_pages(path: str, max_pages: int, page_timeout: float,
+                            deadline: float) -> Generator[str, None, bool]:
+    # Workers map the spooled file themselves, so the PDF bytes are never pickled
+    pool = get_pdf_pool()
+    started = time.monotonic()
+    stuck = False
+
+    def remaining() -> float:
+        return deadline - (time.monotonic() - started)
+
+    try:
+        try:
+            page_count = pool.apply_async(_pdf_page_count, (path,)).get(timeout=min(page_timeout, remaining()))
+        except multiprocessing.TimeoutError:
+            stuck = True
+            raise TimeoutError("Timed out opening PDF")
+
+        if page_count > max_pages:
+            print(f"⚠️ PDF has {page_count} pages, reading the first {max_pages}")
+        pending = [pool.apply_async(_pdf_page_text, (path, i)) for i in range(min(page_count, max_pages))]
+
+        for index, result in enumerate(pending):
+            wait = min(page_timeout, remaining())
+            if wait <= 0:
+                stuck = True
+                print(f"⚠️ PDF deadline of {deadline}s reached after {index} pages")
+                return False
+            try:
+                yield result.get(timeout=wait)
+            except multiprocessing.TimeoutError:
+                stuck = True
+                print(f"⚠️ PDF page {index + 1} timed out, skipping it")
+        return not stuck
+    finally:
+        if stuck:
+            _retire_pdf_pool(pool)
+
+
+def parse_pdf_result(file) -> Tuple[str, bool]:
+    """Extract text from a PDF file; also returns False if pages were lost to a timeout"""
+    try:
+        pages = iter_pdf_pages(file)
+        parts = []
+        while True:
+            try:
+                parts.append(next(pages) + "\n")
+            except StopIteration as done:
+                return "".join(parts), bool(done.value)
+    except Exception as e:
+        return f"Error parsing PDF: {str(e)}", False
+
 
 def parse_pdf(file) -> str:
     """Extract text from a PDF file."""
+    return parse_pdf_result(file)[0]
+
+
+def parse_pdf_inline(path: str, max_pages: int = PDF_MAX_PAGES) -> str:
+    """Extract PDF text in the calling process (for callers that are already worker processes)"""
     try:
-        pdf_reader = PyPDF2.PdfReader(file)
-        text = ""
-        for page in pdf_reader.pages:
-            text += page.extract_text() + "\n"
-        return text
+        with open_mapped(path) as view:
+            reader = PyPDF2.PdfReader(view)
+            return "".join((page.extract_text() or "") + "\n" for page in reader.pages[:max_pages])
     except Exception as e:
         return f"Error parsing PDF: {str(e)}"
 
+
+def iter_docx_text(file) -> Iterator[str]:
+    """
+    Stream text out of a DOCX file in document order: one item per
+    paragraph, and one per table row with its cells joined by " | ".
+
+    Reads word/document.xml straight from the zip with an incremental
+    parser and discards each block once it is emitted, so memory stays
+    bounded by the largest paragraph or table row.
+    """
+    with zipfile.ZipFile(file) as archive, archive.open("word/document.xml") as xml:
+        paragraphs: List[List[str]] = []  # nested for text boxes inside paragraphs
+        cells: List[List[str]] = []
+        rows: List[List[str]] = []
+        body = None
+        runs = 0  # w:tab outside a run is a tab-stop definition (w:pPr/w:tabs), not text
+        for event, elem in ET.iterparse(xml, events=("start", "end")):
+            tag = elem.tag
+            if event == "start":
+                if tag == W_R:
+                    runs += 1
+                elif tag == W_P:
+                    paragraphs.append([])
+                elif tag == W_TC:
+                    cells.append([])
+                elif tag == W_TR:
+                    rows.append([])
+                elif tag == W_BODY:
+                    body = elem
+                continue
+
+            if tag == W_T:
+                if paragraphs:
+                    paragraphs[-1].append(elem.text or "")
+            elif tag == W_R:
+                runs -= 1
+            elif tag == W_TAB:
+                if paragraphs and runs:
+                    paragraphs[-1].append("\t")
+            elif tag in (W_BR, W_CR):
+                if paragraphs:
+                    paragraphs[-1].append("\n")
+            elif tag == W_P:
+                text = "".join(paragraphs.pop())
+                if cells:
+                    if text.strip():
+                        cells[-1].append(text.strip())
+                else:
+                    yield text
+            elif tag == W_TC:
+                cell = " ".join(cells.pop())
+                if rows:
+                    rows[-1].append(cell)
+            elif tag == W_TR:
+                row = " | ".join(c for c in rows.pop() if c)
+                if row:
+                    if cells:  # nested table
+                        cells[-1].append(row)
+                    else:
+                        yield row
+
+            # Drop finished top-level blocks so the tree never grows
+            if tag in (W_P, W_TBL) and body is not None and not paragraphs and not cells:
+                body.clear()
+
+
 def parse_docx(file) -> str:
-    """Extract text from a DOCX file."""
+    """Extract text (paragraphs and tables) from a DOCX file."""
     try:
-        doc = docx.Document(file)
-        text = ""
-        for para in doc.paragraphs:
-            text += para.text + "\n"
-        return text
+        return "".join(line + "\n" for line in iter_docx_text(file))
     except Exception as e:
         return f"Error parsing DOCX: {str(e)}"
 
-def parse_resume(uploaded_file) -> str:
+def parse_resume_result(uploaded_file) -> Tuple[str, bool]:
     """
-    Parse uploaded resume file (PDF or DOCX) and return text content.
+    parse_resume() plus whether the text is complete: False when PDF pages
+    were skipped after a timeout, so the text must not be cached.
     """
     if uploaded_file is None:
-        return ""
+        return "", True
     
+    check_upload_size(uploaded_file)
     file_type = uploaded_file.name.split('.')[-1].lower()
     
     if file_type == 'pdf':
-        return parse_pdf(uploaded_file)
+        return parse_pdf_result(uploaded_file)
     elif file_type in ['docx', 'doc']:
-        return parse_docx(uploaded_file)
+        return parse_docx(uploaded_file), True
     else:
         # Fallback for text files
         try:
-            stringio = io.StringIO(uploaded_file.getvalue().decode("utf-8"))
-            return stringio.read()
+            return decode_text(uploaded_file), True
         except Exception as e:
-            return f"Error parsing file: {str(e)}"
+            return f"Error parsing file: {str(e)}", False
+
+
+def parse_resume(uploaded_file) -> str:
+    """
+    Parse uploaded resume file (PDF or DOCX) and return text content.
+    Raises UploadTooLarge before any parsing if the file is over MAX_UPLOAD_BYTES.
+    """
+    return parse_resume_result(uploaded_file)[0]
+
+
+def parse_resume_path(path: str) -> str:
+    """parse_resume() for a file on disk, without the PDF worker pool"""
+    size = os.path.getsize(path)
+    if size > MAX_UPLOAD_BYTES:
+        raise UploadTooLarge(size, MAX_UPLOAD_BYTES)
+    file_type = path.split('.')[-1].lower()
+    if file_type == 'pdf':
+        return parse_pdf_inline(path)
+    elif file_type in ['docx', 'doc']:
+        return parse_docx(path)
+    try:
+        with open(path, "rb") as f:
+            return decode_text(f)
+    except Exception as e:
+        return f"Error parsing file: {str(e)}"
@@ -1,14 +1,94 @@
+from typing import Dict, List, Optional
+
 from config import SKILL_CATEGORIES
+from keyword_matcher import AhoCorasick
 
-def map_skills_to_category(detected_skills: list[str]) -> str:
-    scores = {cat: 0 for cat in SKILL_CATEGORIES}
+DEFAULT_CATEGORY = "backend"
+
+
+class SkillMatcher:
+    """SKILL_CATEGORIES compiled into one word-bounded automaton.
+
+    keywords keep config order (first spelling wins for case-insensitive
+    duplicates) and keyword_categories is the keyword -> categories inverted
+    index, so a text is scanned once no matter how many categories exist.
+    """
+
+    def __init__(self, skill_categories: Dict[str, List[str]] = SKILL_CATEGORIES):
+        self.categories = list(skill_categories)
+        self.keywords: List[str] = []
+        self.keyword_categories: List[List[str]] = []
+
+        index = {}
+        for category, keywords in skill_categories.items():
+            for keyword in keywords:
+                keyword = keyword.strip()
+                key = keyword.lower()
+                if key not in index:
+                    index[key] = len(self.keywords)
+                    self.keywords.append(keyword)
+                    self.keyword_categories.append([])
+                categories = self.keyword_categories[index[key]]
+                if category not in categories:
+                    categories.append(category)
+
+        # Pattern ids line up with self.keywords (same order, same dedupe)
+        self.automaton = AhoCorasick(self.keywords, word_boundary=True)
+        self._category_rank = {category: i for i, category in enumerate(self.categories)}
+        self._keyword_index = index
+        # A known keyword's category votes, precomputed (it may contain other keywords)
+        self._keyword_votes = [self._votes(keyword) for keyword in self.keywords]
+
+    def find_ids(self, text: str) -> List[int]:
+        """Ids of keywords present in text, in config order"""
+        return sorted(self.automaton.find(text or ""))
+
+    def find_skills(self, text: str) -> List[str]:
+        """Keywords present in text, in config order"""
+        return [self.keywords[i] for i in self.find_ids(text)]
 
-    for skill in detected_skills:
-        s = skill.lower()
-        for cat, keywords in SKILL_CATEGORIES.items():
-            for k in keywords:
-                if k.lower() in s:
-                    scores[cat] += 1
+    def _votes(self, skill: str) -> Dict[str, int]:
+        votes: Dict[str, int] = {}
+        for keyword_id in self.automaton.find(skill):
+            for category in self.keyword_categories[keyword_id]:
+                votes[category] = votes.get(category, 0) + 1
+        return votes
 
-    best = max(scores, key=scores.get)
-    return best if scores[best] > 0 else "backend"
+    def category_scores(self, skills: List[str]) -> Dict[str, int]:
+        """Per-category count of keywords contained in each detected skill"""
+        scores = {category: 0 for category in self.categories}
+        for skill in skills:
+            keyword_id = self._keyword_index.get(skill.strip().lower())
+            votes = self._keyword_votes[keyword_id] if keyword_id is not None else self._votes(skill)
+            for category, count in votes.items():
+                scores[category] += count
+        return scores
+
+    def map_to_category(self, skills: List[str], default: str = DEFAULT_CATEGORY) -> str:
+        """Best-scoring category for a list of skills (ties go to config order)"""
+        scores = self.category_scores(skills)
+        best = max(scores, key=scores.get) if scores else default
+        return best if scores.get(best, 0) > 0 else default
+
+    def first_category(self, text: str) -> Optional[str]:
+        """First category in config order with any keyword in text"""
+        ranks = [
+            self._category_rank[self.keyword_categories[i][0]]
+            for i in self.automaton.find(text or "")
+        ]
+        return self.categories[min(ranks)] if ranks else None
+
+
+_matcher: Optional[SkillMatcher] = None
+
+
+def get_skill_matcher() -> SkillMatcher:
+    """Return the matcher compiled from config.SKILL_CATEGORIES"""
+    global _matcher
+    if _matcher is None:
+        _matcher = SkillMatcher()
+    return _matcher
+
+
+def map_skills_to_category(detected_skills: list[str]) -> str:
+    return get_skill_matcher().map_to_category(detected_skills)
@@ -1,19 +1,15 @@
 # for testing purposes
 
-import openai
-from config import OPENROUTER_API_KEY, OPENROUTER_BASE_URL
-
-openai.api_key = OPENROUTER_API_KEY
-openai.api_base = OPENROUTER_BASE_URL
+from llm_client import get_llm_client
 
 try:
     print("Testing OpenRouter connection...")
-    response = openai.ChatCompletion.create(
+    response = get_llm_client().chat(
         model="xiaomi/mimo-v2-flash:free",
         messages=[{"role": "user", "content": "explain what is a react hook ?"}],
         max_tokens=10
     )
     print("✅ Connection successful!")
-    print(f"Response: {response.choices[0].message.content}") # type: ignore
+    print(f"Response: {response}")
 except Exception as e:
     print(f"❌ Connection failed: {e}")
\ No newline at end of file
@@ -0,0 +1,198 @@
+# token_budget.py
+import re
+from typing import Dict, List, Tuple
+
+from config import INTRO_INPUT_TOKENS, ANSWER_INPUT_TOKENS, OUTPUT_TOKENS, RESUME_CHUNK_TOKENS, RESUME_MAX_CHUNKS
+
+CHARS_PER_TOKEN = 4
+
+# Resume headings -> canonical section
+SECTION_ALIASES = {
+    "skills": ["skills", "technical skills", "key skills", "core competencies", "competencies",
+               "technologies", "tech stack", "tools", "skill set", "skillset", "tools & technologies"],
+    "experience": ["experience", "work experience", "professional experience", "employment",
+                   "employment history", "work history", "career history", "internship", "internships"],
+    "projects": ["projects", "key projects", "personal projects", "academic projects"],
+    "summary": ["summary", "professional summary", "profile", "objective", "career objective", "about me"],
+    "certifications": ["certifications", "certificates", "licenses", "courses", "trainings"],
+    "achievements": ["achievements", "awards", "accomplishments"],
+    "education": ["education", "academic background", "qualifications", "academics"],
+    "drop": ["hobbies", "interests", "references", "declaration", "personal details",
+             "personal information", "languages known", "extra curricular activities"],
+}
+# Sections kept first when the resume is over budget
+SECTION_PRIORITY = ["skills", "experience", "projects", "summary", "certifications", "achievements",
+                    "education", "other"]
+
+_HEADINGS = {alias: section for section, aliases in SECTION_ALIASES.items() for alias in aliases}
+
+# Lines dropped entirely
+BOILERPLATE_PATTERNS = [
+    r"references? (are )?available (up)?on request",
+    r"^(curriculum vitae|resume|cv)$",
+    r"^page \d+( of \d+)?$",
+    r"i hereby declare",
+    r"^(date|place)\s*:",
+]
+# Contact details stripped out of a line (the rest of the line is kept)
+CONTACT_PATTERNS = [
+    r"[\w.+-]+@[\w-]+\.[\w.]+",  # email
+    r"(?:https?://)?(?:www\.)?(?:linkedin|github)\.com/\S*",
+    r"\+?\d{0,3}[\s.-]?\(?\d{3}\)?[\s.-]?\d{3}[\s.-]?\d{4}\b",  # 3-3-4 phone numbers
+    r"\+\d{1,3}[\s-]?\d{5}[\s-]?\d{5}\b",  # 5-5 phone numbers
+]
+_BOILERPLATE = re.compile("|".join(f"(?:{p})" for p in BOILERPLATE_PATTERNS), re.IGNORECASE)
+_CONTACT = re.compile("|".join(f"(?:{p})" for p in CONTACT_PATTERNS), re.IGNORECASE)
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (~4 characters per token, the ratio Llama/GPT tokenizers give for English)"""
+    if not text:
+        return 0
+    return max(1, (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN)
+
+
+def estimate_messages_tokens(messages: List[Dict]) -> int:
+    return sum(estimate_tokens(str(m.get("content", ""))) + 4 for m in messages)
+
+
+def output_budget(reply_format: str) -> int:
+    """max_tokens sized to the expected reply format"""
+    return OUTPUT_TOKENS.get(reply_format, 250)
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """Cut text to the budget, backing off to a sentence or word boundary"""
+    limit = max_tokens * CHARS_PER_TOKEN
+    if len(text) <= limit:
+        return text
+    cut = text[:limit]
+    for boundary in ("\n", ". ", " "):
+        index = cut.rfind(boundary)
+        if index >= limit * 0.8:
+            return cut[:index + (1 if boundary == ". " else 0)].rstrip()
+    return cut
+
+
+def _normalize_lines(text: str) -> List[str]:
+    """Collapse whitespace, drop empty, boilerplate and repeated lines (e.g. PDF page headers)"""
+    lines = []
+    seen = set()
+    for raw in (text or "").splitlines():
+        line = re.sub(r"\s+", " ", _CONTACT.sub(" ", raw)).strip(" \t•·-*|,;")
+        if not line or _BOILERPLATE.search(line):
+            continue
+        key = line.lower()
+        if key in seen:
+            continue
+        seen.add(key)
+        lines.append(line)
+    return lines
+
+
+def _heading(line: str) -> str:
+    """Canonical section name if the line is a resume heading, else ''"""
+    if len(line.split()) > 5:
+        return ""
+    return _HEADINGS.get(line.lower().rstrip(":").strip(), "")
+
+
+def split_sections(text: str) -> List[Tuple[str, List[str]]]:
+    """[(section, lines)] in document order; text before the first heading is 'other'"""
+    sections: List[Tuple[str, List[str]]] = [("other", [])]
+    for line in _normalize_lines(text):
+        section = _heading(line)
+        if section:
+            sections.append((section, [line]))
+        else:
+            sections[-1][1].append(line)
+    return [(name, lines) for name, lines in sections if lines and name != "drop"]
+
+
+def resume_tokens(text: str) -> int:
+    """Tokens a resume needs once contact details and boilerplate are dropped"""
+    return estimate_tokens("\n".join(line for _, lines in split_sections(text) for line in lines))
+
+
+def condense_resume(text: str, max_tokens: int = INTRO_INPUT_TOKENS) -> str:
+    """
+    Fit a resume or introduction into `max_tokens`, keeping skills and
+    experience first and dropping contact details, boilerplate and
+    personal sections.
+    """
+    sections = split_sections(text)
+    full = "\n".join(line for _, lines in sections for line in lines)
+    if estimate_tokens(full) <= max_tokens:
+        return full
+
+    rank = {name: i for i, name in enumerate(SECTION_PRIORITY)}
+    order = sorted(range(len(sections)), key=lambda i: (rank.get(sections[i][0], len(rank)), i))
+
+    remaining = max_tokens
+    kept: Dict[int, str] = {}
+    for i in order:
+        body = "\n".join(sections[i][1])
+        cost = estimate_tokens(body) + 1
+        if cost <= remaining:
+            kept[i] = body
+            remaining -= cost
+        elif remaining > 30:
+            kept[i] = truncate_to_tokens(body, remaining)
+            break
+        else:
+            break
+
+    # Emit in document order so headings stay next to their content
+    return "\n".join(kept[i] for i in sorted(kept))
+
+
+def _split_long_line(line: str, max_tokens: int) -> List[str]:
+    pieces = []
+    while estimate_tokens(line) > max_tokens:
+        piece = truncate_to_tokens(line, max_tokens)
+        pieces.append(piece)
+        line = line[len(piece):].strip()
+    if line:
+        pieces.append(line)
+    return pieces
+
+
+def chunk_resume(text: str, max_tokens: int = RESUME_CHUNK_TOKENS,
+                 max_chunks: int = RESUME_MAX_CHUNKS) -> List[str]:
+    """
+    Split a resume into chunks of at most `max_tokens`, packed in document
+    order along line boundaries. When there are more than `max_chunks`, the
+    chunks holding the highest-priority sections are kept.
+    """
+    rank = {name: i for i, name in enumerate(SECTION_PRIORITY)}
+    chunks: List[Tuple[int, List[str]]] = []  # (best section rank, lines)
+    used = max_tokens
+    for name, lines in split_sections(text):
+        for line in lines:
+            for piece in _split_long_line(line, max_tokens):
+                cost = estimate_tokens(piece) + 1
+                if used + cost > max_tokens:
+                    chunks.append((len(rank), []))
+                    used = 0
+                best, chunk_lines = chunks[-1]
+                chunk_lines.append(piece)
+                chunks[-1] = (min(best, rank.get(name, len(rank))), chunk_lines)
+                used += cost
+
+    if len(chunks) > max_chunks:
+        print(f"⚠️ Resume needs {len(chunks)} chunks, analyzing the {max_chunks} with the highest-priority sections")
+        keep = sorted(sorted(range(len(chunks)), key=lambda i: (chunks[i][0], i))[:max_chunks])
+        chunks = [chunks[i] for i in keep]
+    return ["\n".join(lines) for _, lines in chunks]
+
+
+def cap_answer(text: str, max_tokens: int = ANSWER_INPUT_TOKENS) -> str:
+    """Normalize whitespace and cap an answer, keeping its opening and its conclusion"""
+    text = re.sub(r"\s+", " ", text or "").strip()
+    if estimate_tokens(text) <= max_tokens:
+        return text
+    head = truncate_to_tokens(text, int(max_tokens * 0.75))
+    tail_chars = int(max_tokens * 0.25) * CHARS_PER_TOKEN
+    tail = text[-tail_chars:]
+    tail = tail[tail.find(" ") + 1:] if " " in tail else tail
+    return f"{head} [...] {tail}"
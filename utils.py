@@ -1,6 +1,9 @@
 import re
-from typing import Dict, List, Tuple
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Tuple
 from colorama import Fore, Style, init
+from answer_features import extract_answer_features, TECHNICAL_CONTENT_GROUPS
 
 # Initialize colorama
 init(autoreset=True)
@@ -12,30 +15,12 @@ def format_response(text: str, color: str = Fore.WHITE) -> str:
 def extract_skills(text: str) -> List[str]:
     """Extract technical skills from text using config (Dynamic)"""
     try:
-        from config import SKILL_CATEGORIES
+        from skill_mapper import get_skill_matcher
     except ImportError:
         return []
 
-    found_skills = []
-    text_lower = text.lower()
-    
-    # Iterate through all categories in config
-    for category, keywords in SKILL_CATEGORIES.items():
-        for keyword in keywords:
-            # Check for keyword in text (case insensitive)
-            if keyword.lower() in text_lower:
-                found_skills.append(keyword)
-    
-    # Remove duplicates while preserving order
-    unique_skills = []
-    seen = set()
-    for skill in found_skills:
-        skill_clean = skill.strip()
-        if skill_clean.lower() not in seen:
-            seen.add(skill_clean.lower())
-            unique_skills.append(skill_clean)
-            
-    return unique_skills
+    # One pass over the text; keywords come back deduplicated in config order
+    return get_skill_matcher().find_skills(text)
 
 def calculate_performance_score(responses: List[Dict]) -> float:
     """Calculate candidate performance score"""
@@ -96,23 +81,7 @@ def calculate_detailed_score(responses: List[Dict]) -> Dict:
 
 def analyze_response_quality(response_text: str) -> Dict:
     """Analyze response quality metrics"""
-    words = response_text.split()
-    word_count = len(words)
-    
-    # Calculate various metrics
-    metrics = {
-        "word_count": word_count,
-        "has_technical_terms": any(term in response_text.lower() for term in 
-                                   ["api", "database", "system", "design", "algorithm", "architecture"]),
-        "has_examples": any(indicator in response_text.lower() for indicator in 
-                           ["for example", "for instance", "such as", "like"]),
-        "has_explanation": any(indicator in response_text for indicator in 
-                              ["because", "therefore", "thus", "so", "since"]),
-        "sentence_count": len([s for s in response_text.split('.') if s.strip()]),
-        "avg_sentence_length": word_count / max(1, len([s for s in response_text.split('.') if s.strip()]))
-    }
-    
-    return metrics
+    return extract_answer_features(response_text).quality_metrics()
 
 def get_performance_feedback(avg_score: float, detailed_scores: Dict) -> str:
     """Generate performance feedback based on scores"""
@@ -137,18 +106,11 @@ def format_score_bar(score: float, max_score: float = 10) -> str:
 
 def analyze_technical_content(answer: str) -> Dict:
     """Analyze technical content of an answer"""
-    technical_indicators = {
-        "architecture_terms": ["microservices", "monolithic", "scalable", "distributed", "load balancing"],
-        "coding_terms": ["algorithm", "data structure", "time complexity", "space complexity", "optimization"],
-        "system_design": ["database", "cache", "API", "endpoint", "protocol", "authentication"],
-        "problem_solving": ["approach", "solution", "alternative", "trade-off", "consideration"]
-    }
+    features = extract_answer_features(answer)
     
     result = {}
-    answer_lower = answer.lower()
-    
-    for category, terms in technical_indicators.items():
-        found_terms = [term for term in terms if term in answer_lower]
+    for category in TECHNICAL_CONTENT_GROUPS:
+        found_terms = list(features.terms(category))
         result[category] = {
             "count": len(found_terms),
             "terms": found_terms
@@ -174,11 +136,10 @@ def generate_strengths_analysis(responses: List[Dict]) -> List[str]:
         strengths.append("Communicates technical concepts clearly")
     
     # Check for examples
-    responses_with_examples = 0
-    for response in responses:
-        answer = response.get('answer', '')
-        if any(indicator in answer.lower() for indicator in ['for example', 'for instance', 'in my project', 'i implemented']):
-            responses_with_examples += 1
+    responses_with_examples = sum(
+        1 for response in responses
+        if extract_answer_features(response.get('answer', '')).has("real_world_examples")
+    )
     
     if responses_with_examples >= len(responses) * 0.3:
         strengths.append("Effectively uses real-world examples")
@@ -248,4 +209,60 @@ def calculate_recommendation(avg_score: float, responses: List[Dict]) -> str:
     elif avg_score >= 5.0:
         return "RECONSIDER AFTER IMPROVEMENT - Needs work on core technical areas"
     else:
-        return "REJECT - Does not meet minimum technical requirements"
\ No newline at end of file
+        return "REJECT - Does not meet minimum technical requirements"
+
+
+class ByteLRUCache:
+    """Thread-safe LRU cache bounded by the total size of its values in bytes"""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._data = OrderedDict()  # key -> (value, size)
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.evictions = 0
+
+    def get(self, key, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            self._data.move_to_end(key)
+            return entry[0]
+
+    def put(self, key, value: Any, size: int):
+        """Insert a value; entries larger than the whole budget are not kept"""
+        with self._lock:
+            if key in self._data:
+                self._bytes -= self._data.pop(key)[1]
+            if size > self.max_bytes:
+                return
+            self._data[key] = (value, size)
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                _, (_, evicted_size) = self._data.popitem(last=False)
+                self._bytes -= evicted_size
+                self.evictions += 1
+
+    def pop(self, key, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._data.pop(key, None)
+            if entry is None:
+                return default
+            self._bytes -= entry[1]
+            return entry[0]
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self._bytes = 0
+
+    @property
+    def size_bytes(self) -> int:
+        return self._bytes
+
+    def __contains__(self, key) -> bool:
+        return key in self._data
+
+    def __len__(self) -> int:
+        return len(self._data)